@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find where plugins in this package save data between runs.
+
+Attributes:
+    CACHE_DIRECTORY_VARIABLE (str):
+        The environment variable which, if defined, overrides the
+        default folder where data is saved.
+
+"""
+
+import os
+
+CACHE_DIRECTORY_VARIABLE = "REZ_BATCH_PLUGINS_CACHE_DIRECTORY"
+
+
+def get_directory():
+    """str: The folder where data is saved, if the user doesn't choose one."""
+    directory = os.getenv(CACHE_DIRECTORY_VARIABLE, "")
+
+    if directory:
+        return directory
+
+    root = os.getenv("XDG_CACHE_HOME", "") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+
+    return os.path.join(root, "rez_batch_plugins")
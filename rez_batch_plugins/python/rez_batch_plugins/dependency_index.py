@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find the Rez package families which depend on another family, quickly.
+
+:func:`rez.package_search.get_reverse_dependency_tree` loads the latest
+package of every family each time that it's called. This module does
+that once, saves the requirements of every family to disk, and only
+re-loads families whose folder changed since the last time.
+
+"""
+
+import collections
+import json
+import logging
+import os
+import tempfile
+
+from rez import exceptions as rez_exceptions
+from rez import packages_
+from rez.config import config
+from rez.vendor.version import version as version_
+from rez_utilities import rez_configuration
+
+from . import caching
+
+_FILE_NAME = "reverse_dependencies.json"
+_FORMAT_VERSION = 1  # Increase this value whenever saved data is no longer valid
+_LOGGER = logging.getLogger(__name__)
+
+
+class ReverseDependencyIndex(object):
+    """Every Rez package family and the families which depend on it."""
+
+    def __init__(self, entries):
+        """Find the dependents of every family.
+
+        Args:
+            entries (dict[str, dict[str, object]]):
+                Each family name and the requirements of its latest Rez package.
+
+        """
+        super(ReverseDependencyIndex, self).__init__()
+
+        self._families = frozenset(entries)
+        self._dependents = collections.defaultdict(dict)
+
+        for family, entry in entries.items():
+            for name, range_ in entry["requires"]:
+                self._dependents[name].setdefault(family, set()).add(range_)
+
+    def get_dependents(self, name):
+        """Find every family whose latest Rez package requires `name`.
+
+        Args:
+            name (str): A Rez package family. e.g. "rez_utilities".
+
+        Returns:
+            dict[str, set[str]]:
+                Each dependent family and the version ranges of `name`
+                which it requests. e.g. {"rez_lint": {"2+<3"}}.
+
+        """
+        return {
+            family: set(ranges)
+            for family, ranges in self._dependents.get(name, dict()).items()
+        }
+
+    def get_families(self):
+        """frozenset[str]: Every Rez package family which was found."""
+        return self._families
+
+
+def _get_latest_entry(name, path):
+    """Get the version and requirements of the latest Rez package in one family.
+
+    Args:
+        name (str): The Rez package family to load. e.g. "rez_lint".
+        path (str): The absolute folder on-disk which contains the family.
+
+    Returns:
+        dict[str, object]:
+            The found data. If the family has no valid Rez package,
+            its version is None.
+
+    """
+    try:
+        packages = list(packages_.iter_packages(name, paths=[path]))
+    except rez_exceptions.RezError:
+        _LOGGER.warning('Family "%s" in "%s" could not be loaded.', name, path)
+        packages = []
+
+    if not packages:
+        # Broken families are saved too, so they aren't re-loaded every run
+        return {"version": None, "requires": []}
+
+    package = max(packages, key=lambda package: package.version)
+    requires = set()
+
+    for variant in package.iter_variants():
+        for requirement in variant.get_requires():
+            if not requirement.conflict:
+                requires.add((requirement.name, str(requirement.range)))
+
+    return {"version": str(package.version), "requires": sorted(requires)}
+
+
+def _get_signature(directory):
+    """Describe a family folder so any added, replaced, or edited package changes it.
+
+    Args:
+        directory (str): The absolute path to a Rez package family folder.
+
+    Returns:
+        list[list[str, float]] or NoneType:
+            The modification time of the folder, each of its children,
+            and each version's package definition file. If `directory`
+            isn't a folder, return None.
+
+    """
+    try:
+        names = sorted(os.listdir(directory))
+        output = [["", os.path.getmtime(directory)]]
+
+        for name in names:
+            path = os.path.join(directory, name)
+            output.append([name, os.path.getmtime(path)])
+
+            if not os.path.isdir(path):
+                continue
+
+            for definition in sorted(rez_configuration.REZ_PACKAGE_NAMES):
+                definition_path = os.path.join(path, definition)
+
+                if os.path.isfile(definition_path):
+                    output.append(
+                        [
+                            os.path.join(name, definition),
+                            os.path.getmtime(definition_path),
+                        ]
+                    )
+    except OSError:
+        return None
+
+    return output
+
+
+def _read(path):
+    """dict[str, dict[str, dict]]: Get every saved family, grouped by packages path."""
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return dict()
+
+    if not isinstance(data, dict) or data.get("format") != _FORMAT_VERSION:
+        return dict()
+
+    return data.get("paths", dict())
+
+
+def _update_path(path, entries):
+    """Re-load every family in `path` whose folder changed.
+
+    Args:
+        path (str):
+            An absolute folder on-disk which contains Rez package families.
+        entries (dict[str, dict[str, object]]):
+            The saved data of each family from an earlier run, if any.
+
+    Returns:
+        tuple[dict[str, dict[str, object]], bool]:
+            The data of every family in `path` and if anything changed.
+
+    """
+    output = dict()
+    changed = False
+
+    for family in packages_.iter_package_families(paths=[path]):
+        signature = _get_signature(os.path.join(path, family.name))
+        entry = entries.get(family.name)
+
+        if signature is not None and entry and entry["signature"] == signature:
+            output[family.name] = entry
+
+            continue
+
+        changed = True
+        entry = _get_latest_entry(family.name, path)
+        entry["signature"] = signature
+        output[family.name] = entry
+
+    return output, changed or set(output) != set(entries)
+
+
+def _write(path, data):
+    """Save every family to disk, in one step, so other processes never read a partial file.
+
+    Args:
+        path (str): The absolute path to a JSON file which may not exist yet.
+        data (dict[str, dict[str, dict]]): Every family, grouped by packages path.
+
+    """
+    directory = os.path.dirname(path)
+
+    try:
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".json")
+
+        with os.fdopen(descriptor, "w") as handler:
+            json.dump({"format": _FORMAT_VERSION, "paths": data}, handler)
+
+        os.rename(temporary, path)
+    except (IOError, OSError) as error:
+        _LOGGER.warning('Index "%s" could not be saved. Error: "%s".', path, error)
+
+
+def get_default_path():
+    """str: The file where the index is saved, if the user doesn't choose one."""
+    return os.path.join(caching.get_directory(), _FILE_NAME)
+
+
+def load(paths=None, cache_path=""):
+    """Get every Rez package family and its dependents, updating the saved index.
+
+    Like :func:`rez.package_search.get_reverse_dependency_tree`, only the
+    latest version of each family is used, across every path, and the
+    requirements of all of its variants are included.
+
+    Args:
+        paths (iter[str], optional):
+            The directories to search for Rez package families,
+            Default: :attr:`rez.config.config.packages_path`.
+        cache_path (str, optional):
+            The JSON file where the index is saved between runs.
+            Default: :func:`get_default_path`.
+
+    Returns:
+        :class:`ReverseDependencyIndex`: The found families.
+
+    """
+    if paths is None:
+        paths = config.packages_path  # pylint: disable=no-member
+
+    cache_path = cache_path or get_default_path()
+    saved = _read(cache_path)
+    changed = False
+    latest = dict()
+
+    for path in paths:
+        entries, changed_ = _update_path(path, saved.get(path, dict()))
+        saved[path] = entries
+        changed = changed or changed_
+
+        for family, entry in entries.items():
+            if entry["version"] is None:
+                continue
+
+            version = version_.Version(entry["version"])
+
+            if family not in latest or version > latest[family][0]:
+                latest[family] = (version, entry)
+
+    if changed:
+        _write(cache_path, saved)
+
+    return ReverseDependencyIndex(
+        {family: entry for family, (_, entry) in latest.items()}
+    )
@@ -0,0 +1,205 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Remember the Python imports of every file, so files are only parsed once.
+
+Parsing a Python file with :func:`move_break.move_break_api.get_namespaces`
+is slow. :class:`ImportIndex` saves the imports of every parsed file to
+disk. A file is only parsed again if its contents change. If a file's
+size or modification time changed, its contents are hashed and, if the
+hash was seen before (e.g. the same file in a freshly-cloned
+repository), the saved imports are re-used.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from move_break import move_break_api
+
+from . import caching
+
+_FILE_NAME = "imports.json"
+_FORMAT_VERSION = 1  # Increase this value whenever saved data is no longer valid
+_LOGGER = logging.getLogger(__name__)
+
+
+class ImportIndex(object):
+    """The Python imports of files on-disk, saved between runs."""
+
+    def __init__(self, path=""):
+        """Load any saved imports.
+
+        Args:
+            path (str, optional):
+                The JSON file where imports are saved between runs.
+                Default: :func:`get_default_path`.
+
+        """
+        super(ImportIndex, self).__init__()
+
+        self._path = path or get_default_path()
+        self._files, self._namespaces = _read(self._path)
+        self._used = set()
+        self._changed = False
+
+    def get_namespaces(self, path):
+        """Get every dot-separated Python import of some file.
+
+        Args:
+            path (str): The absolute path to a Python file on-disk.
+
+        Returns:
+            frozenset[str]: The found imports. e.g. {"os", "os.path"}.
+
+        """
+        status = os.stat(path)
+        key = [status.st_size, status.st_mtime]
+        entry = self._files.get(path)
+        self._used.add(path)
+
+        if entry and entry[:2] == key and entry[2] in self._namespaces:
+            return frozenset(self._namespaces[entry[2]])
+
+        digest = _get_hash(path)
+        self._files[path] = key + [digest]
+        self._changed = True
+
+        if digest not in self._namespaces:
+            self._namespaces[digest] = sorted(move_break_api.get_namespaces(path))
+
+        return frozenset(self._namespaces[digest])
+
+    def has_namespaces(self, paths, namespaces):
+        """Check if any file imports any namespace, or anything inside of it.
+
+        Example:
+            >>> index = ImportIndex()
+            >>> # Assuming "/tmp/foo.py" contains "from foo.bar import thing"
+            >>> index.has_namespaces(["/tmp/foo.py"], {"foo.bar"})
+            True
+
+        Args:
+            paths (iter[str]): The absolute paths to Python files on-disk.
+            namespaces (iter[str]): Dot-separated Python namespaces to look for.
+
+        Returns:
+            bool: If any of `namespaces` were found.
+
+        """
+        namespaces = set(namespaces)
+
+        for path in paths:
+            for namespace in self.get_namespaces(path):
+                if any(prefix in namespaces for prefix in _iter_prefixes(namespace)):
+                    return True
+
+        return False
+
+    def save(self):
+        """Write every found import to disk, if anything changed.
+
+        Files which no longer exist and weren't used by this instance
+        are removed, along with their saved imports.
+
+        """
+        if not self._changed:
+            return
+
+        files = {
+            path: entry
+            for path, entry in self._files.items()
+            if path in self._used or os.path.isfile(path)
+        }
+        digests = {entry[2] for entry in files.values()}
+        namespaces = {
+            digest: namespaces_
+            for digest, namespaces_ in self._namespaces.items()
+            if digest in digests
+        }
+        directory = os.path.dirname(self._path)
+
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".json")
+
+            with os.fdopen(descriptor, "w") as handler:
+                json.dump(
+                    {
+                        "format": _FORMAT_VERSION,
+                        "files": files,
+                        "namespaces": namespaces,
+                    },
+                    handler,
+                )
+
+            # Renaming is atomic so other processes never read a partial file
+            os.rename(temporary, self._path)
+        except (IOError, OSError) as error:
+            _LOGGER.warning(
+                'Index "%s" could not be saved. Error: "%s".', self._path, error
+            )
+
+            return
+
+        self._changed = False
+
+
+def _get_hash(path):
+    """str: Get a unique hash for the contents of some file."""
+    with open(path, "rb") as handler:
+        return hashlib.sha1(handler.read()).hexdigest()
+
+
+def _iter_prefixes(namespace):
+    """Get `namespace` and every namespace which contains it.
+
+    Example:
+        >>> list(_iter_prefixes("foo.bar.thing"))
+        ["foo.bar.thing", "foo.bar", "foo"]
+
+    Args:
+        namespace (str): Some dot-separated Python namespace.
+
+    Yields:
+        str: Each found namespace, starting with the longest.
+
+    """
+    parts = namespace.split(".")
+
+    for index in reversed(range(1, len(parts) + 1)):
+        yield ".".join(parts[:index])
+
+
+def _read(path):
+    """Get every saved file and the imports of each hash.
+
+    Args:
+        path (str): The absolute path to a JSON file which may not exist yet.
+
+    Returns:
+        tuple[dict[str, list], dict[str, list[str]]]:
+            Each file path and its size, modification time, and hash,
+            followed by each hash and its imports.
+
+    """
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return dict(), dict()
+
+    if not isinstance(data, dict) or data.get("format") != _FORMAT_VERSION:
+        return dict(), dict()
+
+    return data.get("files", dict()), data.get("namespaces", dict())
+
+
+def get_default_path():
+    """str: The file where imports are saved, if the user doesn't choose one."""
+    return os.path.join(caching.get_directory(), _FILE_NAME)
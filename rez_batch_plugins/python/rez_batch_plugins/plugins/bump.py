@@ -12,14 +12,17 @@ import tempfile
 import textwrap
 
 from python_compatibility import wrapping
-from rez import (build_process_, build_system, package_search, package_test,
-                 serialise)
+from rez import build_process_, build_system
+from rez import exceptions as rez_exceptions
+from rez import package_test, serialise
 from rez.utils import filesystem, formatting
 from rez_batch_process.core import registry
-from rez_batch_process.core.plugins import command, conditional
+from rez_batch_process.core.plugins import command
 from rez_bump import rez_bump_api
 from rez_industry import api
-from rez_utilities import creator, finder
+from rez_utilities import creator, finder, inspection
+
+from .. import dependency_index
 
 _Configuration = collections.namedtuple(
     "_Configuration", "command token pull_request_name ssl_no_verify results"
@@ -227,26 +230,28 @@ def _get_packages_which_must_be_changed(paths=None):
             valid but must be skipped, for some reason.
 
     """
-    packages, invalids, skips = conditional.get_default_latest_packages(paths=paths)
+    # Every family is scanned once (or not at all, if it hasn't changed
+    # since the last run) no matter how many packages the user provides.
+    #
+    index = dependency_index.load(paths=paths)
     downstream = set()
 
     for package in _get_user_provided_packages():
-        downstream_package_names, _ = package_search.get_reverse_dependency_tree(
-            package_name=package.name, depth=1, paths=paths,
-        )
+        if package.name not in index.get_families():
+            raise rez_exceptions.PackageFamilyNotFoundError(
+                "No such package family {package.name!r}".format(package=package)
+            )
 
-        # According to the documenatation in
-        # :func:`rez.package_search.get_reverse_dependency_tree` The
-        # first list always contains `package` by itself. We don't need
-        # this so we discard it here and just get the "depth 1" packages.
-        #
-        downstream_package_names = downstream_package_names[1]
+        downstream.update(index.get_dependents(package.name))
 
-        downstream.update(downstream_package_names)
+    if not downstream:
+        return [], [], []
 
-    packages_to_change = [package for package in packages if package.name in downstream]
+    packages_to_change = list(
+        inspection.iter_latest_packages(paths=paths, packages=downstream)
+    )
 
-    return packages_to_change, invalids, skips
+    return packages_to_change, [], []
 
 
 def _get_parser():
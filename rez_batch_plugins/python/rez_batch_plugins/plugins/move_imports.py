@@ -16,7 +16,7 @@ from rez_batch_process.core.plugins import command, conditional
 from rez_move_imports import cli as rez_move_imports_cli
 from rez_utilities import finder, inspection
 
-from .. import repository_area
+from .. import import_index, repository_area
 
 
 class MoveImports(command.RezShellCommand):
@@ -170,7 +170,7 @@ class MoveImports(command.RezShellCommand):
         return ""
 
 
-def _needs_replacement(package, user_namespaces):
+def _needs_replacement(package, user_namespaces, index):
     """Figure out if the Rez package has Python files in it that :class:`MoveImports` can act upon.
 
     The logic goes like this:
@@ -190,7 +190,10 @@ def _needs_replacement(package, user_namespaces):
             Python dot-separated namespaces which a user is trying to
             replace. If any of the found namespaces match these then
             it means `package` must have at least one of its modules
-            replaced.
+            replaced. Imports of these namespaces' children also match.
+        index (:class:`.ImportIndex`):
+            The saved imports of every Python file, so files are only
+            parsed if they changed since the last run.
 
     Returns:
         bool:
@@ -201,15 +204,11 @@ def _needs_replacement(package, user_namespaces):
     root = finder.get_package_root(package)
     package = finder.get_nearest_rez_package(root)
 
-    namespaces = set()
+    paths = [
+        path for path in move_break_api.expand_paths(root) if path != package.filepath
+    ]
 
-    for path in move_break_api.expand_paths(root):
-        if path == package.filepath:
-            continue
-
-        namespaces.update(move_break_api.get_namespaces(path))
-
-    if namespaces.intersection(user_namespaces):
+    if index.has_namespaces(paths, user_namespaces):
         return True
 
     if not inspection.is_built_package(package):
@@ -220,7 +219,7 @@ def _needs_replacement(package, user_namespaces):
         repository.working_dir, package.name
     )
 
-    return _needs_replacement(repository_package, user_namespaces)
+    return _needs_replacement(repository_package, user_namespaces, index)
 
 
 def _get_user_provided_namespaces():
@@ -248,32 +247,37 @@ def _get_packages_which_must_be_changed(paths=None):
     packages, invalids, skips = conditional.get_default_latest_packages(paths=paths)
     user_provided_namespaces = _get_user_provided_namespaces()
     expected_existing_namespaces = {old for old, _ in user_provided_namespaces}
+    index = import_index.ImportIndex()
     output = []
 
-    for package in packages:
-        if not repository_area.is_definition(package, serialise.FileFormat.py):
-            skips.append(
-                worker.Skip(
-                    package,
-                    finder.get_package_root(package),
-                    "does not define a package.py file.",
+    try:
+        for package in packages:
+            if not repository_area.is_definition(package, serialise.FileFormat.py):
+                skips.append(
+                    worker.Skip(
+                        package,
+                        finder.get_package_root(package),
+                        "does not define a package.py file.",
+                    )
                 )
-            )
 
-            continue
+                continue
 
-        if not _needs_replacement(package, expected_existing_namespaces):
-            skips.append(
-                worker.Skip(
-                    package,
-                    finder.get_package_root(package),
-                    "No namespaces need to be replaced.",
+            if not _needs_replacement(package, expected_existing_namespaces, index):
+                skips.append(
+                    worker.Skip(
+                        package,
+                        finder.get_package_root(package),
+                        "No namespaces need to be replaced.",
+                    )
                 )
-            )
 
-            continue
+                continue
 
-        output.append(package)
+            output.append(package)
+    finally:
+        # Save what was parsed so far, even if something went wrong
+        index.save()
 
     return output, invalids, skips
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_plugins.dependency_index` finds dependents incrementally."""
+
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from rez import package_repository
+from rez_batch_plugins import dependency_index
+from six.moves import mock
+
+_LOADER = "rez_batch_plugins.dependency_index._get_latest_entry"
+
+
+class Load(unittest.TestCase):
+    """Build, save, and update the reverse-dependency index."""
+
+    def setUp(self):
+        """Create a packages path with a few released Rez package families."""
+        self._root = tempfile.mkdtemp(suffix="_dependency_index")
+        self.addCleanup(shutil.rmtree, self._root)
+
+        self._path = os.path.join(self._root, "packages")
+        self._cache = os.path.join(self._root, "cache", "index.json")
+
+        _make_package(self._path, "core", "1.0.0")
+        _make_package(self._path, "tool", "1.0.0", ["core-1"])
+        _make_package(self._path, "tool", "2.0.0", ["core-1.1+<2", "other"])
+        _make_package(self._path, "unrelated", "1.0.0")
+
+    def _load(self, paths=None):
+        """:class:`.ReverseDependencyIndex`: Get the index for the test packages."""
+        return dependency_index.load(
+            paths=paths or [self._path], cache_path=self._cache
+        )
+
+    def test_dependents(self):
+        """Find each dependent family, using only its latest version."""
+        index = self._load()
+
+        self.assertEqual({"core", "tool", "unrelated"}, set(index.get_families()))
+        self.assertEqual({"tool": {"1.1+<2"}}, index.get_dependents("core"))
+        self.assertEqual(dict(), index.get_dependents("unrelated"))
+
+    def test_unchanged(self):
+        """Don't load any Rez package if nothing changed since the last run."""
+        self._load()
+
+        with mock.patch(_LOADER) as loader:
+            index = self._load()
+
+        self.assertFalse(loader.called)
+        self.assertEqual({"tool": {"1.1+<2"}}, index.get_dependents("core"))
+
+    def test_new_version(self):
+        """Re-load only the family which was released again."""
+        self._load()
+        _make_package(self._path, "unrelated", "2.0.0", ["core-1"])
+        package_repository.package_repository_manager.clear_caches()  # A new run
+
+        with mock.patch(_LOADER, wraps=dependency_index._get_latest_entry) as loader:
+            index = self._load()
+
+        self.assertEqual([mock.call("unrelated", self._path)], loader.call_args_list)
+        self.assertEqual(
+            {"tool": {"1.1+<2"}, "unrelated": {"1"}}, index.get_dependents("core")
+        )
+
+    def test_edited_definition(self):
+        """Re-load a family whose latest package definition was edited in-place."""
+        self._load()
+        definition = os.path.join(self._path, "tool", "2.0.0", "package.py")
+
+        with open(definition, "a") as handler:
+            handler.write('requires = ["core-1.2+<2"]\n')
+
+        future = os.path.getmtime(definition) + 10
+        os.utime(definition, (future, future))
+        package_repository.package_repository_manager.clear_caches()  # A new run
+
+        with mock.patch(_LOADER, wraps=dependency_index._get_latest_entry) as loader:
+            index = self._load()
+
+        self.assertEqual([mock.call("tool", self._path)], loader.call_args_list)
+        self.assertEqual({"tool": {"1.2+<2"}}, index.get_dependents("core"))
+
+    def test_many_paths(self):
+        """Use the latest version of a family, even if it's in a later path."""
+        other = os.path.join(self._root, "other_packages")
+        _make_package(other, "tool", "3.0.0")
+
+        index = self._load(paths=[self._path, other])
+
+        self.assertEqual(dict(), index.get_dependents("core"))
+
+
+def _make_package(root, name, version, requires=None):
+    """Write a released Rez package into `root`.
+
+    Args:
+        root (str): The absolute path to a packages path folder.
+        name (str): The Rez package family name.
+        version (str): The version of the Rez package. e.g. "1.0.0".
+        requires (list[str], optional): The requirements of the Rez package.
+
+    """
+    directory = os.path.join(root, name, version)
+    os.makedirs(directory)
+
+    with open(os.path.join(directory, "package.py"), "w") as handler:
+        handler.write(
+            textwrap.dedent(
+                """\
+                name = "{name}"
+                version = "{version}"
+                requires = {requires!r}
+                """
+            ).format(name=name, version=version, requires=requires or [])
+        )
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_plugins.import_index` only parses changed files."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from move_break import move_break_api
+from rez_batch_plugins import import_index
+from six.moves import mock
+
+_PARSER = "move_break.move_break_api.get_namespaces"
+
+
+class ImportIndex(unittest.TestCase):
+    """Find and save the imports of Python files."""
+
+    def setUp(self):
+        """Create a Python file and an empty index location."""
+        self._root = tempfile.mkdtemp(suffix="_import_index")
+        self.addCleanup(shutil.rmtree, self._root)
+
+        self._cache = os.path.join(self._root, "cache", "imports.json")
+        self._file = self._write("module.py", "from foo.bar import thing\nimport os\n")
+
+    def _write(self, name, text):
+        """str: Write `text` to a file named `name` and return its path."""
+        path = os.path.join(self._root, name)
+
+        with open(path, "w") as handler:
+            handler.write(text)
+
+        return path
+
+    def test_prefix(self):
+        """Match imports of a namespace or anything inside of it."""
+        index = import_index.ImportIndex(self._cache)
+
+        self.assertTrue(index.has_namespaces([self._file], {"foo.bar"}))
+        self.assertTrue(index.has_namespaces([self._file], {"foo.bar.thing"}))
+        self.assertTrue(index.has_namespaces([self._file], {"os"}))
+        self.assertFalse(index.has_namespaces([self._file], {"foo.bar.thing.more"}))
+        self.assertFalse(index.has_namespaces([self._file], {"foo.ba"}))
+
+    def test_saved(self):
+        """Don't parse an unchanged file again, in a later run."""
+        index = import_index.ImportIndex(self._cache)
+        expected = index.get_namespaces(self._file)
+        index.save()
+
+        with mock.patch(_PARSER) as parser:
+            found = import_index.ImportIndex(self._cache).get_namespaces(self._file)
+
+        self.assertFalse(parser.called)
+        self.assertEqual(expected, found)
+
+    def test_same_contents(self):
+        """Don't parse a file whose contents were already parsed elsewhere."""
+        index = import_index.ImportIndex(self._cache)
+        index.get_namespaces(self._file)
+
+        with open(self._file, "r") as handler:
+            copy = self._write("copy.py", handler.read())
+
+        with mock.patch(_PARSER) as parser:
+            self.assertTrue(index.has_namespaces([copy], {"foo.bar"}))
+
+        self.assertFalse(parser.called)
+
+    def test_changed(self):
+        """Parse a file again once its contents change."""
+        index = import_index.ImportIndex(self._cache)
+        index.get_namespaces(self._file)
+        index.save()
+
+        self._write("module.py", "import something_else\n")
+
+        with mock.patch(_PARSER, wraps=move_break_api.get_namespaces) as parser:
+            index = import_index.ImportIndex(self._cache)
+
+            self.assertEqual({"something_else"}, index.get_namespaces(self._file))
+
+        self.assertEqual(1, parser.call_count)
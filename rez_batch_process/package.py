@@ -2,7 +2,7 @@
 
 name = "rez_batch_process"
 
-version = "1.4.0"
+version = "1.5.0"
 
 description = (
     "Check for Rez packages that need Sphinx documentation and automatically add it."
@@ -20,6 +20,7 @@ requires = [
     "backports.functools_lru_cache-1.6+<2",
     "github3.py-1.3+<2",
     "python-2.7",
+    "requests-2+<3",
     "rez-2.47+<3",
     "rez_python_compatibility-2+<3",
     "rez_utilities-2+<3",
@@ -9,6 +9,7 @@ import argparse
 import copy
 import fnmatch
 import functools
+import json
 import logging
 import operator
 import os
@@ -19,10 +20,17 @@ from python_compatibility import imports, wrapping
 from rez.config import config
 from rez_utilities import finder
 
-from .core import cli_constant, registry, worker
-from .core.gitter import github_user
+from .core import checkpoint, cli_constant, registry, rez_git, tracing, worker
+from .core.gitter import cloner, github_user, submission
 
 _LOGGER = logging.getLogger(__name__)
+# The base arguments which choose which Rez packages are run on
+_SELECTION_ARGUMENTS = (
+    "ignore_patterns",
+    "packages_path",
+    "rez_packages",
+    "search_packages_path",
+)
 
 
 def __gather_package_data(arguments):
@@ -76,6 +84,9 @@ def __report(arguments, _):
     - Packages that were skipped automatically
     - Packages that were ignored explicitly (by the user)
 
+    If `arguments` requests streaming, each package is printed as soon
+    as it is found, instead. See :func:`_stream_report` for details.
+
     Args:
         arguments (:class:`argparse.Namespace`):
             The base user-provided arguments from command-line.
@@ -83,6 +94,11 @@ def __report(arguments, _):
             An un-used argument for this function.
 
     """
+    if arguments.stream or arguments.format != "text":
+        _stream_report(arguments)
+
+        sys.exit(0)
+
     ignored_packages, other_packages, invalid_packages, skips = __gather_package_data(
         arguments
     )
@@ -94,6 +110,7 @@ def __report(arguments, _):
     )
 
     invalids.extend(invalid_packages)
+    _log_repository_statistics()
 
     _print_ignored(ignored_packages)
     print("\n")
@@ -116,22 +133,62 @@ def __run(arguments, command_arguments):  # pylint: disable=too-many-locals
             The registered command's parsed arguments.
 
     """
-    ignored_packages, other_packages, invalid_packages, skips = __gather_package_data(
-        arguments
-    )
+    # Phases are always recorded. It's cheap compared to git / GitHub calls
+    tracer = tracing.Tracer()
+
+    with tracing.activate(tracer), tracing.span("gather_packages"):
+        data = __gather_package_data(arguments)
+
+    ignored_packages, other_packages, invalid_packages, skips = data
 
     command = registry.get_command(arguments.command)
+    queue = submission.SubmissionQueue(jobs=arguments.pull_request_jobs)
+    journal = checkpoint.Journal(
+        checkpoint.get_default_path(
+            checkpoint.get_key(
+                arguments.command,
+                command_arguments,
+                selection={
+                    name: getattr(arguments, name) for name in _SELECTION_ARGUMENTS
+                },
+            )
+        )
+    )
 
-    packages, un_ran, invalids = worker.run(
-        functools.partial(command.run, arguments=command_arguments),
-        other_packages,
-        maximum_repositories=arguments.maximum_repositories,
-        maximum_rez_packages=arguments.maximum_rez_packages,
-        keep_temporary_files=arguments.keep_temporary_files,
-        temporary_directory=arguments.temporary_directory,
+    if not arguments.resume:
+        journal.clear()
+
+    _LOGGER.info(
+        'Progress is recorded in "%s". If this run is interrupted, '
+        "run the same command with --resume to continue where it left off.",
+        journal.get_path(),
     )
 
+    with tracing.activate(tracer):
+        try:
+            # Pull requests are submitted while the next Rez packages are modified
+            with checkpoint.activate(journal), submission.activate(queue):
+                packages, un_ran, invalids = worker.run(
+                    functools.partial(command.run, arguments=command_arguments),
+                    other_packages,
+                    maximum_repositories=arguments.maximum_repositories,
+                    maximum_rez_packages=arguments.maximum_rez_packages,
+                    keep_temporary_files=arguments.keep_temporary_files,
+                    temporary_directory=arguments.temporary_directory,
+                    jobs=arguments.jobs,
+                    cache_directory=arguments.cache_directory,
+                    cache_size=arguments.cache_size * 1024 * 1024,
+                    clone_mode=arguments.clone_mode,
+                )
+        finally:
+            with tracing.span("wait_for_pull_requests"):
+                summary = queue.join()
+
+            if arguments.trace:
+                _write_trace(tracer, arguments.trace)
+
     invalids.extend(invalid_packages)
+    _log_repository_statistics()
 
     # TODO : Change `Skip` into a class and make it the same interface as an exception
     # so that I can easily print both types at the same time, here
@@ -143,6 +200,8 @@ def __run(arguments, command_arguments):  # pylint: disable=too-many-locals
         print("\n")
         print(sorted(error.get_package().name for error in bads))
 
+    _print_submissions(summary)
+
     if un_ran:
         print("These packages could not be run on:")
 
@@ -176,6 +235,7 @@ def __make_git_users(arguments):
         base_url=arguments.base_url,
         verify=arguments.ssl_no_verify,
         maximum=arguments.maximum_users,
+        maximum_age=arguments.maximum_age,
     )
 
     print(
@@ -207,17 +267,105 @@ def _split_the_ignored_packages(packages, patterns):
     non_ignored = set()
 
     for package in packages:
-        for pattern in patterns:
-            if fnmatch.fnmatch(package.name, pattern):
-                ignored.add((package, pattern))
+        pattern = _get_matching_pattern(package, patterns)
 
-                break
+        if pattern:
+            ignored.add((package, pattern))
         else:
             non_ignored.add(package)
 
     return ignored, non_ignored
 
 
+def _get_matching_pattern(package, patterns):
+    """Find the first glob pattern that matches a Rez package's name.
+
+    Args:
+        package (:class:`rez.packages_.Package`): The Rez package to check.
+        patterns (iter[str]): Glob expressions, such as "foo_*".
+
+    Returns:
+        str: The found pattern, if any.
+
+    """
+    for pattern in patterns:
+        if fnmatch.fnmatch(package.name, pattern):
+            return pattern
+
+    return ""
+
+
+def _stream_report(arguments):
+    """Print every Rez package and its status, as soon as the package is found.
+
+    Unlike the default report, nothing is sorted or grouped. Rez
+    packages are found lazily and printed one row at a time, so the
+    first results appear before the search has finished. Once
+    `--maximum-repositories` or `--maximum-rez-packages` is reached,
+    no more Rez packages are queried.
+
+    Args:
+        arguments (:class:`argparse.Namespace`):
+            The base user-provided arguments from command-line.
+
+    """
+
+    def _iter_packages_to_report(packages):
+        for package in packages:
+            if rez_packages and package.name not in rez_packages:
+                _print_row(
+                    "skipped", package, "Not in --rez-packages", arguments.format
+                )
+
+                continue
+
+            pattern = _get_matching_pattern(package, ignore_patterns)
+
+            if pattern:
+                _print_row(
+                    "ignored",
+                    package,
+                    'Pattern: "{pattern}"'.format(pattern=pattern),
+                    arguments.format,
+                )
+
+                continue
+
+            yield package
+
+    ignore_patterns, packages_path, search_packages_path = _resolve_arguments(
+        arguments.ignore_patterns,
+        arguments.packages_path,
+        arguments.search_packages_path,
+    )
+    rez_packages = set(arguments.rez_packages)
+    package_finder = registry.get_package_finder(arguments.command)
+    packages, invalid_packages, skips = package_finder(
+        paths=packages_path + search_packages_path
+    )
+
+    for package, repository, error in worker.iter_report(
+        _iter_packages_to_report(packages),
+        maximum_repositories=arguments.maximum_repositories,
+        maximum_rez_packages=arguments.maximum_rez_packages,
+    ):
+        if error:
+            _print_row("invalid", package, str(error), arguments.format)
+        else:
+            _print_row("affected", package, "", arguments.format, repository=repository)
+
+    # Plugins may only know which Rez packages are invalid / skipped
+    # after every package has been iterated over, so these come last.
+    #
+    for error in invalid_packages:
+        _print_row("invalid", error.get_package(), str(error), arguments.format)
+
+    for issue in skips:
+        _print_row("skipped", issue.package, issue.reason, arguments.format)
+
+    _log_repository_statistics()
+
+
 def _resolve_arguments(patterns, packages_path, search_packages_path):
     """Convert user-provided data into glob expressions.
 
@@ -272,6 +420,43 @@ def _resolve_arguments(patterns, packages_path, search_packages_path):
     return ignore_patterns, packages_path, search_packages_path
 
 
+def _log_repository_statistics():
+    """Show how many git repository look-ups were cached, for debugging."""
+    _LOGGER.debug(
+        "Repository look-ups: %(hits)s cached, %(misses)s queried. "
+        "%(symlink_traces)s symlink searches took %(symlink_seconds).2f seconds.",
+        rez_git.get_statistics(),
+    )
+
+
+def _positive_integer(text):
+    """Convert some user-provided text into an integer that is at least 1.
+
+    Args:
+        text (str): Some text to convert. e.g. "4".
+
+    Raises:
+        :class:`argparse.ArgumentTypeError`: If `text` is not a positive integer.
+
+    Returns:
+        int: The converted number.
+
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            'Value "{text}" is not an integer.'.format(text=text)
+        )
+
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            'Value "{text}" must be 1 or greater.'.format(text=text)
+        )
+
+    return value
+
+
 def _get_package_name(item):
     """str: Sort a package / error pair by the name of each Rez package."""
     package = item[0]
@@ -279,6 +464,45 @@ def _get_package_name(item):
     return package.name
 
 
+def _print_row(status, package, message, output_format, repository=""):
+    """Print a single Rez package and its status, immediately.
+
+    Args:
+        status (str): The package's category. e.g. "affected", "ignored", "invalid".
+        package (:class:`rez.packages_.Package`): The Rez package to print.
+        message (str): Some extra explanation for `status`, if any.
+        output_format (str):
+            How to print the row. "text" prints a human-readable line.
+            "json-lines" prints one JSON object per-line.
+        repository (str, optional): The URL of the package's git repository, if known.
+
+    """
+    if output_format == "json-lines":
+        print(
+            json.dumps(
+                {
+                    "message": message,
+                    "name": package.name,
+                    "path": finder.get_package_root(package),
+                    "repository": repository,
+                    "status": status,
+                },
+                sort_keys=True,
+            )
+        )
+    elif message:
+        print(
+            "{status}: {package.name}: {message}".format(
+                status=status, package=package, message=message
+            )
+        )
+    else:
+        print("{status}: {package.name}".format(status=status, package=package))
+
+    # Flush so that the row is shown right away, even if stdout is piped
+    sys.stdout.flush()
+
+
 def _print_ignored(packages):
     """Print every package as "ignored".
 
@@ -405,6 +629,46 @@ def _print_skips(skips, verbose):
         print(template.format(issue=issue))
 
 
+def _write_trace(tracer, path):
+    """Save every recorded phase to disk and print how long each phase took.
+
+    Args:
+        tracer (:class:`.Tracer`): The object which recorded every phase.
+        path (str): The Chrome trace-event JSON file to write.
+
+    """
+    tracer.write(path)
+
+    print(tracing.get_table(tracer.get_totals()))
+    print('Trace was written to "{path}".'.format(path=path))
+
+
+def _print_submissions(summary):
+    """Print every pull request which was or wasn't submitted.
+
+    Args:
+        summary (:attr:`.submission.Summary`):
+            The name of every submitted pull request and the name and
+            error of every pull request which failed.
+
+    """
+    if summary.submitted:
+        print("These pull requests were submitted:")
+
+        for name in summary.submitted:
+            print(name)
+
+    if summary.failed:
+        print("These pull requests could not be submitted:")
+
+        for name, error in summary.failed:
+            print(
+                "{name}: {error}".format(
+                    name=name, error=str(error) or "No found error message"
+                )
+            )
+
+
 def _add_arguments(parser):
     """Add common arguments to the given command-line `parser`.
 
@@ -486,7 +750,17 @@ def _add_arguments(parser):
     parser.add_argument(
         "-t",
         "--temporary-directory",
-        help="A folder on-disk that will be used to clone git repositories.",
+        help="A folder on-disk that will be used to clone git repositories "
+        "and to create each Rez package's git worktree.",
+    )
+
+    parser.add_argument(
+        "--clone-mode",
+        choices=cloner.MODES,
+        default=cloner.FULL,
+        help='How much of each git repository to clone. "full" clones everything. '
+        '"shallow" clones only the latest commit. "sparse" clones only the latest '
+        "commit and checks out only the Rez packages that are processed.",
     )
 
 
@@ -588,10 +862,68 @@ def parse_arguments(text):
     reporter = sub_parsers.add_parser("report")
     reporter.set_defaults(execute=__report)
     _add_arguments(reporter)
+    reporter.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print each Rez package as soon as it is found instead of "
+        "waiting for every package to be found and sorted.",
+    )
+    reporter.add_argument(
+        "--format",
+        choices=("text", "json-lines"),
+        default="text",
+        help='How to print each Rez package. "json-lines" prints one JSON '
+        "object per-line and implies --stream.",
+    )
 
     runner = sub_parsers.add_parser("run")
     runner.set_defaults(execute=__run)
     _add_arguments(runner)
+    runner.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=_positive_integer,
+        help="The number of git repositories to process at the same time. "
+        "Each repository also modifies this many of its Rez packages at the "
+        "same time, so up to jobs * jobs Rez packages may run at once.",
+    )
+    runner.add_argument(
+        "--trace",
+        default="",
+        help="Write how long each phase took, per Rez package and repository, "
+        "to this Chrome trace-event JSON file (see chrome://tracing or "
+        "https://ui.perfetto.dev) and print a table of every phase.",
+    )
+    runner.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run of the same command and arguments. "
+        "Rez packages which it completed are skipped and branches which it "
+        "pushed are re-used.",
+    )
+    runner.add_argument(
+        "--pull-request-jobs",
+        default=2,
+        type=_positive_integer,
+        help="The most pull requests to submit to GitHub at the same time. "
+        "Pull requests are submitted in the background, while other Rez packages "
+        "are modified.",
+    )
+    runner.add_argument(
+        "--cache-directory",
+        default="",
+        help="A folder on-disk which keeps a copy of every git repository between runs. "
+        "Repositories in this folder are fetched instead of being re-cloned.",
+    )
+    runner.add_argument(
+        "--cache-size",
+        default=0,
+        type=int,
+        help="The maximum size of --cache-directory, in megabytes. Whenever "
+        "it grows larger, the least recently used repositories are deleted. "
+        "If 0, nothing is deleted.",
+    )
 
     git_users_command = sub_parsers.add_parser("make-git-users")
     git_users_command.set_defaults(execute=__make_git_users)
@@ -600,7 +932,9 @@ def parse_arguments(text):
         help="The authentication token to the remote git repository (GitHub, bitbucket, etc).",
     )
     git_users_command.add_argument(
-        "path", help="The found users will be written to this JSON file path."
+        "path",
+        help="The found users will be written to this JSON file path. "
+        "If it already has users, only new or changed users are downloaded.",
     )
     git_users_command.add_argument(
         "-m",
@@ -610,6 +944,13 @@ def parse_arguments(text):
         help="This integer represents that maximum number of users to query. "
         "Set this value low to avoid long wait times.",
     )
+    git_users_command.add_argument(
+        "--maximum-age",
+        default=0,
+        type=float,
+        help="Users which were saved less than this many seconds ago aren't "
+        "queried again. If 0, every user is checked for changes.",
+    )
     git_users_command.add_argument(
         "-b",
         "--base-url",
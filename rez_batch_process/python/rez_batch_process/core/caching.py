@@ -0,0 +1,15 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find where ``rez_batch_process`` saves data between runs."""
+
+import os
+
+
+def get_directory():
+    """str: The folder where data is saved, if the user doesn't choose one."""
+    root = os.getenv("XDG_CACHE_HOME", "") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+
+    return os.path.join(root, "rez_batch_process")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Record what happened to each Rez package so an interrupted run can be resumed.
+
+A :class:`Journal` is an append-only file with one JSON line per event.
+Every Rez package goes through these events, in order:
+
+- :attr:`STARTED`: The command is about to run on the Rez package.
+- :attr:`PUSHED`: A git branch with the package's changes was pushed.
+- :attr:`RAN` or :attr:`FAILED`: The command finished running.
+- :attr:`SUBMITTED`: The pull request of the pushed branch was made.
+  Pull requests may be submitted in the background, long after
+  the command finished. See :mod:`.submission`.
+
+A Rez package is complete once it :attr:`RAN` and its pushed branch,
+if any, was :attr:`SUBMITTED`. Each run writes to a separate file,
+named after the command and a hash of its arguments (see :func:`get_key`),
+so resuming a run never mixes up packages from a different command.
+
+"""
+
+import collections
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from . import caching
+
+FAILED = "failed"
+PUSHED = "pushed"
+RAN = "ran"
+STARTED = "started"
+SUBMITTED = "submitted"
+
+_ACTIVE_JOURNALS = []
+_IGNORED_ARGUMENTS = frozenset(("token",))  # Never save secrets to disk
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+_State = collections.namedtuple("_State", "ran branch needs_pull_request")
+
+
+class Journal(object):
+    """An append-only record of what happened to each Rez package during a run."""
+
+    def __init__(self, path):
+        """Read any events that an earlier run recorded.
+
+        Args:
+            path (str): The JSON lines file where events are recorded.
+
+        """
+        super(Journal, self).__init__()
+
+        self._path = path
+        self._lock = threading.Lock()
+        self._states = dict()
+
+        for event in _read(path):
+            self._apply(event)
+
+    def _apply(self, event):
+        """Update the state of a Rez package, using a recorded event.
+
+        Args:
+            event (dict[str, str]): The package name, status, and branch.
+
+        """
+        package = event["package"]
+        status = event["status"]
+        state = self._states.get(package) or _State(False, "", False)
+
+        if status == STARTED:
+            state = state._replace(ran=False)
+        elif status == PUSHED:
+            state = state._replace(branch=event["branch"], needs_pull_request=True)
+        elif status == RAN:
+            state = state._replace(ran=True)
+        elif status == FAILED:
+            state = state._replace(ran=False)
+        elif status == SUBMITTED:
+            state = state._replace(needs_pull_request=False)
+
+        self._states[package] = state
+
+    def clear(self):
+        """Forget every recorded event, to start a new run."""
+        with self._lock:
+            self._states.clear()
+
+            if os.path.isfile(self._path):
+                os.remove(self._path)
+
+    def get_branch(self, package):
+        """Find the pushed branch of a Rez package whose pull request wasn't made yet.
+
+        Args:
+            package (str): The name of some Rez package. e.g. "rez_lint".
+
+        Returns:
+            str: The found git branch name, if any.
+
+        """
+        with self._lock:
+            state = self._states.get(package)
+
+        if not state or not state.needs_pull_request:
+            return ""
+
+        return state.branch
+
+    def get_completed(self):
+        """set[str]: The name of every Rez package which needs no more work."""
+        with self._lock:
+            return {
+                package
+                for package, state in self._states.items()
+                if state.ran and not state.needs_pull_request
+            }
+
+    def get_path(self):
+        """str: The file where events are recorded."""
+        return self._path
+
+    def record(self, package, status, branch=""):
+        """Append an event to the journal, immediately.
+
+        Args:
+            package (str): The name of some Rez package. e.g. "rez_lint".
+            status (str): What happened. e.g. :attr:`RAN`.
+            branch (str, optional): The git branch of a :attr:`PUSHED` event.
+
+        """
+        event = {
+            "branch": branch,
+            "package": package,
+            "status": status,
+            "time": time.time(),
+        }
+
+        with self._lock:
+            self._apply(event)
+            directory = os.path.dirname(self._path)
+
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            with open(self._path, "a") as handler:
+                handler.write(json.dumps(event) + "\n")
+                handler.flush()
+                # The journal must survive the process being killed
+                os.fsync(handler.fileno())
+
+
+def _read(path):
+    """Get every recorded event in a journal file.
+
+    Args:
+        path (str): The JSON lines file which may not exist yet.
+
+    Returns:
+        list[dict[str, str]]: The found events, in the order that they were recorded.
+
+    """
+    try:
+        with open(path, "r") as handler:
+            lines = handler.readlines()
+    except (IOError, OSError):
+        return []
+
+    output = []
+
+    for line in lines:
+        try:
+            output.append(json.loads(line))
+        except ValueError:
+            # The process was killed while this line was being written
+            _LOGGER.warning('Skipping incomplete line "%s" in "%s".', line, path)
+
+    return output
+
+
+@contextlib.contextmanager
+def activate(journal):
+    """Send every :func:`record` call to `journal`, while in this context.
+
+    Args:
+        journal (:class:`Journal`): The journal to record events into.
+
+    Yields:
+        :class:`Journal`: `journal`.
+
+    """
+    with _LOCK:
+        _ACTIVE_JOURNALS.append(journal)
+
+    try:
+        yield journal
+    finally:
+        with _LOCK:
+            _ACTIVE_JOURNALS.remove(journal)
+
+
+def get_active():
+    """:class:`Journal` or NoneType: Get the journal that events are recorded into."""
+    with _LOCK:
+        if _ACTIVE_JOURNALS:
+            return _ACTIVE_JOURNALS[-1]
+
+    return None
+
+
+def get_default_path(key):
+    """str: The file where a run's events are recorded, if the user doesn't choose one."""
+    return os.path.join(caching.get_directory(), "journals", key + ".jsonl")
+
+
+def _to_json(value):
+    """Convert `value` into something that :mod:`json` can save, in a stable order."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+
+    return str(value)
+
+
+def get_key(command, arguments, selection=None):
+    """Describe a run so that it can be found again, to resume it.
+
+    Args:
+        command (str): The name of the command which is run. e.g. "shell".
+        arguments (:class:`argparse.Namespace`): The command's parsed arguments.
+        selection (dict[str, object], optional):
+            The base arguments which choose the Rez packages to run on.
+            e.g. {"rez_packages": ["foo", "bar"]}. A run over a
+            different set of Rez packages gets a different key.
+
+    Returns:
+        str: The command name and a hash of its arguments.
+
+    """
+    data = {
+        name: value
+        for name, value in vars(arguments).items()
+        if name not in _IGNORED_ARGUMENTS
+    }
+
+    if selection:
+        data = {"arguments": data, "selection": selection}
+
+    text = json.dumps(data, sort_keys=True, default=_to_json)
+
+    return "{command}-{digest}".format(
+        command=command, digest=hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+    )
+
+
+def record(package, status, branch=""):
+    """Append an event to the active journal, if there is one.
+
+    Args:
+        package (str): The name of some Rez package. e.g. "rez_lint".
+        status (str): What happened. e.g. :attr:`RAN`.
+        branch (str, optional): The git branch of a :attr:`PUSHED` event.
+
+    """
+    journal = get_active()
+
+    if journal:
+        journal.record(package, status, branch=branch)
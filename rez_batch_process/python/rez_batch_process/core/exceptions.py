@@ -18,6 +18,12 @@ class CoreException(Exception):
     pass
 
 
+class CacheLockTimeout(CoreException):
+    """If a cache folder stayed locked by some other thread / process for too long."""
+
+    pass
+
+
 class InvalidPackage(CoreException):
     """A Rez package that has an issue that causes the code to fail.
 
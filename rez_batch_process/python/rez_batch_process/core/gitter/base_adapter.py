@@ -39,7 +39,9 @@ class BaseAdapter(object):
 
     @staticmethod
     @abc.abstractmethod
-    def create_pull_request(title, body, pull_request_data, user_data="", assignee=""):
+    def create_pull_request(  # pylint: disable=too-many-arguments
+        title, body, pull_request_data, user_data="", assignee="", retry=None
+    ):
         """Make a pull request to the remote, using the given information.
 
         It's recommended to always provide `user_data` because querying
@@ -57,6 +59,10 @@ class BaseAdapter(object):
                 then it is queried before pull requests are created.
             assignee (str, optional):
                 The name of a GitHub user to add to created PRs. Default: "".
+            retry (callable[callable] -> object, optional):
+                A function which calls, and retries, one remote API call
+                at a time. e.g. :func:`.submission.call`. If no function
+                is given, every API call is only called once.
 
         """
         pass
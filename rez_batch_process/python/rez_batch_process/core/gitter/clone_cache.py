@@ -0,0 +1,449 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A persistent, on-disk cache of git repositories which are re-used between runs.
+
+Every repository is stored once, as a bare "mirror". When a repository
+is needed again, the mirror is updated with a ``git fetch`` instead of
+being cloned from scratch. Each run then gets its own, hard-linked
+checkout of the mirror, which it can modify freely.
+
+Important:
+    Several ``rez_batch_process`` runs may use the same cache folder
+    at once. Every change to the cache happens while holding a lock
+    file so that the mirrors never get corrupted.
+
+"""
+
+import errno
+import hashlib
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+
+import git
+from git import exc
+
+from .. import exceptions
+from . import cloner
+
+_LAST_USED_FILE = "rez_batch_process_last_used"
+_LOCK_SUFFIX = ".lock"
+_LOGGER = logging.getLogger(__name__)
+_SCP_URL = re.compile(r"^(?:[\w\-.]+@)?(?P<host>[\w\-.]+):(?P<path>[^/].*)$")
+_URL = re.compile(
+    r"^(?:[\w+\-]+://)?(?:[^@/]+@)?(?P<host>[^/:]+)(?::\d+)?/(?P<path>.+)$"
+)
+
+
+class _LockFile(object):
+    """A lock which works across threads and processes, using an exclusive file."""
+
+    def __init__(self, path, timeout=600.0, interval=0.1):
+        """Keep track of the lock file path.
+
+        Args:
+            path (str): The absolute path to a lock file to create.
+            timeout (float, optional): The seconds to wait before giving up.
+            interval (float, optional): The seconds to wait between each attempt.
+
+        """
+        super(_LockFile, self).__init__()
+
+        self._path = path
+        self._timeout = timeout
+        self._interval = interval
+
+    def _is_stale(self):
+        """Check if the lock file was left behind by a process which isn't using it.
+
+        A lock is stale if the process which created it no longer
+        exists or if the lock file is older than this lock's timeout.
+
+        Returns:
+            bool: If the lock file can be safely taken over.
+
+        """
+        try:
+            with open(self._path, "r") as handler:
+                text = handler.read().strip()
+
+            modified = os.path.getmtime(self._path)
+        except (IOError, OSError):
+            return False  # It was just released or it is still being written
+
+        if time.time() - modified > self._timeout:
+            return True
+
+        # On Windows, `os.kill` stops the process instead of checking it
+        if os.name != "posix" or not text.isdigit():
+            return False
+
+        try:
+            os.kill(int(text), 0)
+        except OSError as error:
+            return error.errno == errno.ESRCH
+
+        return False
+
+    def acquire(self, blocking=True):
+        """Create the lock file, waiting for any other owner to release it first.
+
+        Args:
+            blocking (bool, optional):
+                If True, wait until the lock is free. If False, try once and return.
+
+        Raises:
+            :class:`.CacheLockTimeout`: If the lock couldn't be acquired in time.
+
+        Returns:
+            bool: If the lock was acquired.
+
+        """
+        end = time.time() + self._timeout
+
+        while True:
+            try:
+                handler = os.open(self._path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except OSError as error:
+                if error.errno != errno.EEXIST:
+                    raise
+            else:
+                os.write(handler, str(os.getpid()).encode("utf-8"))
+                os.close(handler)
+
+                return True
+
+            if self._is_stale():
+                _LOGGER.warning('Taking over stale lock "%s".', self._path)
+                self.release()
+
+                continue
+
+            if not blocking:
+                return False
+
+            if time.time() > end:
+                raise exceptions.CacheLockTimeout(
+                    'Lock "{self._path}" could not be acquired. If no other '
+                    "process is using it, delete it and try again.".format(self=self)
+                )
+
+            time.sleep(self._interval)
+
+    def release(self):
+        """Delete the lock file so that other threads / processes can use it."""
+        try:
+            os.remove(self._path)
+        except OSError:
+            _LOGGER.warning('Lock "%s" was already removed.', self._path)
+
+    def __enter__(self):
+        """Wait for the lock file."""
+        self.acquire()
+
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        """Release the lock file."""
+        self.release()
+
+
+class CloneCache(object):
+    """A folder of bare git repositories which are fetched, instead of re-cloned.
+
+    Example:
+        >>> cache = CloneCache("/tmp/rez_batch_process_cache", maximum_size=10 * 1024 ** 3)
+        >>> repository = cache.add_checkout("git@github.com:foo/bar.git", "/tmp/bar")
+
+    """
+
+    def __init__(self, root, maximum_size=0):
+        """Keep track of the cache location.
+
+        Args:
+            root (str):
+                An absolute folder on-disk where every bare repository is stored.
+            maximum_size (int, optional):
+                The total bytes that the cache may use. Whenever the cache
+                becomes larger than this, the least recently used
+                repositories are deleted. If 0, the cache grows forever.
+                Default: 0.
+
+        """
+        super(CloneCache, self).__init__()
+
+        self._root = root
+        self._maximum_size = maximum_size
+        self._checkouts = []
+        self._checkouts_lock = threading.Lock()
+
+    def _get_lock(self, name):
+        """:class:`_LockFile`: Get a lock for a repository (or the whole cache)."""
+        return _LockFile(os.path.join(self._root, name + _LOCK_SUFFIX))
+
+    def _make_root(self, url):
+        """Create the cache folder, if needed, and get the lock name for `url`.
+
+        Args:
+            url (str): The git repository to clone. e.g. "git@github.com:foo/bar.git".
+
+        Returns:
+            str: The name to use with :meth:`_get_lock`.
+
+        """
+        if not os.path.isdir(self._root):
+            try:
+                os.makedirs(self._root)
+            except OSError as error:
+                if error.errno != errno.EEXIST:
+                    raise
+
+        return os.path.basename(self.get_mirror_directory(url))
+
+    def _update_mirror(self, url):
+        """Clone or fetch a bare repository for some URL.
+
+        Important:
+            This function must be called while the mirror's lock is held.
+
+        Args:
+            url (str): The git repository to clone. e.g. "git@github.com:foo/bar.git".
+
+        Returns:
+            :class:`git.Repo`: The up-to-date, bare repository.
+
+        """
+        directory = self.get_mirror_directory(url)
+
+        if os.path.isdir(directory):
+            try:
+                repository = git.Repo(directory)
+            except (
+                exc.InvalidGitRepositoryError,  # pylint: disable=no-member
+                exc.NoSuchPathError,  # pylint: disable=no-member
+            ):
+                _LOGGER.warning(
+                    'Mirror "%s" is broken. It will be re-cloned.', directory
+                )
+                shutil.rmtree(directory)
+            else:
+                _LOGGER.info('Fetching "%s" into "%s".', url, directory)
+                repository.remotes.origin.fetch(prune=True, tags=True)
+                _touch(directory)
+
+                return repository
+
+        _LOGGER.info('Cloning "%s" into "%s".', url, directory)
+        repository = git.Repo.clone_from(url, directory, bare=True)
+        # Bare clones don't have a fetch refspec by default. Adding one
+        # keeps every branch in the cache up to date with the remote.
+        #
+        repository.git.config("remote.origin.fetch", "+refs/heads/*:refs/heads/*")
+        _touch(directory)
+
+        return repository
+
+    def add_checkout(self, url, directory, keep=False, sparse=False):
+        """Check out a repository into a folder, using the cache's bare repository.
+
+        The checkout is a local clone of the cached repository so its
+        objects are hard-linked, not downloaded. Its "origin" remote
+        still points to `url` so pulling and pushing work as usual.
+
+        Args:
+            url (str):
+                The git repository to check out. e.g. "git@github.com:foo/bar.git".
+            directory (str):
+                An absolute folder on-disk which doesn't exist yet. The
+                repository's default branch will be checked out here.
+            keep (bool, optional):
+                If False, :meth:`clear_checkouts` will delete `directory`.
+                If True, the checkout is left on-disk. Default is False.
+            sparse (bool, optional):
+                If True, only check out Rez package definition files. See
+                :func:`.cloner.include_folders`. The history is always
+                complete because hard-linking it costs no extra disk
+                space. Default is False.
+
+        Returns:
+            :class:`git.Repo`: The created, checked out repository.
+
+        """
+        with self._get_lock(self._make_root(url)):
+            mirror = self._update_mirror(url)
+            repository = git.Repo.clone_from(
+                mirror.git_dir, directory, no_checkout=sparse
+            )
+
+        repository.remotes.origin.set_url(url)
+
+        if sparse:
+            cloner.make_sparse(repository)
+
+        if not keep:
+            with self._checkouts_lock:
+                self._checkouts.append(directory)
+
+        return repository
+
+    def clear_checkouts(self):
+        """Delete every checkout that this instance has created."""
+        with self._checkouts_lock:
+            checkouts = list(self._checkouts)
+            del self._checkouts[:]
+
+        for directory in checkouts:
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+
+    def evict(self):
+        """Delete the least recently used repositories until the cache is small enough.
+
+        Repositories which are being fetched by another thread / process
+        are never deleted. Checkouts don't depend on the cache so they
+        can be evicted at any time.
+
+        Returns:
+            list[str]: The paths of every deleted bare repository.
+
+        """
+        if not self._maximum_size or not os.path.isdir(self._root):
+            return []
+
+        removed = []
+
+        with self._get_lock("cache"):
+            mirrors = []
+
+            for name in os.listdir(self._root):
+                path = os.path.join(self._root, name)
+
+                if os.path.isdir(path):
+                    mirrors.append((_get_last_used(path), _get_size(path), path))
+
+            total = sum(size for _, size, _ in mirrors)
+
+            for _, size, path in sorted(mirrors):
+                if total <= self._maximum_size:
+                    break
+
+                lock = self._get_lock(os.path.basename(path))
+
+                if not lock.acquire(blocking=False):
+                    _LOGGER.debug(
+                        'Mirror "%s" is in use. It will not be evicted.', path
+                    )
+
+                    continue
+
+                try:
+                    _LOGGER.info('Evicting "%s" from the clone cache.', path)
+                    shutil.rmtree(path)
+                finally:
+                    lock.release()
+
+                total -= size
+                removed.append(path)
+
+        return removed
+
+    def get_mirror(self, url):
+        """Get an up-to-date, bare repository for `url`, cloning it if needed.
+
+        Use this to read from a repository without checking it out.
+
+        Args:
+            url (str): The git repository to get. e.g. "git@github.com:foo/bar.git".
+
+        Returns:
+            :class:`git.Repo`: The bare repository.
+
+        """
+        with self._get_lock(self._make_root(url)):
+            return self._update_mirror(url)
+
+    def get_mirror_directory(self, url):
+        """str: Get the bare repository folder that is used for `url`."""
+        key = normalize_url(url)
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+        name = re.sub(r"[^\w\-.]+", "_", key)
+
+        return os.path.join(
+            self._root, "{name}_{digest}.git".format(name=name, digest=digest)
+        )
+
+    def get_root(self):
+        """str: The absolute folder on-disk where every bare repository is stored."""
+        return self._root
+
+
+def _get_last_used(directory):
+    """float: Get the last time that a bare repository was cloned or fetched."""
+    path = os.path.join(directory, _LAST_USED_FILE)
+
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return os.path.getmtime(directory)
+
+
+def _get_size(directory):
+    """int: Find the total size of a folder, in bytes."""
+    total = 0
+
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+
+            if not os.path.islink(path):
+                total += os.path.getsize(path)
+
+    return total
+
+
+def _touch(directory):
+    """Mark a bare repository as "recently used", for :meth:`CloneCache.evict`."""
+    with open(os.path.join(directory, _LAST_USED_FILE), "a"):
+        pass
+
+    os.utime(os.path.join(directory, _LAST_USED_FILE), None)
+
+
+def normalize_url(url):
+    """Convert a git URL into a key that is the same for every protocol.
+
+    Example:
+        >>> normalize_url("git@github.com:Foo/bar.git")
+        "github.com/Foo/bar"
+        >>> normalize_url("https://github.com/Foo/bar/")
+        "github.com/Foo/bar"
+
+    Args:
+        url (str): Some git repository URL or a path to a local repository.
+
+    Returns:
+        str: The normalized URL.
+
+    """
+    url = url.strip().rstrip("/")
+
+    if url.endswith(".git"):
+        url = url[: -len(".git")]
+
+    if os.path.isabs(url) or url.startswith("file://"):
+        path = url[len("file://") :] if url.startswith("file://") else url
+
+        return os.path.normpath(path).lstrip(os.sep)
+
+    match = _URL.match(url) if "://" in url else _SCP_URL.match(url)
+
+    if not match:
+        return url
+
+    return "{host}/{path}".format(
+        host=match.group("host").lower(), path=match.group("path").strip("/")
+    )
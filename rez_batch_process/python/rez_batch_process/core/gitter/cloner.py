@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Clone git repositories with as little history and as few files as possible.
+
+A command only ever modifies the latest commit of a Rez package's
+repository, so most of the time the full history isn't needed. There
+are 3 ways to clone a repository:
+
+- :attr:`FULL` - Clone every commit and check out every file.
+- :attr:`SHALLOW` - Clone only the latest commit but check out every file.
+- :attr:`SPARSE` - Clone only the latest commit and check out only the
+  Rez package definition files. Once a Rez package is found, call
+  :func:`include_folders` to check out the rest of its files.
+
+Attributes:
+    FULL (str): Clone the complete repository. This is the default.
+    SHALLOW (str): Clone only the latest commit of the default branch.
+    SPARSE (str): Like :attr:`SHALLOW` but check out only the files that are used.
+    MODES (tuple[str]): Every clone mode, in order of least to most restrictive.
+
+"""
+
+import logging
+import os
+
+import git
+from rez_utilities import rez_configuration
+
+FULL = "full"
+SHALLOW = "shallow"
+SPARSE = "sparse"
+MODES = (FULL, SHALLOW, SPARSE)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _get_source(url):
+    """str: Get a URL to clone `url` from which respects ``--depth``."""
+    if os.path.isdir(url):
+        # git ignores `--depth` for plain, local paths
+        return "file://" + os.path.abspath(url)
+
+    return url
+
+
+def _get_sparse_file(repository):
+    """str: Get the file which lists every path that `repository` checks out."""
+    return os.path.join(repository.git_dir, "info", "sparse-checkout")
+
+
+def clone(url, directory, mode=FULL, progress=None):
+    """Clone a git repository, using as little history and files as `mode` allows.
+
+    Args:
+        url (str):
+            Some address to a git repository or path to a local git repository.
+            e.g. "git@github.com:ColinKennedy/rez_developer_packages.git".
+        directory (str):
+            The folder on-disk where the repository will be cloned to.
+            It must not exist yet.
+        mode (str, optional):
+            One of :attr:`MODES`. Default: :attr:`FULL`.
+        progress (:class:`git.remote.RemoteProgress`, optional):
+            An object which is called while the repository is cloned.
+
+    Raises:
+        ValueError: If `mode` isn't valid.
+
+    Returns:
+        :class:`git.Repo`: The created repository.
+
+    """
+    if mode not in MODES:
+        raise ValueError(
+            'Mode "{mode}" is not valid. Options were, "{MODES}".'.format(
+                mode=mode, MODES=MODES
+            )
+        )
+
+    if mode == FULL:
+        return git.Repo.clone_from(url, directory, progress)
+
+    options = {"depth": 1}
+
+    if mode == SPARSE:
+        # If the server supports it, file contents are only downloaded
+        # once they're checked out.
+        #
+        options.update({"filter": "blob:none", "no_checkout": True})
+
+    source = _get_source(url)
+    _LOGGER.info('Cloning "%s" to "%s" in "%s" mode.', url, directory, mode)
+    repository = git.Repo.clone_from(source, directory, progress, **options)
+
+    if source != url:
+        repository.remotes.origin.set_url(url)
+
+    if mode == SPARSE:
+        make_sparse(repository)
+
+    return repository
+
+
+def clone_metadata(url, directory, progress=None):
+    """Clone only the latest commit's folders and file names, without any file contents.
+
+    The contents of a file are downloaded only when they're read (e.g.
+    with ``git cat-file``). If the server doesn't support this, the
+    latest commit is cloned completely, instead. In both cases, no
+    files are checked out.
+
+    Args:
+        url (str):
+            Some address to a git repository or path to a local git repository.
+            e.g. "git@github.com:ColinKennedy/rez_developer_packages.git".
+        directory (str):
+            The folder on-disk where the bare repository will be cloned to.
+            It must not exist yet.
+        progress (:class:`git.remote.RemoteProgress`, optional):
+            An object which is called while the repository is cloned.
+
+    Returns:
+        :class:`git.Repo`: The created, bare repository.
+
+    """
+    _LOGGER.info('Cloning the file names of "%s" to "%s".', url, directory)
+
+    repository = git.Repo.clone_from(
+        _get_source(url),
+        directory,
+        progress,
+        bare=True,
+        depth=1,
+        filter="blob:none",
+    )
+    repository.remotes.origin.set_url(url)
+
+    return repository
+
+
+def include_folders(repository, folders):
+    """Check out every file in `folders`, if `repository` is a sparse checkout.
+
+    If `repository` isn't a sparse checkout, every file is already
+    checked out so nothing happens.
+
+    Args:
+        repository (:class:`git.Repo`):
+            A cloned repository, possibly from :func:`clone`.
+        folders (iter[str]):
+            The absolute paths to folders within `repository` to check out.
+
+    """
+    if not is_sparse(repository):
+        return
+
+    root = repository.working_dir
+    path = _get_sparse_file(repository)
+
+    with open(path, "r") as handler:
+        patterns = handler.read().splitlines()
+
+    added = False
+
+    for folder in folders:
+        relative = os.path.relpath(folder, root).replace(os.sep, "/")
+        pattern = "/{relative}/".format(relative=relative)
+
+        if pattern not in patterns:
+            patterns.append(pattern)
+            added = True
+
+    if not added:
+        return
+
+    with open(path, "w") as handler:
+        handler.write("\n".join(patterns) + "\n")
+
+    repository.git.read_tree("-mu", "HEAD")
+
+
+def is_sparse(repository):
+    """bool: Check if `repository` only checks out some of its files."""
+    reader = repository.config_reader()
+
+    return reader.get_value("core", "sparseCheckout", False) is True
+
+
+def make_sparse(repository):
+    """Change `repository` to check out only Rez package definition files.
+
+    Use :func:`include_folders` to check out more files later.
+
+    Args:
+        repository (:class:`git.Repo`): A cloned repository to modify.
+
+    """
+    path = _get_sparse_file(repository)
+    directory = os.path.dirname(path)
+
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    with open(path, "w") as handler:
+        # A pattern with no "/" matches a file of that name in any folder
+        handler.write("\n".join(sorted(rez_configuration.REZ_PACKAGE_NAMES)) + "\n")
+
+    with repository.config_writer() as writer:
+        writer.set_value("core", "sparseCheckout", "true")
+
+    repository.git.read_tree("-mu", "HEAD")
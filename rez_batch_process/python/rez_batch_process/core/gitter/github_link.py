@@ -15,7 +15,7 @@ import github
 import github3
 from github3 import exceptions as github3_exceptions
 
-from . import base_adapter
+from . import base_adapter, user_directory
 
 try:
     from functools import lru_cache  # python 3
@@ -166,13 +166,13 @@ class GithubAdapter(base_adapter.BaseAdapter):
 
         return "github" in link.base.lower()
 
-    def create_pull_request(
-        self, title, body, pull_request_data, user_data="", assignee=""
+    def create_pull_request(  # pylint: disable=too-many-arguments
+        self, title, body, pull_request_data, user_data="", assignee="", retry=None
     ):
         """Make a pull request to GitHub, using the given information.
 
-        It's recommended to always provide `user_data` because querying
-        data from external sites like GitHub can be extremely slow.
+        GitHub users are read from a saved, indexed directory which is
+        only refreshed once it's stale. See :mod:`.user_directory`.
 
         Args:
             title (str): The subject line of the pull request.
@@ -181,33 +181,44 @@ class GithubAdapter(base_adapter.BaseAdapter):
                 The URL to a hosted Git repository, the source (feature)
                 branch to use for the pull request and the destination
                 branch (usually master) for it to merge into.
-            user_data (str, optional): A file path that is used to read cached user login,
-                e-mail, and name information. If no information is given
-                then it is queried before pull requests are created.
+            user_data (str, optional): A file path where GitHub user login,
+                e-mail, and name information is saved between runs.
+                Default: :func:`.user_directory.get_default_path`.
             assignee (str, optional):
                 The name of a GitHub user to add to created PRs. Default: "".
+            retry (callable[callable] -> object, optional):
+                A function which calls, and retries, one remote API call
+                at a time. e.g. :func:`.submission.call`. If no function
+                is given, every API call is only called once.
+
+        Raises:
+            :class:`github3.exceptions.UnprocessableEntity`:
+                If the pull request couldn't be created and no pull
+                request for the same branches already exists.
 
         """
-        if not user_data:
-            user_data = get_all_users(
-                self._token, self._base_url, verify=self._verify, write=True
-            )
-        else:
-            user_data = _read_users_from_cache(user_data)
+        if not retry:
+            retry = _call
+
+        directory = user_directory.get_directory(
+            user_data, token=self._token, base_url=self._base_url, verify=self._verify
+        )
 
         data = _get_github_url_data(pull_request_data.url)
         repository = self._user.repository(data.owner, data.name)
 
         package_maintainers = _convert_to_github_user_names(
-            self._package.authors or [], user_data
+            self._package.authors or [], directory
         )
         reviewers = self._get_reviewers(
             repository, package_maintainers, fallback_reviewers=self._fallback_reviewers
         )
 
         try:
-            pull_request = repository.create_pull(
-                title, pull_request_data.destination, pull_request_data.source, body
+            pull_request = retry(
+                lambda: repository.create_pull(
+                    title, pull_request_data.destination, pull_request_data.source, body
+                )
             )
         except github3_exceptions.UnprocessableEntity as error:
             _LOGGER.warning(
@@ -224,22 +235,35 @@ class GithubAdapter(base_adapter.BaseAdapter):
 
                 raise
 
+            # e.g. An earlier attempt created the pull request but its response was lost
+            pull_request = retry(
+                lambda: _find_pull_request(repository, data.owner, pull_request_data)
+            )
+
+            if not pull_request:
+                raise error
+
         # Add another parameter for an optional assignee, here
         if assignee:
-            try:
-                assignee_ = next(user for user in user_data if user.login == assignee)
-            except StopIteration:
-                _LOGGER.exception('No user could be found for "%s".', assignee)
-            else:
+            assignee_ = directory.get_user(assignee)
+
+            if assignee_:
                 pull_request.assignees = [assignee_]
+            else:
+                _LOGGER.error('No user could be found for "%s".', assignee)
 
         # This next line adds the reviewers to the already-created-pull
         # request. It's an awkward syntax but oh well.
         #
-        pull_request.create_review_requests(reviewers=reviewers)
+        retry(lambda: pull_request.create_review_requests(reviewers=reviewers))
+
+
+def _call(function):
+    """object: Call `function` once, without retrying it."""
+    return function()
 
 
-def _convert_to_github_user_names(package_authors, github_users):
+def _convert_to_github_user_names(package_authors, directory):
     """Change the Rez package raw author list into GitHub logins.
 
     There's no established convention for Rez package author names. Some
@@ -258,7 +282,7 @@ def _convert_to_github_user_names(package_authors, github_users):
     Args:
         package_authors (list[str]):
             The people responsible for the Rez package.
-        github_users (list[:attr:`_User`]):
+        directory (:class:`.user_directory.UserDirectory`):
             Name, e-mail, login, etc details about every GitHub user.
             This will be used as a reference to get actual GitHub user names.
 
@@ -269,11 +293,10 @@ def _convert_to_github_user_names(package_authors, github_users):
     output = []
 
     for author in package_authors:
-        for user in github_users:
-            if user.login in author or user.name in author or author in user.bio:
-                output.append(user.login)
+        login = directory.find_login(author)
 
-                break
+        if login:
+            output.append(login)
         else:
             _LOGGER.warning(
                 'Author "%s" could not be converted into a GitHub user.', author
@@ -282,6 +305,31 @@ def _convert_to_github_user_names(package_authors, github_users):
     return output
 
 
+def _find_pull_request(repository, owner, pull_request_data):
+    """Find the open pull request which merges one branch into another.
+
+    Args:
+        repository (:class:`github3.repos.repo.Repository`):
+            The GitHub repository which contains both branches.
+        owner (str):
+            The GitHub user or organization which owns `repository`.
+        pull_request_data (:attr:`.PullRequestDetails`):
+            The source (feature) branch and destination branch to look for.
+
+    Returns:
+        :class:`github3.pulls.ShortPullRequest` or NoneType: The found pull request, if any.
+
+    """
+    for pull_request in repository.pull_requests(
+        state="open",
+        head="{owner}:{source}".format(owner=owner, source=pull_request_data.source),
+        base=pull_request_data.destination,
+    ):
+        return pull_request
+
+    return None
+
+
 def _get_github_url_data(url):
     """Find information such as repository owner, repository name, etc from a GitHub URL.
 
@@ -305,36 +353,6 @@ def _get_github_url_data(url):
     return None
 
 
-@lru_cache()
-def _read_users_from_cache(path):
-    """Parse a set of "cached_users" representing GitHub login data and return them.
-
-    See Also:
-        :func:`get_all_users`
-
-    Args:
-        path (str):
-            An absolute path to a JSON file to read from. It must
-            contain 4 keys, "login", "name", "email", and "bio".
-            All things that can be queried and retrieved using
-            :func:`get_all_users`.
-
-
-    Returns:
-        list[:attr:`_User`]: The found users.
-
-    """
-    output = []
-
-    with open(path, "r") as handler:
-        for user in json.load(handler):
-            output.append(
-                _User(user["login"], user["name"], user["email"], user["bio"])
-            )
-
-    return output
-
-
 def _write_user_data_cache(users):
     """Serialize GitHub user data to JSON and write it to a file.
 
@@ -364,14 +382,14 @@ def get_all_users(token, base_url="", verify=True, maximum=sys.maxsize, write=Fa
 
     Warning:
         This function is cached but it can be VERY slow to run. Exercise
-        caution. Use "cached_users" instead of querying from this
-        function, whenever possible.
+        caution. Use :mod:`.user_directory` instead of querying from
+        this function, whenever possible.
 
     Reference:
         https://help.github.com/en/github/authenticating-to-github/creating-a-personal-access-token-for-the-command-line
 
     See Also:
-        :func:`_read_users_from_cache`
+        :func:`.user_directory.get_directory`
 
     Args:
         token (str):
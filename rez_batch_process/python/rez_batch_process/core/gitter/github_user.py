@@ -3,15 +3,18 @@
 
 """A module to help query and and serialize a list of GitHub users."""
 
-import json
 import sys
 
-from . import github_link
+from . import user_directory
 
 
-def write_cache(path, token, base_url="", verify=False, maximum=sys.maxsize):
+def write_cache(
+    path, token, base_url="", verify=False, maximum=sys.maxsize, maximum_age=0
+):
     """Serialize a list of GitHub users to-disk.
 
+    If `path` already has users, only new or changed users are downloaded.
+
     Reference:
         https://help.github.com/en/github/authenticating-to-github/creating-a-personal-access-token-for-the-command-line
 
@@ -29,23 +32,18 @@ def write_cache(path, token, base_url="", verify=False, maximum=sys.maxsize):
             If True, require a valid SSL certificate in private If
             networks. If False, accept all external SSL certificates.
             Default is True.
+        maximum (int, optional):
+            The most users to query. Set this value low to avoid long wait times.
+        maximum_age (float, optional):
+            Users which were saved less than this many seconds ago
+            aren't queried again. If 0, every user is checked for changes.
 
     """
-    users = github_link.get_all_users(
-        token, base_url=base_url, verify=verify, maximum=maximum, write=False
+    user_directory.refresh(
+        path,
+        token,
+        base_url=base_url,
+        verify=verify,
+        maximum_age=maximum_age,
+        maximum=maximum,
     )
-
-    data = []
-
-    for user in users:
-        data.append(
-            {
-                "email": user.email or "",
-                "bio": user.bio or "",
-                "login": user.login,
-                "name": user.name or "",
-            }
-        )
-
-    with open(path, "w") as handler:
-        json.dump(data, handler)
@@ -0,0 +1,311 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Check which files a git repository has, without checking any of them out.
+
+Finding documentation by cloning a whole repository and walking its
+files is slow and uses a lot of disk space when hundreds of Rez
+packages need to be checked. This module instead clones only the
+folder and file names of a repository's latest commit (see
+:func:`.cloner.clone_metadata`) and lists them with ``git ls-tree``.
+The contents of a file are only downloaded if they must be read, e.g.
+to get the name of a Rez package or to validate a Sphinx conf.py.
+
+Each repository is cloned and listed once per run.
+
+"""
+
+import logging
+import os
+import posixpath
+import shutil
+import tempfile
+import threading
+
+import git
+from python_compatibility.sphinx import conf_manager
+from rez import exceptions as rez_exceptions
+from rez import packages_
+from rez.vendor.schema import schema
+from rez_utilities import rez_configuration
+
+from . import cloner, git_link
+
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+_TREES = dict()
+
+
+class RepositoryTree(object):
+    """Every file path of one commit in a git repository, read lazily."""
+
+    def __init__(self, repository, reference="HEAD"):
+        """Keep track of the repository to read from.
+
+        Args:
+            repository (:class:`git.Repo`):
+                A (usually bare) repository which has `reference`.
+            reference (str, optional):
+                The commit, branch, or tag to read. Default: "HEAD".
+
+        """
+        super(RepositoryTree, self).__init__()
+
+        self._repository = repository
+        self._reference = reference
+        self._paths = None
+        self._names = dict()
+
+    def _load_package_name(self, root):
+        """Get the name of the Rez package in some folder, by reading its definition.
+
+        Args:
+            root (str): A relative folder which contains a Rez package file.
+
+        Returns:
+            str: The found name. If the Rez package is invalid, return "".
+
+        """
+        directory = tempfile.mkdtemp(suffix="_remote_tree_package")
+
+        try:
+            for name in rez_configuration.REZ_PACKAGE_NAMES:
+                path = posixpath.join(root, name) if root else name
+
+                if path in self.get_paths():
+                    self._write(path, os.path.join(directory, name))
+
+            return packages_.get_developer_package(directory).name
+        except (rez_exceptions.RezError, schema.SchemaError):
+            _LOGGER.warning(
+                'Folder "%s" in "%s" has an invalid Rez package.',
+                root,
+                self._repository.git_dir,
+            )
+
+            return ""
+        finally:
+            shutil.rmtree(directory)
+
+    def _write(self, path, destination):
+        """Copy the contents of a file in this tree to disk.
+
+        Args:
+            path (str): A relative file path in this tree.
+            destination (str): The absolute path on-disk to write to.
+
+        """
+        text = self._repository.git.cat_file(
+            "blob", "{self._reference}:{path}".format(self=self, path=path)
+        )
+        directory = os.path.dirname(destination)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(destination, "w") as handler:
+            handler.write(text)
+
+    def exists(self, path):
+        """bool: Check if a relative file path exists in this tree."""
+        return path in self.get_paths()
+
+    def find_package_root(self, name):
+        """Find the folder of some Rez package in this tree.
+
+        Folders which are named after `name` are checked first, to
+        avoid reading every Rez package.
+
+        Args:
+            name (str): The name of the Rez package to find. e.g. "rez_lint".
+
+        Returns:
+            str or NoneType: The relative folder, if the Rez package was found.
+
+        """
+        roots = self.get_package_roots()
+        roots = sorted(roots, key=lambda root: posixpath.basename(root) != name)
+
+        for root in roots:
+            if root not in self._names:
+                self._names[root] = self._load_package_name(root)
+
+            if self._names[root] == name:
+                return root
+
+        return None
+
+    def get_conf_file(self, root):
+        """Find a Sphinx conf.py file for some Rez package in this tree.
+
+        Only conf.py files are written to disk, so that they can be
+        validated by :func:`python_compatibility.sphinx.conf_manager.get_conf_file`.
+
+        Args:
+            root (str): The relative folder of some Rez package.
+
+        Returns:
+            str: The relative path to the found conf.py. If none was found, return "".
+
+        """
+        prefix = root + "/" if root else ""
+        candidates = [
+            path
+            for path in self.get_paths()
+            if path.startswith(prefix)
+            and posixpath.basename(path) == conf_manager.SETTINGS_FILE
+        ]
+
+        if not candidates:
+            return ""
+
+        directory = tempfile.mkdtemp(suffix="_remote_tree_documentation")
+
+        try:
+            for path in candidates:
+                relative = path[len(prefix) :]
+                self._write(path, os.path.join(directory, *relative.split("/")))
+
+            found = conf_manager.get_conf_file(directory)
+        finally:
+            shutil.rmtree(directory)
+
+        if not found:
+            return ""
+
+        relative = os.path.relpath(found, directory).replace(os.sep, "/")
+
+        return prefix + relative
+
+    def get_package_roots(self):
+        """set[str]: Get every relative folder which has a Rez package file."""
+        return {
+            posixpath.dirname(path)
+            for path in self.get_paths()
+            if posixpath.basename(path) in rez_configuration.REZ_PACKAGE_NAMES
+        }
+
+    def get_paths(self):
+        """frozenset[str]: Get every relative file path in this tree."""
+        if self._paths is None:
+            output = self._repository.git.ls_tree(
+                "-r", "--name-only", "-z", self._reference
+            )
+            self._paths = frozenset(path for path in output.split("\0") if path)
+
+        return self._paths
+
+
+def _clone(url, directory="", keep=False):
+    """Clone the folder and file names of some git repository.
+
+    Args:
+        url (str):
+            Some address to a git repository or path to a local git repository.
+        directory (str, optional):
+            If included, clone `url` into a child of this folder. If
+            the child already exists, it is re-used. Otherwise, clone
+            into a temporary folder. Default: "".
+        keep (bool, optional):
+            If False, delete the cloned repository once Python exits.
+            If True, don't delete it. Default is False.
+
+    Returns:
+        :class:`git.Repo`: The cloned, bare repository.
+
+    """
+    if directory:
+        # A separate child folder, so it never conflicts with a full clone of `url`
+        destination = git_link.make_repository_folder(
+            os.path.join(directory, "remote_trees"), url
+        )
+
+        if os.path.isdir(destination):
+            _LOGGER.info('Re-using repository located at "%s".', destination)
+
+            return git.Repo(destination)
+    else:
+        destination = tempfile.mkdtemp(suffix="_remote_tree")
+        # `git clone` needs a folder that doesn't exist yet
+        os.rmdir(destination)
+
+    repository = cloner.clone_metadata(url, destination)
+
+    if not keep:
+        git_link.add_directory_to_delete(destination)
+
+    return repository
+
+
+def clear_cache():
+    """Forget every repository tree, so that they are cloned again."""
+    with _LOCK:
+        _TREES.clear()
+
+
+def get_tree(url, cache=None, keep=False, directory=""):
+    """Get the file paths of the latest commit of some git repository.
+
+    Args:
+        url (str):
+            Some address to a git repository or path to a local git repository.
+        cache (:class:`.CloneCache`, optional):
+            If included, read from the cache's bare repository instead
+            of cloning `url`.
+        keep (bool, optional):
+            If False, delete the cloned repository once Python exits.
+            If True, don't delete it. Default is False.
+        directory (str, optional):
+            If included, clone `url` into a child of this folder. If
+            the child already exists, it is re-used. Otherwise, clone
+            into a temporary folder. Default: "".
+
+    Returns:
+        :class:`RepositoryTree`: The found paths.
+
+    """
+    with _LOCK:
+        if url in _TREES:
+            return _TREES[url]
+
+    if cache:
+        repository = cache.get_mirror(url)
+    else:
+        repository = _clone(url, directory=directory, keep=keep)
+
+    tree = RepositoryTree(repository)
+
+    with _LOCK:
+        return _TREES.setdefault(url, tree)
+
+
+def has_package_conf(url, package, cache=None, keep=False, directory=""):
+    """Check if a Rez package has a Sphinx conf.py, without checking out its repository.
+
+    Args:
+        url (str):
+            The URL pointing to a git repository that contains `package`
+            somewhere inside of it.
+        package (str):
+            The name of the Rez packge to find within `url`.
+        cache (:class:`.CloneCache`, optional):
+            If included, read from the cache's bare repository instead
+            of cloning `url`.
+        keep (bool, optional):
+            If False, delete the cloned repository once Python exits.
+            If True, don't delete it. Default is False.
+        directory (str, optional):
+            If included, clone `url` into a child of this folder.
+            Otherwise, clone into a temporary folder. Default: "".
+
+    Returns:
+        bool: If a conf.py was found.
+
+    """
+    tree = get_tree(url, cache=cache, keep=keep, directory=directory)
+    root = tree.find_package_root(package)
+
+    if root is None:
+        return False
+
+    return bool(tree.get_conf_file(root))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find which folders of a git repository have changes, with a single ``git status``.
+
+Running ``git status -- <folder>`` once per Rez package walks the
+repository's index and working tree each time. A :class:`Snapshot`
+runs ``git status`` once, for the whole repository or only the
+folders it is given, and then answers for any number of folders.
+
+Example:
+    >>> snapshot = Snapshot(repository)
+    >>> snapshot.get_changed_roots(["/repository/rez_lint", "/repository/rez_utilities"])
+    {"/repository/rez_lint"}
+
+A snapshot doesn't see changes made after it was created. Make a new
+one whenever files may have changed.
+
+"""
+
+import os
+
+# Renamed and copied files list their original path as a separate entry
+_PAIRED_STATUSES = frozenset(("C", "R"))
+
+
+class Snapshot(object):
+    """Every uncommitted or untracked path of a git repository, at one point in time."""
+
+    def __init__(self, repository, paths=tuple()):
+        """Run ``git status`` for the repository.
+
+        Args:
+            repository (:class:`git.Repo`):
+                The repository or worktree to check.
+            paths (iter[str], optional):
+                Absolute folders to limit ``git status`` to. If no
+                folders are given, the whole repository is checked.
+
+        """
+        super(Snapshot, self).__init__()
+
+        self._root = repository.working_dir
+        self._paths = _get_changed_paths(
+            repository, [self._get_relative_path(path) or "." for path in paths]
+        )
+
+    def _get_relative_path(self, folder):
+        """str: Convert an absolute `folder` into a path like ``git status`` reports."""
+        relative = os.path.relpath(folder, self._root).replace(os.sep, "/")
+
+        if relative == ".":
+            return ""
+
+        return relative + "/"
+
+    def get_changed_roots(self, roots):
+        """Find every folder which contains a change.
+
+        Args:
+            roots (iter[str]):
+                The absolute paths to folders within the repository.
+                Usually, each one is the root of a Rez package.
+
+        Returns:
+            set[str]: Every path in `roots` which contains a changed path.
+
+        """
+        return {root for root in roots if self.has_changes(root)}
+
+    def get_paths(self):
+        """set[str]: Every changed path, relative to the repository root."""
+        return set(self._paths)
+
+    def has_changes(self, root):
+        """Check if a folder contains any uncommitted or untracked changes.
+
+        Args:
+            root (str): The absolute path to a folder within the repository.
+
+        Returns:
+            bool: If anything in `root` changed.
+
+        """
+        prefix = self._get_relative_path(root)
+
+        return any(path.startswith(prefix) for path in self._paths)
+
+
+def _get_changed_paths(repository, folders):
+    """Find every uncommitted or untracked path in a repository.
+
+    Args:
+        repository (:class:`git.Repo`):
+            The repository or worktree to check.
+        folders (list[str]):
+            Folders, relative to the root of `repository`, to limit
+            ``git status`` to. If empty, the whole repository is checked.
+
+    Returns:
+        set[str]: Every changed path, relative to the root of `repository`.
+
+    """
+    # `-z` keeps paths unquoted and `-uall` lists the files of untracked
+    # folders, so that each path can be matched against a folder prefix.
+    #
+    arguments = ["--porcelain", "-z", "-uall"]
+
+    if folders:
+        arguments.append("--")
+        arguments.extend(folders)
+
+    entries = repository.git.status(*arguments).split("\0")
+    paths = set()
+    index = 0
+
+    while index < len(entries):
+        entry = entries[index]
+        index += 1
+
+        if not entry:
+            continue
+
+        status, path = entry[:2], entry[3:]
+        paths.add(path)
+
+        if set(status) & _PAIRED_STATUSES and index < len(entries):
+            paths.add(entries[index])
+            index += 1
+
+    return paths
@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Submit pull requests in the background, while other Rez packages are modified.
+
+Creating a pull request and requesting its reviewers are slow, remote
+API calls which may be throttled by GitHub at any time. Instead of
+making them one-by-one, in between modifying Rez packages, they can be
+added to a :class:`SubmissionQueue`. The queue submits a limited
+number of pull requests at once, waits whenever the API says that a
+rate limit was reached, and retries connection errors.
+
+Each submitted function is given a `retry` function. Pass every API
+call to it, one by one. Calls like "create a pull request" aren't safe
+to repeat, so only the call which failed is tried again, not the whole
+submission.
+
+Example:
+    >>> def some_function(retry):
+    ...     pull_request = retry(lambda: repository.create_pull(...))
+    ...     retry(lambda: pull_request.create_review_requests(...))
+    >>> queue = SubmissionQueue(jobs=2)
+    >>> with activate(queue):
+    ...     submit("some_package", some_function)  # Returns immediately
+    >>> summary = queue.join()
+
+If no queue is active, :func:`submit` calls the function immediately.
+
+"""
+
+import collections
+import contextlib
+import functools
+import logging
+import threading
+import time
+from multiprocessing import pool
+
+from github3 import exceptions as github3_exceptions
+
+_ACTIVE_QUEUES = []
+_ATTEMPTS = 5
+_BASE_DELAY = 2.0  # The seconds to wait after the first failed connection
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+_MAXIMUM_DELAY = 120.0
+_TRANSIENT_STATUSES = frozenset((500, 502, 503, 504))
+
+Summary = collections.namedtuple("Summary", "submitted failed")
+
+
+class SubmissionQueue(object):
+    """Submit pull requests in background threads, a few at a time."""
+
+    def __init__(self, jobs=2, attempts=_ATTEMPTS):
+        """Start the threads which submit pull requests.
+
+        Args:
+            jobs (int, optional):
+                The most pull requests to submit at the same time. Default: 2.
+            attempts (int, optional):
+                The most times to try to submit each pull request.
+
+        Raises:
+            ValueError: If `jobs` is less than 1.
+
+        """
+        if jobs < 1:
+            raise ValueError('Jobs "{jobs}" cannot be less than 1.'.format(jobs=jobs))
+
+        super(SubmissionQueue, self).__init__()
+
+        self._attempts = attempts
+        self._failed = []
+        self._lock = threading.Lock()
+        self._resume_time = 0.0
+        self._submitted = []
+        self._workers = pool.ThreadPool(jobs)
+
+    def _pause(self, delay):
+        """Stop every thread from calling the API for `delay` seconds.
+
+        Args:
+            delay (float): The seconds to wait.
+
+        """
+        with self._lock:
+            self._resume_time = max(self._resume_time, time.time() + delay)
+
+        self._wait()
+
+    def _run(self, name, function):
+        """Submit one pull request and remember if it succeeded.
+
+        Args:
+            name (str): A description of the pull request, for the summary.
+            function (callable[callable]):
+                The function which submits the pull request. It is
+                given a function which retries each API call.
+
+        """
+        retry = functools.partial(call, attempts=self._attempts, pause=self._pause)
+        self._wait()
+
+        try:
+            function(retry)
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.exception('Pull request "%s" could not be submitted.', name)
+
+            with self._lock:
+                self._failed.append((name, error))
+
+            return
+
+        with self._lock:
+            self._submitted.append(name)
+
+    def _wait(self):
+        """Sleep until no rate limit is in effect."""
+        with self._lock:
+            delay = self._resume_time - time.time()
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def join(self):
+        """Wait for every pull request to be submitted.
+
+        Returns:
+            :attr:`Summary`:
+                The name of every submitted pull request and the name
+                and error of every pull request which failed.
+
+        """
+        self._workers.close()
+        self._workers.join()
+
+        with self._lock:
+            return Summary(sorted(self._submitted), sorted(self._failed, key=str))
+
+    def submit(self, name, function):
+        """Add a pull request to submit, in the background.
+
+        Args:
+            name (str): A description of the pull request, for the summary.
+            function (callable[callable]):
+                The function which submits the pull request. It is
+                given a function which retries each API call.
+
+        """
+        self._workers.apply_async(self._run, (name, function))
+
+
+def _get_retry_delay(error, attempt):
+    """Find how long to wait before trying a failed API call again.
+
+    Reference:
+        https://docs.github.com/en/rest/overview/resources-in-the-rest-api#rate-limiting
+
+    Args:
+        error (:class:`github3.exceptions.GitHubException`): The raised error.
+        attempt (int): The number of attempts that already failed, minus one.
+
+    Returns:
+        float or NoneType:
+            The seconds to wait. If `error` can't be fixed by trying
+            again, return None.
+
+    """
+    backoff = min(_MAXIMUM_DELAY, _BASE_DELAY * 2**attempt)
+
+    if isinstance(error, github3_exceptions.ConnectionError):
+        return backoff
+
+    response = getattr(error, "response", None)
+
+    if response is None:
+        return None
+
+    headers = response.headers
+
+    try:
+        # Secondary rate limits say exactly how long to wait
+        return float(headers["Retry-After"])
+    except (KeyError, ValueError):
+        pass
+
+    if headers.get("X-RateLimit-Remaining") == "0":
+        try:
+            return max(0.0, float(headers["X-RateLimit-Reset"]) - time.time()) + 1.0
+        except (KeyError, ValueError):
+            return backoff
+
+    if response.status_code in _TRANSIENT_STATUSES:
+        return backoff
+
+    return None
+
+
+@contextlib.contextmanager
+def activate(queue):
+    """Send every :func:`submit` call to `queue`, while in this context.
+
+    Args:
+        queue (:class:`SubmissionQueue`): The queue which submits pull requests.
+
+    Yields:
+        :class:`SubmissionQueue`: `queue`.
+
+    """
+    with _LOCK:
+        _ACTIVE_QUEUES.append(queue)
+
+    try:
+        yield queue
+    finally:
+        with _LOCK:
+            _ACTIVE_QUEUES.remove(queue)
+
+
+def call(function, attempts=_ATTEMPTS, pause=time.sleep):
+    """Call a function which uses the GitHub API, retrying if it fails.
+
+    Rate-limited calls are retried once the rate limit resets.
+    Connection errors and server errors are retried with an
+    exponential backoff. Any other error is raised immediately.
+
+    Args:
+        function (callable): The function to call. It takes no arguments.
+        attempts (int, optional): The most times to call `function`.
+        pause (callable[float], optional): The function used to wait.
+
+    Raises:
+        :class:`github3.exceptions.GitHubException`:
+            If `function` failed for the last time.
+
+    Returns:
+        object: Whatever `function` returns.
+
+    """
+    for attempt in range(attempts):
+        try:
+            return function()
+        except github3_exceptions.GitHubException as error:
+            delay = _get_retry_delay(error, attempt)
+
+            if delay is None or attempt + 1 >= attempts:
+                raise
+
+            _LOGGER.warning(
+                'API call failed with "%s". Trying again in %s seconds.', error, delay
+            )
+            pause(delay)
+
+    raise ValueError(
+        'Attempts "{attempts}" must be at least 1.'.format(attempts=attempts)
+    )
+
+
+def submit(name, function):
+    """Submit a pull request, in the background if a queue is active.
+
+    Args:
+        name (str): A description of the pull request, for the summary.
+        function (callable[callable]):
+            The function which submits the pull request. It is given
+            :func:`call`, to retry each API call.
+
+    Raises:
+        :class:`github3.exceptions.GitHubException`:
+            If no queue is active and `function` failed.
+
+    """
+    with _LOCK:
+        queue = _ACTIVE_QUEUES[-1] if _ACTIVE_QUEUES else None
+
+    if queue:
+        queue.submit(name, function)
+    else:
+        function(call)
@@ -0,0 +1,592 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""A local, indexed copy of every GitHub user, which is refreshed incrementally.
+
+Listing every GitHub user, with :func:`.github_link.get_all_users`, is
+very slow because each user's name, e-mail, and bio need a separate
+request. :class:`UserDirectory` saves those details to disk and indexes
+them by login, e-mail, and normalized name so that Rez package authors
+can be converted into GitHub logins with a few dictionary lookups.
+
+Whenever the saved users are older than the staleness window (see
+:func:`get_maximum_age`), they're refreshed. Only users which were added
+since the last refresh are listed and every known user is requested
+with its last ETag. GitHub replies "304 Not Modified" for unchanged
+users, which is fast and doesn't count against the API rate limit.
+
+Attributes:
+    MAXIMUM_AGE_VARIABLE (str):
+        The environment variable which, if defined, overrides how many
+        seconds saved users are used before they're refreshed.
+
+"""
+
+import collections
+import json
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import unicodedata
+
+import requests
+import six
+
+from .. import caching
+
+DEFAULT_MAXIMUM_AGE = 24 * 60 * 60  # One day, in seconds
+MAXIMUM_AGE_VARIABLE = "REZ_BATCH_PROCESS_USERS_MAXIMUM_AGE"
+
+_DIRECTORIES = dict()
+_EMAIL = re.compile(r"[\w.+\-]+@[\w\-]+(?:\.[\w\-]+)+", re.UNICODE)
+_FORMAT_VERSION = 1  # Increase this value whenever saved data is no longer valid
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+_PAGE_SIZE = 100
+_WORD = re.compile(r"[\w\-]+", re.UNICODE)
+
+User = collections.namedtuple("User", "login name email bio")
+
+
+class _Client(object):
+    """A minimal connection to the GitHub REST API which supports ETags."""
+
+    def __init__(self, token, base_url="", verify=True):
+        """Keep track of where and how to connect.
+
+        Args:
+            token (str):
+                The GitHub authentication token that will be used to get user data.
+            base_url (str, optional):
+                The API URL that goes with the given `token`. If you're not
+                using GitHub Enterprise, just leave this parameter blank.
+            verify (bool, optional):
+                If True, require a valid SSL certificate in private If
+                networks. If False, accept all external SSL certificates.
+                Default is True.
+
+        """
+        super(_Client, self).__init__()
+
+        self._session = requests.Session()
+        self._session.verify = verify
+        self._session.headers["Accept"] = "application/vnd.github.v3+json"
+
+        if token:
+            self._session.headers["Authorization"] = "token {token}".format(token=token)
+
+        self._url = get_api_url(base_url)
+
+    def get(self, path, etag="", parameters=None):
+        """Request some JSON data, unless it hasn't changed since `etag`.
+
+        Args:
+            path (str):
+                A path relative to the API URL, e.g. "/users", or an
+                absolute URL, e.g. the next page of a previous request.
+            etag (str, optional):
+                The ETag of the previous response for `path`, if any.
+            parameters (dict[str, object], optional):
+                Extra query parameters to include in the request.
+
+        Raises:
+            :class:`requests.HTTPError`: If the request failed.
+
+        Returns:
+            tuple[object or NoneType, str, str]:
+                The found data, its ETag, and the URL of the next page,
+                if any. If nothing changed since `etag`, the data is None.
+
+        """
+        if not path.startswith(("http://", "https://")):
+            path = self._url + path
+
+        headers = {"If-None-Match": etag} if etag else dict()
+        response = self._session.get(path, headers=headers, params=parameters)
+        next_url = response.links.get("next", dict()).get("url", "")
+
+        if response.status_code == 304:
+            return None, etag, next_url
+
+        response.raise_for_status()
+
+        return response.json(), response.headers.get("ETag", ""), next_url
+
+
+class UserDirectory(object):
+    """Every known GitHub user, saved to disk and indexed for quick look-ups."""
+
+    def __init__(self, path):
+        """Load any saved users.
+
+        Args:
+            path (str): The JSON file where users are saved between runs.
+
+        """
+        super(UserDirectory, self).__init__()
+
+        self._path = path
+        self._changed = False
+        self._data = _read(path)
+        self._emails = dict()
+        self._logins = dict()
+        self._names = dict()
+
+        self._update_indexes()
+
+    def _add_new_users(self, client, maximum):
+        """List every GitHub user which was added since the last refresh.
+
+        Args:
+            client (:class:`_Client`): The connection used to list users.
+            maximum (int): The most users this instance may contain.
+
+        Returns:
+            bool: If any user was added.
+
+        """
+        users = self._data["users"]
+        since = self._data["since"]
+        saved_since, etag = self._data["list_etag"]
+
+        if saved_since != since:
+            etag = ""
+
+        data, etag, next_url = client.get(
+            "/users", etag=etag, parameters={"since": since, "per_page": _PAGE_SIZE}
+        )
+        self._data["list_etag"] = [since, etag]
+        added = False
+
+        while data and len(users) < maximum:
+            for entry in data:
+                if len(users) >= maximum:
+                    break
+
+                self._data["since"] = max(self._data["since"], entry["id"])
+
+                if entry["login"] in users:
+                    continue
+
+                users[entry["login"]] = {
+                    "bio": "",
+                    "email": "",
+                    "etag": "",
+                    "fetched": 0,
+                    "login": entry["login"],
+                    "name": "",
+                }
+                added = True
+
+            if not next_url:
+                break
+
+            data, _, next_url = client.get(next_url)
+
+        return added
+
+    def _update_indexes(self):
+        """Re-build the login, e-mail, and name look-ups from every known user."""
+        names = collections.defaultdict(set)
+        self._emails = dict()
+        self._logins = dict()
+
+        for login, entry in self._data["users"].items():
+            self._logins[login.lower()] = login
+
+            if entry["email"]:
+                self._emails[entry["email"].lower()] = login
+
+            name = _normalize_name(entry["name"])
+
+            if name:
+                names[name].add(login)
+
+        # A name shared by several people can't be trusted to find anyone
+        self._names = {
+            name: next(iter(logins))
+            for name, logins in names.items()
+            if len(logins) == 1
+        }
+
+    @staticmethod
+    def _update_user(client, entry, now):
+        """Get the latest details of one GitHub user, if they changed.
+
+        Args:
+            client (:class:`_Client`): The connection used to get the user.
+            entry (dict[str, object]): The saved details of the user.
+            now (float): The current time, in seconds since epoch.
+
+        Returns:
+            bool: If the user's details changed.
+
+        """
+        data, etag, _ = client.get(
+            "/users/{entry[login]}".format(entry=entry), etag=entry["etag"]
+        )
+        entry["fetched"] = now
+
+        if data is None:
+            return False
+
+        entry["bio"] = data.get("bio") or ""
+        entry["email"] = data.get("email") or ""
+        entry["etag"] = etag
+        entry["name"] = data.get("name") or ""
+
+        return True
+
+    def find_login(self, author):
+        """Find the GitHub login of some Rez package author.
+
+        There's no established convention for Rez package author names.
+        Some people write their login, others their e-mail, others
+        their full name. Each is checked, in that order of confidence:
+
+        - Any e-mail address in `author`
+        - `author`, as a login
+        - `author`, as a full name. Capitalization, punctuation, accents
+          and word order are ignored. Names shared by several users are skipped
+        - Every word in `author`, as a login
+
+        Args:
+            author (str): Some text from a Rez package's `authors` attribute.
+
+        Returns:
+            str: The found GitHub login. If no user was found, return "".
+
+        """
+        for email in _EMAIL.findall(author):
+            login = self._emails.get(email.lower())
+
+            if login:
+                return login
+
+        text = _EMAIL.sub(" ", author)
+        login = self._logins.get(text.strip(" \t<>()[]@").lower())
+
+        if login:
+            return login
+
+        login = self._names.get(_normalize_name(text))
+
+        if login:
+            return login
+
+        for word in _WORD.findall(text):
+            login = self._logins.get(word.lower())
+
+            if login:
+                return login
+
+        return ""
+
+    def get_user(self, login):
+        """:class:`User` or NoneType: Find a user by their login."""
+        login = self._logins.get(login.lower())
+
+        if not login:
+            return None
+
+        entry = self._data["users"][login]
+
+        return User(entry["login"], entry["name"], entry["email"], entry["bio"])
+
+    def get_users(self):
+        """list[:class:`User`]: Get every known user, sorted by login."""
+        return [self.get_user(login) for login in sorted(self._data["users"])]
+
+    def is_stale(self, maximum_age):
+        """bool: Check if the users were refreshed over `maximum_age` seconds ago."""
+        return time.time() - self._data["refreshed"] >= maximum_age
+
+    def refresh(self, client, maximum_age=DEFAULT_MAXIMUM_AGE, maximum=sys.maxsize):
+        """Add new GitHub users and update every user older than `maximum_age`.
+
+        Args:
+            client (:class:`_Client`): The connection used to get users.
+            maximum_age (float, optional):
+                Users fetched less than this many seconds ago aren't
+                requested again. If 0, every user is requested again.
+            maximum (int, optional):
+                The most users to keep track of. Set this value low to
+                avoid long wait times.
+
+        Raises:
+            :class:`requests.RequestException`:
+                If the connection failed. Every user found up until
+                that point is kept.
+
+        Returns:
+            bool: If any user was added or changed.
+
+        """
+        self._changed = True
+        now = time.time()
+
+        try:
+            changed = self._add_new_users(client, maximum)
+
+            for login in sorted(self._data["users"]):
+                entry = self._data["users"][login]
+
+                if now - entry["fetched"] >= maximum_age:
+                    changed = self._update_user(client, entry, now) or changed
+        finally:
+            self._update_indexes()
+
+        self._data["refreshed"] = now
+
+        return changed
+
+    def save(self):
+        """Write every known user to disk, if anything changed."""
+        if not self._changed:
+            return
+
+        directory = os.path.dirname(self._path)
+
+        try:
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory)
+
+            descriptor, temporary = tempfile.mkstemp(
+                dir=directory or None, suffix=".json"
+            )
+
+            with os.fdopen(descriptor, "w") as handler:
+                json.dump(self._data, handler)
+
+            # Renaming is atomic so other processes never read a partial file
+            os.rename(temporary, self._path)
+        except (IOError, OSError) as error:
+            _LOGGER.warning(
+                'Users "%s" could not be saved. Error: "%s".', self._path, error
+            )
+
+            return
+
+        self._changed = False
+
+
+def _get_empty_data():
+    """dict[str, object]: The saved data of a directory with no users."""
+    return {
+        "format": _FORMAT_VERSION,
+        "list_etag": [0, ""],
+        "refreshed": 0,
+        "since": 0,
+        "users": dict(),
+    }
+
+
+def _normalize_name(text):
+    """Simplify a person's name so that different spellings of it match.
+
+    Example:
+        >>> _normalize_name("Doe, Jöhn")
+        "doe john"
+
+    Args:
+        text (str): Some name to simplify.
+
+    Returns:
+        str: The simplified name.
+
+    """
+    text = unicodedata.normalize("NFKD", six.ensure_text(text))
+    text = "".join(
+        character for character in text if not unicodedata.combining(character)
+    )
+
+    return " ".join(
+        sorted(word.lower() for word in re.findall(r"\w+", text, re.UNICODE))
+    )
+
+
+def _read(path):
+    """Get the saved users of a directory.
+
+    Files written by older versions of ``make-git-users`` (a list of
+    users) are read too. They're refreshed on first use.
+
+    Args:
+        path (str): The absolute path to a JSON file which may not exist yet.
+
+    Returns:
+        dict[str, object]: The found data.
+
+    """
+    output = _get_empty_data()
+
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return output
+
+    if isinstance(data, list):
+        for user in data:
+            output["users"][user["login"]] = {
+                "bio": user.get("bio") or "",
+                "email": user.get("email") or "",
+                "etag": "",
+                "fetched": 0,
+                "login": user["login"],
+                "name": user.get("name") or "",
+            }
+
+        return output
+
+    if not isinstance(data, dict) or data.get("format") != _FORMAT_VERSION:
+        return output
+
+    return data
+
+
+def clear_cache():
+    """Forget every loaded directory, so that they're read from disk again."""
+    with _LOCK:
+        _DIRECTORIES.clear()
+
+
+def get_api_url(base_url=""):
+    """Get the REST API URL of GitHub or a GitHub Enterprise instance.
+
+    Args:
+        base_url (str, optional):
+            The URL of a GitHub Enterprise instance. If you're not
+            using GitHub Enterprise, just leave this parameter blank.
+
+    Returns:
+        str: The found URL, without a trailing "/".
+
+    """
+    if not base_url:
+        return "https://api.github.com"
+
+    # Reference: https://pygithub.readthedocs.io/en/latest/introduction.html#very-short-tutorial
+    enterprise_suffix = "/api/v3"
+    base_url = base_url.rstrip("/")
+
+    if base_url.endswith(enterprise_suffix):
+        return base_url
+
+    return base_url + enterprise_suffix
+
+
+def get_default_path():
+    """str: The file where users are saved, if the user doesn't choose one."""
+    return os.path.join(caching.get_directory(), "github_users.json")
+
+
+def get_directory(path="", token="", base_url="", verify=True, maximum_age=None):
+    """Load the users saved in `path` and refresh them if they're stale.
+
+    Each directory is loaded and refreshed once per-process. If the
+    refresh fails, the saved users are used as-is.
+
+    Args:
+        path (str, optional):
+            The JSON file where users are saved between runs.
+            Default: :func:`get_default_path`.
+        token (str, optional):
+            The GitHub authentication token that will be used to get
+            user data. If not provided, users are never refreshed.
+        base_url (str, optional):
+            The API URL that goes with the given `token`. If you're not
+            using GitHub Enterprise, just leave this parameter blank.
+        verify (bool, optional):
+            If True, require a valid SSL certificate in private If
+            networks. If False, accept all external SSL certificates.
+            Default is True.
+        maximum_age (float, optional):
+            How many seconds saved users are used before they're
+            refreshed. Default: :func:`get_maximum_age`.
+
+    Returns:
+        :class:`UserDirectory`: The found users.
+
+    """
+    path = path or get_default_path()
+
+    if maximum_age is None:
+        maximum_age = get_maximum_age()
+
+    with _LOCK:
+        if path in _DIRECTORIES:
+            return _DIRECTORIES[path]
+
+        directory = UserDirectory(path)
+
+        if token and directory.is_stale(maximum_age):
+            try:
+                directory.refresh(
+                    _Client(token, base_url=base_url, verify=verify),
+                    maximum_age=maximum_age,
+                )
+            except requests.RequestException as error:
+                _LOGGER.warning(
+                    'GitHub users could not be refreshed. Error: "%s".',
+                    error,
+                )
+
+            directory.save()
+
+        _DIRECTORIES[path] = directory
+
+        return directory
+
+
+def get_maximum_age():
+    """float: How many seconds saved users are used before they're refreshed."""
+    try:
+        return float(os.environ[MAXIMUM_AGE_VARIABLE])
+    except (KeyError, ValueError):
+        return DEFAULT_MAXIMUM_AGE
+
+
+def refresh(path, token, base_url="", verify=True, maximum_age=0, maximum=sys.maxsize):
+    """Add new GitHub users to a directory and update any user that changed.
+
+    Args:
+        path (str): The JSON file where users are saved between runs.
+        token (str):
+            The GitHub authentication token that will be used to get user data.
+        base_url (str, optional):
+            The API URL that goes with the given `token`. If you're not
+            using GitHub Enterprise, just leave this parameter blank.
+        verify (bool, optional):
+            If True, require a valid SSL certificate in private If
+            networks. If False, accept all external SSL certificates.
+            Default is True.
+        maximum_age (float, optional):
+            Users fetched less than this many seconds ago aren't
+            requested again. If 0, every user is requested again.
+        maximum (int, optional):
+            The most users to keep track of.
+
+    Returns:
+        :class:`UserDirectory`: The refreshed users.
+
+    """
+    directory = UserDirectory(path)
+
+    try:
+        directory.refresh(
+            _Client(token, base_url=base_url, verify=verify),
+            maximum_age=maximum_age,
+            maximum=maximum,
+        )
+    finally:
+        directory.save()
+
+    with _LOCK:
+        _DIRECTORIES[path] = directory
+
+    return directory
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Give each Rez package its own, separate checkout of a shared git repository.
+
+Before, every Rez package of a repository was modified in the same
+clone, one-by-one, and the clone was reset and cleaned in between.
+Instead, :func:`add` creates a `git worktree`_ per Rez package. Every
+worktree shares the clone's objects and branches but has its own
+files, index, and HEAD. So Rez packages of the same repository can be
+modified, committed, and pushed at the same time and the clone itself
+is never modified.
+
+Example:
+    >>> tree = add(repository, "/tmp/clone/rez_lint")
+    >>> modify(tree)
+
+Call :func:`remove` once a worktree is no longer needed. If a
+worktree's folder is deleted some other way, git forgets about it the
+next time :func:`add` is called.
+
+.. _git worktree: https://git-scm.com/docs/git-worktree
+
+"""
+
+import logging
+import os
+import tempfile
+import threading
+
+import git
+
+from . import cloner
+
+_BASES = dict()  # worktree root -> the branch it was created from
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+
+
+def _normalize(path):
+    """str: Make `path` comparable to other paths."""
+    return os.path.normcase(os.path.realpath(path))
+
+
+def add(repository, folder, directory=""):
+    """Check out the current branch of `repository` into a new, temporary worktree.
+
+    The worktree's HEAD is detached so that the same branch can be
+    used by many worktrees at once. If `repository` is a sparse
+    checkout, the worktree only checks out `folder` and the Rez package
+    definition files.
+
+    Args:
+        repository (:class:`git.Repo`):
+            A cloned git repository, which has some branch checked out.
+        folder (str):
+            The absolute path to a folder within `repository` which
+            must be checked out. Usually, it's the root of a Rez package.
+        directory (str, optional):
+            The folder where the worktree will be created. If no folder
+            is given, the worktree is created in the system's temporary
+            directory. Default: "".
+
+    Returns:
+        :class:`git.Repo`: The created worktree.
+
+    """
+    base = repository.active_branch.name
+    sparse = cloner.is_sparse(repository)
+    directory = tempfile.mkdtemp(suffix="_worktree", dir=directory or None)
+    arguments = ["add", "--detach"]
+
+    if sparse:
+        arguments.append("--no-checkout")
+
+    # `git worktree add` edits files in the shared git folder
+    with _LOCK:
+        # Forget deleted worktrees. Otherwise, their branches can't be checked out
+        repository.git.worktree("prune")
+        repository.git.worktree(*(arguments + [directory, base]))
+
+    tree = git.Repo(directory)
+
+    if sparse:
+        cloner.make_sparse(tree)
+        cloner.include_folders(
+            tree,
+            [os.path.join(directory, os.path.relpath(folder, repository.working_dir))],
+        )
+
+    with _LOCK:
+        _BASES[_normalize(tree.working_dir)] = base
+
+    _LOGGER.debug('Created worktree "%s" from branch "%s".', directory, base)
+
+    return tree
+
+
+def get_base_branch(repository):
+    """Find the branch that a worktree, created by :func:`add`, was checked out from.
+
+    Args:
+        repository (:class:`git.Repo`): Some git repository or worktree.
+
+    Returns:
+        str: The found branch name. If `repository` isn't a worktree, return "".
+
+    """
+    with _LOCK:
+        return _BASES.get(_normalize(repository.working_dir), "")
+
+
+def remove(repository, tree):
+    """Delete a worktree which was created by :func:`add`.
+
+    Any uncommitted changes in the worktree are deleted too.
+
+    Args:
+        repository (:class:`git.Repo`):
+            The cloned git repository which `tree` was created from.
+        tree (str):
+            The absolute path to the root folder of the worktree.
+
+    """
+    # `git worktree remove` edits files in the shared git folder
+    with _LOCK:
+        repository.git.worktree("remove", "--force", tree)
+        _BASES.pop(_normalize(tree), None)
+
+    _LOGGER.debug('Removed worktree "%s".', tree)
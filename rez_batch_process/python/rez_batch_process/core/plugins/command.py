@@ -15,20 +15,40 @@ import collections
 import contextlib
 import logging
 import os
-import shlex
 import subprocess
 import textwrap
+import threading
 
-import wurlitzer
+import git
 from git import exc
 from github3 import exceptions as github3_exceptions
 from rez_utilities import finder
 
-from .. import exceptions, rez_git
-from ..gitter import base_adapter, git_link, git_registry
+from .. import checkpoint, exceptions, rez_git, tracing
+from ..gitter import (
+    base_adapter,
+    git_link,
+    git_registry,
+    status,
+    submission,
+    worktree,
+)
 from . import base
 
 _LOGGER = logging.getLogger(__name__)
+# Any of these flags means that git didn't update the remote branch
+_PUSH_FAILURES = (
+    git.PushInfo.ERROR
+    | git.PushInfo.REJECTED
+    | git.PushInfo.REMOTE_FAILURE
+    | git.PushInfo.REMOTE_REJECTED
+)
+# Worktrees of a repository share its remote branches. git can't update
+# the same remote branch from two worktrees at once. Different
+# repositories don't share anything so they each get their own lock.
+#
+_PULL_LOCKS = collections.defaultdict(threading.Lock)  # git folder -> lock
+_PULL_LOCKS_LOCK = threading.Lock()
 Configuration = collections.namedtuple(
     "Configuration", "command token pull_request_name ssl_no_verify assignee"
 )
@@ -109,10 +129,11 @@ class RezShellCommand(base.BaseCommand):
         )
         _LOGGER.debug('Command to run "%s".', command)
 
-        process = subprocess.Popen(
-            command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-        )
-        stdout, stderr = process.communicate()
+        with tracing.span("run_command", package=package.name):
+            process = subprocess.Popen(
+                command, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+            stdout, stderr = process.communicate()
         _LOGGER.debug('stdout "%s".', stdout)
 
         if stderr:
@@ -132,7 +153,10 @@ class RezShellCommand(base.BaseCommand):
 
             return message
 
-        if not has_changes(package):
+        with tracing.span("has_changes", package=package.name):
+            changed = has_changes(package)
+
+        if not changed:
             return (
                 'Command "{arguments.command}" ran but nothing on-disk changed. '
                 "No PR is needed!".format(arguments=arguments)
@@ -162,12 +186,11 @@ class RezShellCommand(base.BaseCommand):
                 connect to GitHub / bitbucket, and a string prefix to
                 use for creating the pull requests.
             cached_users (str, optional):
-                The path to the cached remote users, if one exists.
+                The path where remote users are saved between runs.
                 Basically, querying users in sites like GitHub
                 takes a ton of time, which causes re-running
-                ``rez_batch_process`` to be very slow. This
-                parameter lets you cache the so user data doesn't need
-                to be queried over and over.
+                ``rez_batch_process`` to be very slow. Users saved in
+                this file are only queried again once they're stale.
             fallback_reviewers (list[str]):
                 The usernames of people who will be assigned to pull
                 requests if there are not enough people to review the change.
@@ -188,7 +211,15 @@ class RezShellCommand(base.BaseCommand):
             fallback_reviewers = []
 
         repository = rez_git.get_repository(package)
-        current_branch = repository.active_branch
+        base_branch = worktree.get_base_branch(repository)
+
+        if base_branch:
+            # Each package gets its own worktree, which is never re-used
+            # for another package, so its branch never needs to be reset
+            current_branch = None
+        else:
+            current_branch = repository.active_branch
+            base_branch = current_branch.name
 
         url = rez_git.get_repository_url_from_repository(repository)
         adapter = git_registry.get_remote_adapter(
@@ -218,64 +249,81 @@ class RezShellCommand(base.BaseCommand):
             pull_request_name += "_{package.name}"
 
         branch_template = pull_request_name.format(package=package)
+        journal = checkpoint.get_active()
+        # Re-use the branch of an interrupted run, instead of making a duplicate
+        resumed_branch = journal.get_branch(package.name) if journal else ""
 
         with _reset_repository_state(repository, current_branch):
             origin = repository.remote(name="origin")
-            origin.pull(current_branch)
 
-            new_branch_name = _get_unique_branch(repository, branch_template)
-            new_branch = repository.create_head(new_branch_name)
+            with _get_pull_lock(repository), tracing.span("pull", package=package.name):
+                origin.pull(base_branch)
+
+            new_branch_name = resumed_branch or _get_unique_branch(
+                repository, branch_template
+            )
+            new_branch = repository.create_head(
+                new_branch_name, force=bool(resumed_branch)
+            )
             new_branch.checkout()
 
-            git_link.add_everything_in_repository(repository)
-            repository.index.commit(commit_message)
+            with tracing.span("commit", package=package.name):
+                git_link.add_everything_in_repository(repository)
+                repository.index.commit(commit_message)
+
             origin = repository.remote(name="origin")
 
-            with wurlitzer.pipes() as pipes:
-                try:
-                    origin.push(
-                        refspec="{new_branch.name}:{new_branch.name}".format(
-                            new_branch=new_branch
-                        )
-                    )
-                except exc.GitCommandError as error:
-                    if error.status == 128:
-                        _LOGGER.exception('Package "%s" could not be pushed.', package)
-                        _LOGGER.error(
-                            'Check to make sure you have access to "%s".', url
-                        )
-
-                        raise
-                    if (
-                        error.status != 403
-                    ):  # Some other error other than a permissions error
-                        raise
-
-                    # Push was forbidden
-                    # TODO : Do something better than just a log + return here
+            refspec = "{new_branch.name}:{new_branch.name}".format(
+                new_branch=new_branch
+            )
+
+            if resumed_branch:
+                refspec = "+" + refspec  # Replace whatever was pushed before
+
+            try:
+                with tracing.span("push", package=package.name):
+                    results = origin.push(refspec=refspec)
+            except exc.GitCommandError as error:
+                if error.status == 128:
                     _LOGGER.exception('Package "%s" could not be pushed.', package)
+                    _LOGGER.error('Check to make sure you have access to "%s".', url)
 
-                    return
+                    raise
+                if (
+                    error.status != 403
+                ):  # Some other error other than a permissions error
+                    raise
 
-            stdout, stderr = pipes
+                # Push was forbidden
+                # TODO : Do something better than just a log + return here
+                _LOGGER.exception('Package "%s" could not be pushed.', package)
 
-            if "error: failed to push some refs to " in stdout.read():
-                raise RuntimeError(
-                    'Could not push to "{new_branch}".'.format(new_branch=new_branch)
-                )
-            elif stderr.read():
-                raise RuntimeError(stderr)
+                return
+
+            _validate_push(results, new_branch)
+
+            if journal:
+                journal.record(package.name, checkpoint.PUSHED, branch=new_branch.name)
+
+            details = base_adapter.PullRequestDetails(url, new_branch.name, base_branch)
+
+            def _submit(retry):
+                with tracing.span("create_pull_request", package=package.name):
+                    adapter.create_pull_request(
+                        title,
+                        body,
+                        details,
+                        user_data=cached_users,
+                        assignee=configuration.assignee,
+                        retry=retry,
+                    )
+
+                if journal:
+                    journal.record(package.name, checkpoint.SUBMITTED)
 
             try:
-                adapter.create_pull_request(
-                    title,
-                    body,
-                    base_adapter.PullRequestDetails(
-                        url, new_branch.name, current_branch.name
-                    ),
-                    user_data=cached_users,
-                    assignee=configuration.assignee,
-                )
+                # If a queue is active, this returns before the pull request is made
+                submission.submit(package.name, _submit)
             except github3_exceptions.UnprocessableEntity as error:
                 _LOGGER.exception(
                     "Pull request could not be completed. It's ususally a permissions error."
@@ -374,8 +422,8 @@ class RezShellCommand(base.BaseCommand):
 def has_changes(package):
     """Check if a Rez package is part of a git repository that has uncommitted or untracked changes.
 
-    Reference:
-        https://unix.stackexchange.com/a/155077
+    Only the package's folder is given to ``git status`` so that large
+    repositories aren't walked in full, once per Rez package.
 
     Args:
         package (:class:`rez.packages_.Package`):
@@ -383,20 +431,13 @@ def has_changes(package):
             or is itself inside of a git repository.
 
     Returns:
-        bool: If `package` has no changes.
+        bool: If `package` has changes.
 
     """
     repository = rez_git.get_repository(package)
-    relative_path = os.path.relpath(
-        finder.get_package_root(package), repository.working_dir
-    )
-    command = shlex.split(
-        'git status --porcelain -- "{relative_path}"'.format(
-            relative_path=relative_path
-        )
-    )
+    root = finder.get_package_root(package)
 
-    return bool(repository.git.execute(command))
+    return status.Snapshot(repository, paths=[root]).has_changes(root)
 
 
 def add_git_arguments(parser):
@@ -427,8 +468,10 @@ def add_git_arguments(parser):
     parser.add_argument(
         "-c",
         "--cached-users",
-        help="A file that contains GitHub/bitbucket/etc usernames, "
-        "emails, and login info. Must be a JSON file.",
+        help="A JSON file where GitHub/bitbucket/etc usernames, emails, and "
+        "login info are saved between runs. They're refreshed once they are older "
+        "than $REZ_BATCH_PROCESS_USERS_MAXIMUM_AGE seconds (default: 1 day). "
+        "Default: ~/.cache/rez_batch_process/github_users.json.",
     )
     parser.add_argument(
         "-b",
@@ -441,6 +484,13 @@ def add_git_arguments(parser):
     )
 
 
+def _get_pull_lock(repository):
+    """:class:`threading.Lock`: Get the lock shared by every worktree of `repository`."""
+    # Every worktree of a clone has the same "common" .git folder
+    with _PULL_LOCKS_LOCK:
+        return _PULL_LOCKS[os.path.normpath(repository.common_dir)]
+
+
 def _get_unique_branch(repository, base_branch_name):
     """Get a git branch name that has not been used before by a repository.
 
@@ -487,7 +537,9 @@ def _reset_repository_state(repository, branch):
 
     Args:
         repository (:class:`git.Repo`): A cloned git repository on-disk to revert.
-        branch (:class:`git.Head`): The default (usually master) branch of `repository`.
+        branch (:class:`git.Head` or NoneType):
+            The default (usually master) branch of `repository`. If
+            None, `repository` is a temporary worktree which is left as-is.
 
     Yields:
         NoneType: Return the state of this context back to the user.
@@ -496,8 +548,37 @@ def _reset_repository_state(repository, branch):
     try:
         yield
     finally:
-        repository.head.reset(  # Make sure there are no uncommitted changes
-            index=True, working_tree=True
+        if branch:
+            repository.head.reset(  # Make sure there are no uncommitted changes
+                index=True, working_tree=True
+            )
+            repository.git.clean("-df")  # Delete all untracked files and folders
+            branch.checkout()
+
+
+def _validate_push(results, branch):
+    """Make sure that git pushed a branch to its remote.
+
+    Args:
+        results (iter[:class:`git.PushInfo`]):
+            What happened to each ref which was pushed.
+        branch (:class:`git.Head`): The branch which was pushed.
+
+    Raises:
+        RuntimeError: If git couldn't push or the remote rejected the push.
+
+    """
+    results = list(results)
+
+    if not results:
+        raise RuntimeError(
+            'Could not push to "{branch}". Git reported nothing.'.format(branch=branch)
         )
-        repository.git.clean("-df")  # Delete all untracked files and folders
-        branch.checkout()
+
+    for result in results:
+        if result.flags & _PUSH_FAILURES:
+            raise RuntimeError(
+                'Could not push to "{branch}". Got "{summary}".'.format(
+                    branch=branch, summary=result.summary.strip()
+                )
+            )
@@ -10,7 +10,7 @@ from python_compatibility.sphinx import conf_manager
 from rez_utilities import finder, inspection
 
 from .. import exceptions, rez_git
-from ..gitter import git_link
+from ..gitter import clone_cache, remote_tree
 
 
 def _is_keep_temporary_files_enabled():
@@ -30,14 +30,31 @@ def _is_keep_temporary_files_enabled():
     return namespace.keep_temporary_files
 
 
+def _get_cache_directory():
+    """str: The folder, if any, where bare git repositories are cached between runs."""
+    user_input = sys.argv[1:]
+    parser = argparse.ArgumentParser()
+
+    parser.add_argument(
+        "--cache-directory",
+        default="",
+        help="A folder on-disk which keeps a copy of every git repository.",
+    )
+
+    namespace, _ = parser.parse_known_args(user_input)
+
+    return namespace.cache_directory
+
+
 def _get_temporary_directory():
-    """str: The folder, if any, where temporary repositories will be cloned to."""
+    """str: The folder, if any, where git repositories are cloned to."""
     user_input = sys.argv[1:]
     parser = argparse.ArgumentParser()
 
     parser.add_argument(
         "-t",
         "--temporary-directory",
+        default="",
         help="A folder on-disk that will be used to clone git repositories.",
     )
 
@@ -59,9 +76,9 @@ def has_documentation(package):
     Built Rez packages may not actually have documentation installed
     with the package. So if documentation is missing, you have to
     check the repository that the package came from to be totally
-    sure. You can clone the repository and check it locally or check
-    the repository remotely (doing it remotely is much faster but is
-    also more complex).
+    sure. Only the file names of the repository are cloned (see
+    :mod:`.remote_tree`), whatever ``--clone-mode`` is, because every
+    clone mode downloads more than that.
 
     Source Rez packages however contain 100% of the package
     definition plus its documentation configuration files. So
@@ -97,11 +114,19 @@ def has_documentation(package):
             "A built Rez package was found but it has no git repository.",
         )
 
-    keep = _is_keep_temporary_files_enabled()
-    directory = _get_temporary_directory()
+    cache_directory = _get_cache_directory()
+    cache = None
+
+    if cache_directory:
+        cache = clone_cache.CloneCache(cache_directory)
 
-    remote_file = git_link.has_package_conf(
-        repository, package.name, directory=directory, keep=keep
+    # Only the repository's file names are needed, not a checkout
+    remote_file = remote_tree.has_package_conf(
+        repository,
+        package.name,
+        cache=cache,
+        keep=_is_keep_temporary_files_enabled(),
+        directory=_get_temporary_directory(),
     )
 
     if remote_file:
@@ -132,12 +157,13 @@ def get_default_latest_packages(paths=None):
             Default: :attr:`rez.config.config.packages_path`.
 
     Returns:
-        tuple[:class:`rez.packages_.Package`, list, list]:
+        tuple[iter[:class:`rez.packages_.Package`], list, list]:
             All of the found Rez packages and a list of any Rez package
             that was considered invalid or any Rez packages that were
-            valid but must be skipped, for some reason.
+            valid but must be skipped, for some reason. The Rez packages
+            are found lazily, while they are iterated over.
 
     """
-    packages = list(inspection.iter_latest_packages(paths=paths))
+    packages = inspection.iter_latest_packages(paths=paths)
 
     return packages, [], []
@@ -3,8 +3,11 @@
 
 """Functions for querying git repository information from Rez packges."""
 
+import collections
 import logging
 import os
+import threading
+import time
 
 import git
 from git import exc
@@ -12,7 +15,12 @@ from rez_utilities import finder
 
 from . import exceptions
 
+_CACHE_LOCK = threading.Lock()
 _LOGGER = logging.getLogger(__name__)
+_PACKAGE_ROOTS = dict()  # Rez package root -> git repository root (or None)
+_REPOSITORIES = dict()  # git repository root -> :class:`git.Repo`
+_REPOSITORY_URLS = dict()  # git repository root -> remote URL
+_STATISTICS = collections.Counter()
 
 
 def _guess_repository_from_symlinks(directory):
@@ -65,6 +73,187 @@ def _guess_repository_from_symlinks(directory):
     return git.Repo(real_path, search_parent_directories=True)
 
 
+def _find_known_repository_root(directory):
+    """Find the root of an already-resolved git repository which contains `directory`.
+
+    Args:
+        directory (str): The absolute path to some folder on-disk.
+
+    Returns:
+        str: The found repository root, if any.
+
+    """
+    known = set(root for root in _PACKAGE_ROOTS.values() if root)
+    previous = None
+
+    while directory and directory != previous:
+        if os.path.exists(os.path.join(directory, ".git")):
+            # The nearest repository is the only one that counts. If
+            # it's not known yet, it must be resolved from scratch.
+            #
+            return directory if directory in known else ""
+
+        previous = directory
+        directory = os.path.dirname(directory)
+
+    return ""
+
+
+def _get_repository(root):
+    """Get the git repository of some folder, re-using it if it was loaded before.
+
+    Args:
+        root (str): The root folder of a git repository or worktree.
+
+    Returns:
+        :class:`git.Repo`: The loaded repository.
+
+    """
+    with _CACHE_LOCK:
+        if root not in _REPOSITORIES:
+            _REPOSITORIES[root] = git.Repo(root)
+
+        return _REPOSITORIES[root]
+
+
+def _get_working_directory(repository):
+    """Close a repository which was only needed to find its root folder.
+
+    Args:
+        repository (:class:`git.Repo`): Some git repository or worktree.
+
+    Returns:
+        str: The root folder of `repository`.
+
+    """
+    root = repository.working_dir
+    # Otherwise its `git cat-file` processes may stay alive until garbage collection
+    repository.close()
+
+    return root
+
+
+def _get_repository_root(package, path):
+    """Find the root folder of the git repository which `package` comes from.
+
+    The result is cached so that every Rez package in the same
+    repository only needs to be resolved once.
+
+    Args:
+        package (:class:`rez.packages_.Package`):
+            The object that should either have a git repository defined
+            or is itself inside of a git repository.
+        path (str):
+            The root folder of `package`.
+
+    Raises:
+        :class:`.exceptions.NoGitRepository:
+            If `package` is not from a git repository.
+
+    Returns:
+        str: The found repository folder.
+
+    """
+    with _CACHE_LOCK:
+        if path not in _PACKAGE_ROOTS:
+            root = _find_known_repository_root(path)
+
+            if root:
+                _PACKAGE_ROOTS[path] = root
+
+        if path in _PACKAGE_ROOTS:
+            _STATISTICS["hits"] += 1
+            root = _PACKAGE_ROOTS[path]
+
+            if not root:
+                raise exceptions.NoGitRepository(
+                    package, path, "is not in a Git repository."
+                )
+
+            return root
+
+        _STATISTICS["misses"] += 1
+
+    try:
+        root = _get_working_directory(git.Repo(path, search_parent_directories=True))
+    except exc.InvalidGitRepositoryError:  # pylint: disable=no-member
+        start = time.time()
+
+        try:
+            root = _get_working_directory(_guess_repository_from_symlinks(path))
+        except (
+            RuntimeError,
+            exc.InvalidGitRepositoryError,  # pylint: disable=no-member
+        ):
+            root = None
+
+        with _CACHE_LOCK:
+            _STATISTICS["symlink_traces"] += 1
+            _STATISTICS["symlink_seconds"] += time.time() - start
+
+    with _CACHE_LOCK:
+        _PACKAGE_ROOTS[path] = root
+
+    if not root:
+        raise exceptions.NoGitRepository(package, path, "is not in a Git repository.")
+
+    return root
+
+
+def clear_cache():
+    """Forget every repository that was found by :func:`get_repository_url`."""
+    with _CACHE_LOCK:
+        repositories = list(_REPOSITORIES.values())
+        _PACKAGE_ROOTS.clear()
+        _REPOSITORIES.clear()
+        _REPOSITORY_URLS.clear()
+        _STATISTICS.clear()
+
+    for repository in repositories:
+        repository.close()
+
+
+def forget_repository(root):
+    """Close a git repository or worktree and forget everything about it.
+
+    Every :class:`git.Repo` that has read objects keeps ``git cat-file``
+    processes alive. Call this once a worktree is no longer needed so
+    that a long run doesn't run out of processes or file descriptors.
+
+    Args:
+        root (str): The root folder of a git repository or worktree.
+
+    """
+    with _CACHE_LOCK:
+        repository = _REPOSITORIES.pop(root, None)
+        _REPOSITORY_URLS.pop(root, None)
+
+        for path, found in list(_PACKAGE_ROOTS.items()):
+            if found == root:
+                del _PACKAGE_ROOTS[path]
+
+    if repository:
+        repository.close()
+
+
+def get_statistics():
+    """Get details about how well repository look-ups are being cached.
+
+    Returns:
+        dict[str, int or float]:
+            "hits" - The number of look-ups that didn't need to query git.
+            "misses" - The number of look-ups that did.
+            "symlink_traces" - How many times symlinks were searched for a repository.
+            "symlink_seconds" - The total time spent searching symlinks.
+
+    """
+    with _CACHE_LOCK:
+        output = {"hits": 0, "misses": 0, "symlink_traces": 0, "symlink_seconds": 0.0}
+        output.update(_STATISTICS)
+
+        return output
+
+
 def get_repository(package):
     """Get the git repository of a Rez package.
 
@@ -84,7 +273,8 @@ def get_repository(package):
     Returns:
         :class:`git.Repo`:
             The git repository, if found. This function will either
-            always return something or error out.
+            always return something or error out. Rez packages in the
+            same repository or worktree share the same object.
 
     """
     path = finder.get_package_root(package)
@@ -92,18 +282,7 @@ def get_repository(package):
     if not path:
         raise exceptions.InvalidPackage(package, path, "no path on-disk.")
 
-    try:
-        return git.Repo(path, search_parent_directories=True)
-    except exc.InvalidGitRepositoryError:  # pylint: disable=no-member
-        try:
-            return _guess_repository_from_symlinks(path)
-        except (
-            RuntimeError,
-            exc.InvalidGitRepositoryError,  # pylint: disable=no-member
-        ):
-            raise exceptions.NoGitRepository(
-                package, path, "is not in a Git repository."
-            )
+    return _get_repository(_get_repository_root(package, path))
 
 
 def get_repository_url_from_repository(repository):
@@ -174,6 +353,22 @@ def get_repository_url(package):
     ):
         pass
 
-    repository = get_repository(package)
+    path = finder.get_package_root(package)
+
+    if not path:
+        raise exceptions.InvalidPackage(package, path, "no path on-disk.")
+
+    root = _get_repository_root(package, path)
+
+    with _CACHE_LOCK:
+        url = _REPOSITORY_URLS.get(root)
+
+    if url:
+        return url
+
+    url = get_repository_url_from_repository(_get_repository(root))
+
+    with _CACHE_LOCK:
+        _REPOSITORY_URLS[root] = url
 
-    return get_repository_url_from_repository(repository)
+    return url
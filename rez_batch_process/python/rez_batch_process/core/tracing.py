@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how long each phase of a run takes, per Rez package and repository.
+
+Code marks each phase with :func:`span`. If no :class:`Tracer` is
+active, :func:`span` does nothing. Otherwise, every span is recorded
+and can be written as a `Chrome trace-event`_ JSON file, which
+chrome://tracing and https://ui.perfetto.dev can display, or summed
+into a table of phases.
+
+Example:
+    >>> tracer = Tracer()
+    >>> with activate(tracer):
+    ...     with span("clone", repository="git@github.com:foo/bar.git"):
+    ...         clone()
+    >>> tracer.write("/tmp/trace.json")
+
+.. _Chrome trace-event: https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU
+
+"""
+
+import collections
+import contextlib
+import json
+import os
+import threading
+import time
+
+_ACTIVE_TRACERS = []
+_LOCK = threading.Lock()
+_Span = collections.namedtuple("_Span", "name start duration thread arguments")
+Total = collections.namedtuple("Total", "name count duration")
+
+
+class Tracer(object):
+    """Record every phase of a run, across every thread."""
+
+    def __init__(self):
+        """Start with no recorded phases."""
+        super(Tracer, self).__init__()
+
+        self._lock = threading.Lock()
+        self._spans = []
+        self._threads = dict()
+
+    def add(self, name, start, duration, arguments=None):
+        """Record a finished phase, from the current thread.
+
+        Args:
+            name (str): The name of the phase. e.g. "clone".
+            start (float): When the phase started, in seconds since epoch.
+            duration (float): How many seconds the phase took.
+            arguments (dict[str, str], optional):
+                Any details of the phase. e.g. {"package": "rez_lint"}.
+
+        """
+        thread = threading.current_thread()
+
+        with self._lock:
+            self._threads[thread.ident] = thread.name
+            self._spans.append(
+                _Span(name, start, duration, thread.ident, arguments or dict())
+            )
+
+    def get_totals(self):
+        """Sum up the time spent in each phase.
+
+        Returns:
+            list[:attr:`Total`]:
+                Every phase, its number of spans, and total seconds,
+                sorted from slowest to fastest.
+
+        """
+        counts = collections.Counter()
+        durations = collections.Counter()
+
+        with self._lock:
+            for span_ in self._spans:
+                counts[span_.name] += 1
+                durations[span_.name] += span_.duration
+
+        return sorted(
+            (Total(name, counts[name], durations[name]) for name in counts),
+            key=lambda total: (-total.duration, total.name),
+        )
+
+    def write(self, path):
+        """Save every recorded phase as a Chrome trace-event JSON file.
+
+        Args:
+            path (str): The absolute or relative file path to write to.
+
+        """
+        process = os.getpid()
+
+        with self._lock:
+            events = [
+                {
+                    "args": {"name": name},
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": process,
+                    "tid": thread,
+                }
+                for thread, name in sorted(self._threads.items())
+            ]
+            events.extend(
+                {
+                    "args": span_.arguments,
+                    "cat": "rez_batch_process",
+                    "dur": int(span_.duration * 1000000),
+                    "name": span_.name,
+                    "ph": "X",
+                    "pid": process,
+                    "tid": span_.thread,
+                    "ts": int(span_.start * 1000000),
+                }
+                for span_ in self._spans
+            )
+
+        with open(path, "w") as handler:
+            json.dump({"displayTimeUnit": "ms", "traceEvents": events}, handler)
+
+
+@contextlib.contextmanager
+def activate(tracer):
+    """Record every :func:`span` into `tracer`, while in this context.
+
+    Args:
+        tracer (:class:`Tracer`): The object which records every phase.
+
+    Yields:
+        :class:`Tracer`: `tracer`.
+
+    """
+    with _LOCK:
+        _ACTIVE_TRACERS.append(tracer)
+
+    try:
+        yield tracer
+    finally:
+        with _LOCK:
+            _ACTIVE_TRACERS.remove(tracer)
+
+
+def get_active():
+    """:class:`Tracer` or NoneType: Get the object that phases are recorded into."""
+    with _LOCK:
+        if _ACTIVE_TRACERS:
+            return _ACTIVE_TRACERS[-1]
+
+    return None
+
+
+def get_table(totals):
+    """Format phase totals as a table which can be printed.
+
+    Phases may contain other phases. e.g. "run_package" includes
+    "push". So the total of every phase is more than the whole run.
+
+    Args:
+        totals (iter[:attr:`Total`]): The phases to describe.
+
+    Returns:
+        str: The generated table.
+
+    """
+    template = "{:<30} {:>8} {:>12} {:>12}"
+    lines = [template.format("Phase", "Count", "Total (s)", "Mean (s)")]
+
+    for total in totals:
+        lines.append(
+            template.format(
+                total.name,
+                total.count,
+                "{:.3f}".format(total.duration),
+                "{:.3f}".format(total.duration / total.count),
+            )
+        )
+
+    return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def span(name, **arguments):
+    """Record how long the code in this context takes, if a :class:`Tracer` is active.
+
+    Args:
+        name (str): The name of the phase. e.g. "clone".
+        **arguments (str): Any details of the phase. e.g. package="rez_lint".
+
+    Yields:
+        NoneType: Return the state of this context back to the user.
+
+    """
+    tracer = get_active()
+
+    if not tracer:
+        yield
+
+        return
+
+    start = time.time()
+
+    try:
+        yield
+    finally:
+        tracer.add(name, start, time.time() - start, arguments=arguments)
@@ -15,6 +15,7 @@ import os
 import shutil
 import sys
 import tempfile
+from multiprocessing import pool
 
 import git
 from git import exc
@@ -23,11 +24,13 @@ from rez import packages_
 from rez.vendor.schema import schema
 from rez_utilities import finder, rez_configuration
 
-from . import exceptions, rez_git
-from .gitter import git_link
+from . import checkpoint, exceptions, rez_git, tracing
+from .gitter import clone_cache, cloner, git_link, worktree
 
 Skip = collections.namedtuple("Skip", "package path reason")
 _LOGGER = logging.getLogger(__name__)
+_PACKAGE_INDEXES = dict()
+_PackageIndex = collections.namedtuple("_PackageIndex", "head packages errors")
 
 
 def _is_permissions_issue(error):
@@ -38,7 +41,7 @@ def _is_permissions_issue(error):
     return error.stderr.endswith("403'")
 
 
-def _clone(url, directory):
+def _clone(url, directory, cache=None, keep=False, mode=cloner.FULL):
     """Clone a Git repository listed at `url` to to some folder, `directory`.
 
     If `directory` is already a Git repository then load it. But if the
@@ -51,6 +54,17 @@ def _clone(url, directory):
             e.g. https://github.com/ColinKennedy/rez_developer_packages or
             git@github.com:ColinKennedy/rez_developer_packages.git or
             /some/path/to/a/cloned/rez_developer_packages.git
+        directory (str):
+            The folder on-disk where the repository will be cloned to.
+        cache (:class:`.CloneCache`, optional):
+            If included, `directory` is checked out from
+            a cached repository instead of cloning `url` from scratch.
+        keep (bool, optional):
+            If False and `cache` is given, `cache` deletes `directory`
+            once it's no longer needed. If True, keep it. Default is False.
+        mode (str, optional):
+            How much of the repository to clone. See :mod:`.cloner`.
+            Default: :attr:`.cloner.FULL`.
 
     Returns:
         :class:`git.Repo`: The created repository.
@@ -64,14 +78,152 @@ def _clone(url, directory):
                 'Could not clone URL "%s" to directory "%s".', url, directory
             )
 
-    return git.Repo.clone_from(url, directory)
+    if cache:
+        return cache.add_checkout(
+            url, directory, keep=keep, sparse=mode == cloner.SPARSE
+        )
 
+    return cloner.clone(url, directory, mode=mode)
 
-def _find_package_definitions(directory, name):
-    """Find every Rez package matching some name in a folder on-disk.
+
+def _load_package(directory):
+    """Load the Rez package in a folder, if it is a valid Rez package.
+
+    Args:
+        directory (str): An absolute path to a folder with a package.py / package.yaml.
+
+    Returns:
+        tuple[:class:`rez.packages_.DeveloperPackage` or NoneType, str]:
+            The found package, if any, and a message explaining why no
+            package could be loaded, if it failed.
+
+    """
+    try:
+        return packages_.get_developer_package(directory), ""
+    except IndexError:
+        # You can't access a Rez package after modifying it
+        # so if we encounter a package that was already modified
+        # in the same repository, just ignore this error.
+        #
+        # Reference: https://github.com/nerdvegas/rez/issues/857
+        #
+        # TODO : If the issue above is ever solved, remove this try/except
+        #
+        return None, "The Rez package was modified and cannot be loaded again."
+    except schema.SchemaError:
+        # The package is invalid. Just skip it
+        _LOGGER.warning('Folder "%s" has an invalid Rez package.', directory)
+
+        return None, "The Rez package is invalid."
+    except (
+        rez_exceptions.InvalidPackageError,
+        rez_exceptions.PackageMetadataError,
+    ):
+        # This happens in one of two scenarios:
+        # 1. The Rez package file found is invalid
+        # 2. There's a package.py file in the Rez package itself
+        #    and is being parsed as if it's a Rez package file, even though it isn't.
+        #
+        # There's not a lot that can be done about either case. So just ignore it.
+        _LOGGER.warning(
+            'Folder "%s" thought it found a Rez package but it has broken metadata. '
+            "Maybe it's not a Rez package?",
+            directory,
+        )
+
+        return None, "The Rez package has broken metadata."
+    except rez_exceptions.ResourceError:
+        # This happens when there's a file like package.py
+        # but it's not actually a Rez package. An error
+        # occurs because there's some kind of import in the
+        # file which Rez cannot load.
+        #
+        _LOGGER.warning(
+            'Folder "%s" contains a Rez package file which can\'t be imported. '
+            "Maybe it's not a Rez package?",
+            directory,
+        )
+
+        return None, "The Rez package file cannot be imported."
+    except rez_exceptions.RezError:
+        _LOGGER.exception(
+            'Folder "%s" found a package file but it raised a Rez error.', directory
+        )
+
+        return None, "The Rez package raised a Rez error."
+
+
+def _make_package_index(directory):
+    """Find and load every Rez package in a folder, using a single walk.
 
     Args:
         directory (str): An absolute path to a folder that has Rez packages in it.
+
+    Returns:
+        tuple[dict[str, list[:class:`rez.packages_.DeveloperPackage`]], dict[str, str]]:
+            Every found Rez package, grouped by its name, followed
+            by every folder which has a Rez package file that could
+            not be loaded and the reason why.
+
+    """
+    packages = collections.defaultdict(list)
+    errors = dict()
+
+    for root, folders, files in os.walk(directory):
+        if ".git" in folders:
+            folders.remove(".git")
+
+        if not any(name in rez_configuration.REZ_PACKAGE_NAMES for name in files):
+            continue
+
+        package, error = _load_package(root)
+
+        if package:
+            packages[package.name].append(package)
+        else:
+            errors[root] = error
+
+    return dict(packages), errors
+
+
+def _get_package_index(repository):
+    """Get the Rez packages of a git repository, re-using any existing index.
+
+    The index is re-built only if the repository's HEAD commit changed
+    since the last time that it was made.
+
+    Args:
+        repository (:class:`git.Repo`): A cloned repository that has Rez packages in it.
+
+    Returns:
+        :attr:`_PackageIndex`: The found Rez packages and every invalid package folder.
+
+    """
+    directory = repository.working_dir
+
+    try:
+        head = repository.head.commit.hexsha
+    except ValueError:
+        # An empty repository has no commits
+        head = ""
+
+    index = _PACKAGE_INDEXES.get(directory)
+
+    if index and index.head == head:
+        return index
+
+    packages, errors = _make_package_index(directory)
+    index = _PackageIndex(head, packages, errors)
+    _PACKAGE_INDEXES[directory] = index
+
+    return index
+
+
+def _find_package_definitions(repository, name):
+    """Find every Rez package matching some name in a git repository.
+
+    Args:
+        repository (:class:`git.Repo`): A cloned repository that has Rez packages in it.
         name (str): The name of the Rez package to search for.
 
     Returns:
@@ -81,68 +233,9 @@ def _find_package_definitions(directory, name):
             duplicate packages are found, those will get returned, too.
 
     """
-    matches = set()
-
-    for root, _, files in os.walk(directory):
-        for name_ in files:
-            if name_ in rez_configuration.REZ_PACKAGE_NAMES:
-                try:
-                    package = packages_.get_developer_package(root)
-                except IndexError:
-                    # You can't access a Rez package after modifying it
-                    # so if we encounter a package that was already modified
-                    # in the same repository, just ignore this error.
-                    #
-                    # Reference: https://github.com/nerdvegas/rez/issues/857
-                    #
-                    # TODO : If the issue above is ever solved, remove this try/except
-                    #
-                    continue
-                except schema.SchemaError:
-                    # The package is invalid. Just skip it
-                    _LOGGER.warning('Folder "%s" has an invalid Rez package.', root)
-
-                    continue
-                except (
-                    rez_exceptions.InvalidPackageError,
-                    rez_exceptions.PackageMetadataError,
-                ):
-                    # This happens in one of two scenarios:
-                    # 1. The Rez package file found is invalid
-                    # 2. There's a package.py file in the Rez package itself
-                    #    and is being parsed as if it's a Rez package file, even though it isn't.
-                    #
-                    # There's not a lot that can be done about either case. So just ignore it.
-                    _LOGGER.warning(
-                        'Folder "%s" thought it found a Rez package but it has broken metadata. '
-                        "Maybe it's not a Rez package?",
-                        root,
-                    )
-
-                    continue
-                except rez_exceptions.ResourceError:
-                    # This happens when there's a file like package.py
-                    # but it's not actually a Rez package. An error
-                    # occurs because there's some kind of import in the
-                    # file which Rez cannot load.
-                    #
-                    _LOGGER.warning(
-                        'Folder "%s" contains a Rez package file which can\'t be imported. '
-                        "Maybe it's not a Rez package?",
-                        root,
-                    )
-                except rez_exceptions.RezError:
-                    _LOGGER.exception(
-                        'Folder "%s" found a package file but it raised a Rez error.',
-                        root,
-                    )
-
-                    continue
-
-                if package.name == name:
-                    matches.add(package)
-
-    return matches
+    index = _get_package_index(repository)
+
+    return set(index.packages.get(name, []))
 
 
 def handle_generic_exception(error, package):
@@ -177,6 +270,74 @@ def handle_generic_exception(error, package):
     return path, str(message)
 
 
+def iter_report(
+    packages_to_report,
+    maximum_repositories=sys.maxsize,
+    maximum_rez_packages=sys.maxsize,
+):
+    """Check each Rez package for a git repository, as soon as it is found.
+
+    Unlike :func:`report`, Rez packages are yielded one-by-one. Once
+    a limit is reached, `packages_to_report` is not iterated over any
+    further so, if `packages_to_report` is a generator, no more Rez
+    packages are queried.
+
+    Args:
+        packages_to_report (iter[:class:`rez.packages_.Package`]):
+            The Rez packages to check for a command.
+        maximum_repositories (int, optional):
+            The number of unique repositories to check for packages.
+            Once this many repositories are found, any Rez package from
+            a different repository stops this function.
+            Default: :attr:`sys.maxsize`.
+        maximum_rez_packages (int, optional):
+            The number of Rez packages to yield, at most.
+            Default: :attr:`sys.maxsize`.
+
+    Yields:
+        tuple[:class:`rez.packages_.Package`, str, :class:`.InvalidPackage` or NoneType]:
+            Each Rez package, its repository URL, and an error. If the
+            package's repository couldn't be found, the URL is empty
+            and the error explains why. Otherwise, the error is None.
+
+    """
+    if maximum_rez_packages < 1:
+        return
+
+    repositories = set()
+    count = 0
+
+    for package in packages_to_report:
+        try:
+            repository = rez_git.get_repository_url(package)
+        except (
+            exceptions.InvalidPackage,
+            exceptions.NoRepositoryRemote,
+            # If a USD is found for `package` but it points to a file
+            # location on-disk and that path does not exist.
+            #
+            exc.NoSuchPathError,
+        ) as error:
+            yield package, "", exceptions.InvalidPackage(
+                package, finder.get_package_root(package), str(error)
+            )
+
+            continue
+
+        if repository not in repositories:
+            if len(repositories) >= maximum_repositories:
+                return
+
+            repositories.add(repository)
+
+        yield package, repository, None
+
+        count += 1
+
+        if count >= maximum_rez_packages:
+            return
+
+
 def report(
     packages_to_report, maximum_repositories=sys.maxsize, maximum_rez_packages=sys.maxsize
 ):
@@ -207,42 +368,330 @@ def report(
             package.
 
     """
-    repositories = []
     packages = []
     invalids = []
 
-    for package in packages_to_report:
-        if len(repositories) > maximum_repositories:
-            break
-        elif len(packages) > maximum_rez_packages:
-            break
+    for package, _, error in iter_report(
+        packages_to_report,
+        maximum_repositories=maximum_repositories,
+        maximum_rez_packages=maximum_rez_packages,
+    ):
+        if error:
+            invalids.append(error)
+        else:
+            packages.append(package)
+
+    return packages, invalids
+
+
+def _is_not_found(error):
+    """bool: Check if a git error was raised because a repository doesn't exist."""
+    if error.status != 128:
+        # It cannot be a "not found" if it is not a 128 error
+        return False
+
+    # Note: There's probably a better way to do this...
+    message = str(error).rstrip("'\"").rstrip()
+
+    return message.endswith(" not found")
+
+
+def _run_package(runner, package):
+    """Run a command on one Rez package and catch any error that it raises.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function which runs the command onto the Rez package.
+        package (:class:`rez.packages_.Package`): The Rez package to run on.
+
+    Returns:
+        str or :class:`Exception`:
+            A message or error explaining why the command failed. If
+            the command ran successfully, return "".
+
+    """
+    try:
+        return runner(package)
+    except exceptions.CoreException as error:  # pylint: disable=broad-except
+        return error
+    except exc.GitCommandError as error:
+        if not _is_permissions_issue(error):
+            _LOGGER.exception("Uncaught exception. Not sure what to do!")
+
+            return error
+
+        _LOGGER.warning(
+            'Package "%s" tried to interact with git but got error "%s".',
+            package.name,
+            error,
+        )
+
+        return error
+    except NotImplementedError as error:
+        _LOGGER.error('Package "%s" couldn\'t be run.', package.name)
+
+        return error
+    except Exception as error:  # pylint: disable=broad-except
+        _LOGGER.exception(
+            'An unknown, general exception was found. "%s" cannot be run.',
+            package.name,
+        )
+
+        return error
+
+
+def _run_in_worktree(runner, repository, package, keep=False, directory=""):
+    """Run a command on one Rez package, in a new worktree of its repository.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function which runs the command onto the Rez package.
+        repository (:class:`git.Repo`): The clone which contains `package`.
+        package (:class:`rez.packages_.Package`): The Rez package to run on.
+        keep (bool, optional):
+            If False, delete the worktree as soon as the command is
+            done with it. If True, keep it. Default is False.
+        directory (str, optional):
+            The folder where the worktree will be created. If no folder
+            is given, the system's temporary directory is used. Default: "".
+
+    Returns:
+        tuple[:class:`rez.packages_.Package`, str or :class:`Exception`]:
+            The Rez package in the worktree (or `package`, if it
+            couldn't be loaded) and a message or error explaining why
+            the command failed. If the command ran successfully, the
+            message is "".
+
+    """
+    root = finder.get_package_root(package)
+    relative = os.path.relpath(root, repository.working_dir)
+
+    tree = None
+
+    # Like :func:`_run_package`, one package's failure must not stop the others
+    try:
+        with tracing.span("add_worktree", package=package.name):
+            tree = worktree.add(repository, root, directory=directory)
+
+        copy, message = _load_package(os.path.join(tree.working_dir, relative))
+    except (exceptions.CoreException, exc.GitCommandError) as error:
+        _LOGGER.warning(
+            'Package "%s" could not be checked out. Got error "%s".',
+            package.name,
+            error,
+        )
+
+        return package, error
+    except Exception as error:  # pylint: disable=broad-except
+        _LOGGER.exception(
+            'An unknown, general exception was found. "%s" cannot be run.',
+            package.name,
+        )
+
+        return package, error
+    else:
+        if not copy:
+            return package, message
+
+        return copy, _run_package(runner, copy)
+    finally:
+        if tree:
+            # Each open repository keeps `git cat-file` processes alive
+            rez_git.forget_repository(tree.working_dir)
+            tree.close()
+
+            if not keep:
+                with tracing.span("remove_worktree", package=package.name):
+                    _remove_worktree(repository, tree.working_dir)
+
+
+def _remove_worktree(repository, tree):
+    """Delete a worktree, now that its Rez package is done.
+
+    If git can't remove the worktree, its folder is deleted once the
+    process exits, instead.
+
+    Args:
+        repository (:class:`git.Repo`): The clone which `tree` was created from.
+        tree (str): The absolute path to the root folder of the worktree.
+
+    """
+    try:
+        worktree.remove(repository, tree)
+    except exc.GitCommandError as error:
+        _LOGGER.warning(
+            'Worktree "%s" could not be removed. Got error "%s".', tree, error
+        )
+        git_link.add_directory_to_delete(tree)
+
+
+def _run_repository(  # pylint: disable=too-many-branches
+    runner,
+    repository_url,
+    packages,
+    keep_temporary_files=False,
+    temporary_directory="",
+    cache=None,
+    clone_mode=cloner.FULL,
+    jobs=1,
+):
+    """Clone a repository and run a command on each of its Rez packages.
+
+    Each Rez package is modified in its own worktree of the clone. See
+    :mod:`.worktree`.
+
+    Args:
+        runner (callable[:class:`rez.packages_.Package`] -> str):
+            The function which runs the command onto each Rez package.
+        repository_url (str):
+            The git repository which contains every Rez package in `packages`.
+        packages (list[:class:`rez.packages_.Package`]):
+            The Rez packages to run a command on.
+        keep_temporary_files (bool, optional):
+            If False, delete any folders used to clone local git
+            If repositories. True, don't delete them. Default is False.
+        temporary_directory (str, optional):
+            The folder where git repositories will be cloned to and
+            where each Rez package's worktree is created. If no folder
+            is given, each repository is cloned to a separate temporary
+            directory. Default: "".
+        cache (:class:`.CloneCache`, optional):
+            If included, check out the repository from this cache
+            instead of cloning it from scratch.
+        clone_mode (str, optional):
+            How much of the repository to clone. See :mod:`.cloner`.
+            Default: :attr:`.cloner.FULL`.
+        jobs (int, optional):
+            The number of Rez packages to modify at the same time. Default: 1.
+
+    Returns:
+        tuple[
+            set[:class:`rez.packages_.Package`],
+            set[tuple[:class:`rez.packages_.Package`, :class:`.CoreException`]],
+        ]:
+            Every Rez package that was successfully "ran" by the
+            command and every Rez package did not get run for some reason.
+
+    """
+    ran = set()
+    un_ran = set()
+
+    # TODO : Add thing to make this more quiet, if needed
+    if not temporary_directory:
+        clone_directory = tempfile.mkdtemp(
+            suffix="_{name}_pull_request_location".format(
+                name=repository_url.split("/")[-1]
+            )
+        )
+        # `git.Repo.clone_from` requires that the directory not already exist.
+        # But we need the temporary directory name. So remove the directory
+        #
+        shutil.rmtree(clone_directory)
+    else:
+        clone_directory = git_link.make_repository_folder(
+            temporary_directory, repository_url
+        )
+
+    # TODO : Replace this with ls-remote or something
+    #
+    # Reference: https://stackoverflow.com/a/27668138/3626104
+    #
+    # git ls-remote git@github.com:foo/bar.git
+    # git ls-remote http://github.com/foo/bar
+    #
+    try:
+        with tracing.span("clone", repository=repository_url):
+            repository = _clone(
+                repository_url,
+                clone_directory,
+                cache=cache,
+                keep=keep_temporary_files,
+                mode=clone_mode,
+            )
+    except exceptions.CacheLockTimeout as error:
+        return ran, {(package, error) for package in packages}
+    except exc.GitCommandError as error:
+        if _is_permissions_issue(error):
+            template = 'The Git repository "{repository_url}" failed to push/pull.'
+        elif _is_not_found(error):
+            template = 'The Git repository "{repository_url}" was not found.'
+        else:
+            template = 'The Git repository "{repository_url}" failed to clone.'
+
+        message = template.format(repository_url=repository_url)
+
+        return ran, {(package, message) for package in packages}
+    except exc.InvalidGitRepositoryError:
+        _LOGGER.error('Directory "%s" is not a valid Git repository.', clone_directory)
+        message = 'The Git repository "{repository_url}" failed to clone.'.format(
+            repository_url=repository_url
+        )
+
+        return ran, {(package, message) for package in packages}
+
+    repository_root = repository.working_dir
+
+    if not keep_temporary_files and not cache:
+        git_link.add_directory_to_delete(repository_root)
+
+    found = []
+
+    for package in packages:
+        with tracing.span("find_package_definitions", package=package.name):
+            definitions = list(_find_package_definitions(repository, package.name))
 
         try:
-            repository = rez_git.get_repository_url(package)
-        except (exceptions.InvalidPackage, exceptions.NoRepositoryRemote) as error:
-            invalids.append(
-                exceptions.InvalidPackage(
-                    package, finder.get_package_root(package), str(error)
+            latest = sorted(definitions, key=operator.attrgetter("version"))[-1]
+        except IndexError:
+            un_ran.add(
+                (
+                    package,
+                    'Could not find "{package.name}" in repository "{repository_root}".'
+                    "".format(package=package, repository_root=repository_root),
                 )
             )
 
             continue
-        except exc.NoSuchPathError as error:
-            # If a USD is found for `package` but it points to a file
-            # location on-disk and that path does not exist.
-            #
-            invalids.append(
-                exceptions.InvalidPackage(
-                    package, finder.get_package_root(package), str(error)
-                )
+
+        found.append(latest)
+
+    def _run(latest):
+        checkpoint.record(latest.name, checkpoint.STARTED)
+
+        with tracing.span(
+            "run_package", package=latest.name, repository=repository_url
+        ):
+            package, error = _run_in_worktree(
+                runner,
+                repository,
+                latest,
+                keep=keep_temporary_files,
+                directory=temporary_directory,
             )
 
-            continue
+        checkpoint.record(package.name, checkpoint.FAILED if error else checkpoint.RAN)
 
-        repositories.append(repository)
-        packages.append(package)
+        return package, error
 
-    return packages, invalids
+    if jobs == 1 or len(found) < 2:
+        results = [_run(latest) for latest in found]
+    else:
+        # Every package has its own worktree so they can be modified at once
+        workers = pool.ThreadPool(min(jobs, len(found)))
+
+        try:
+            results = workers.map(_run, found)
+        finally:
+            workers.close()
+            workers.join()
+
+    for package, error in results:
+        if error:
+            un_ran.add((package, error))
+        else:
+            ran.add(package)
+
+    return ran, un_ran
 
 
 def run(  # pylint: disable=too-many-arguments,too-many-locals
@@ -252,9 +701,17 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
     maximum_rez_packages=sys.maxsize,
     keep_temporary_files=False,
     temporary_directory="",
+    jobs=1,
+    cache_directory="",
+    cache_size=0,
+    clone_mode=cloner.FULL,
 ):
     """Run a command on the given Rez packages.
 
+    If a :class:`.checkpoint.Journal` is active, Rez packages which it
+    lists as completed are skipped and the outcome of every other Rez
+    package is recorded into it.
+
     Args:
         packages_to_run (iter[:class:`rez.packages_.Package`]):
             The Rez packages to run a command on. e.g. adding documentation.
@@ -275,6 +732,26 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
             The folder where git repositories will be cloned to. If no
             folder is given, each repository is cloned to a separate
             temporary directory. Default: "".
+        jobs (int, optional):
+            The number of repositories to process at the same time.
+            Also, the number of Rez packages of each repository to
+            process at the same time. Default: 1.
+        cache_directory (str, optional):
+            A folder on-disk which keeps a bare copy of every git
+            repository between runs. If included, repositories are
+            fetched and checked out from this folder instead of being
+            cloned from scratch. Default: "".
+        cache_size (int, optional):
+            The maximum bytes that `cache_directory` may use. Once
+            the run is finished, the least recently used repositories
+            are deleted until the cache is this size or smaller. If 0,
+            nothing is deleted. Default: 0.
+        clone_mode (str, optional):
+            How much of each repository to clone. See :mod:`.cloner`.
+            Default: :attr:`.cloner.FULL`.
+
+    Raises:
+        ValueError: If `jobs` is less than 1.
 
     Returns:
         tuple[
@@ -289,16 +766,6 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
 
     """
 
-    def _is_not_found(error):
-        if error.status != 128:
-            # It cannot be a "not found" if it is not a 128 error
-            return False
-
-        # Note: There's probably a better way to do this...
-        message = str(error).rstrip("'\"").rstrip()
-
-        return message.endswith(" not found")
-
     def _group_by_repository(packages):
         output = collections.defaultdict(set)
 
@@ -307,158 +774,76 @@ def run(  # pylint: disable=too-many-arguments,too-many-locals
 
         return sorted(output.items(), key=operator.itemgetter(0))
 
-    filtered_packages, invalids = report(
-        packages_to_run,
-        maximum_repositories=maximum_repositories,
-        maximum_rez_packages=maximum_rez_packages,
-    )
+    def _run_group(group):
+        repository_url, packages = group
+
+        return _run_repository(
+            runner,
+            repository_url,
+            sorted(packages, key=operator.attrgetter("name")),
+            keep_temporary_files=keep_temporary_files,
+            temporary_directory=temporary_directory,
+            cache=cache,
+            clone_mode=clone_mode,
+            jobs=jobs,
+        )
+
+    if jobs < 1:
+        raise ValueError('Jobs "{jobs}" cannot be less than 1.'.format(jobs=jobs))
+
+    with tracing.span("report"):
+        filtered_packages, invalids = report(
+            packages_to_run,
+            maximum_repositories=maximum_repositories,
+            maximum_rez_packages=maximum_rez_packages,
+        )
+
+    journal = checkpoint.get_active()
+
+    if journal:
+        completed = journal.get_completed()
+        filtered_packages = [
+            package for package in filtered_packages if package.name not in completed
+        ]
+
+        if completed:
+            _LOGGER.info(
+                'Skipping "%s" Rez packages which an earlier run completed.',
+                len(completed),
+            )
 
+    groups = _group_by_repository(filtered_packages)
     ran = set()
     un_ran = set()
+    cache = None
 
-    for repository_url, packages in _group_by_repository(filtered_packages):
-        packages = sorted(packages, key=operator.attrgetter("name"))
+    if cache_directory:
+        cache = clone_cache.CloneCache(cache_directory, maximum_size=cache_size)
 
-        # TODO : Add thing to make this more quiet, if needed
-        if not temporary_directory:
-            clone_directory = tempfile.mkdtemp(
-                suffix="_{name}_pull_request_location".format(
-                    name=repository_url.split("/")[-1]
-                )
-            )
-            # `git.Repo.clone_from` requires that the directory not already exist.
-            # But we need the temporary directory name. So remove the directory
-            #
-            shutil.rmtree(clone_directory)
+    try:
+        if jobs == 1 or len(groups) < 2:
+            results = [_run_group(group) for group in groups]
         else:
-            clone_directory = git_link.make_repository_folder(
-                temporary_directory, repository_url
-            )
-
-        # TODO : Replace this with ls-remote or something
-        #
-        # Reference: https://stackoverflow.com/a/27668138/3626104
-        #
-        # git ls-remote git@github.com:foo/bar.git
-        # git ls-remote http://github.com/foo/bar
-        #
-        try:
-            repository = _clone(repository_url, clone_directory)
-        except exc.GitCommandError as error:
-            if _is_permissions_issue(error):
-                for package in packages:
-                    un_ran.add(
-                        (
-                            package,
-                            'The Git repository "{repository_url}" failed to push/pull.'.format(
-                                repository_url=repository_url
-                            ),
-                        )
-                    )
-
-                continue
-
-            if _is_not_found(error):
-                for package in packages:
-                    un_ran.add(
-                        (
-                            package,
-                            'The Git repository "{repository_url}" was not found.'.format(
-                                repository_url=repository_url
-                            ),
-                        )
-                    )
-
-                continue
-
-            for package in packages:
-                un_ran.add(
-                    (
-                        package,
-                        'The Git repository "{repository_url}" failed to clone.'.format(
-                            repository_url=repository_url
-                        ),
-                    )
-                )
-
-            continue
-        except exc.InvalidGitRepositoryError:
-            _LOGGER.error(
-                'Directory "%s" is not a valid Git repository.', clone_directory
-            )
-
-            for package in packages:
-                un_ran.add(
-                    (
-                        package,
-                        'The Git repository "{repository_url}" failed to clone.'.format(
-                            repository_url=repository_url
-                        ),
-                    )
-                )
-
-            continue
-
-        repository_root = repository.working_dir
-
-        if not keep_temporary_files:
-            git_link.add_directory_to_delete(repository_root)
-
-        for package in packages:
-            definitions = list(_find_package_definitions(repository_root, package.name))
-
-            try:
-                latest = sorted(definitions, key=operator.attrgetter("version"))[-1]
-            except IndexError:
-                un_ran.add(
-                    (
-                        package,
-                        'Could not find "{package.name}" in repository "{repository_root}".'
-                        "".format(package=package, repository_root=repository_root),
-                    )
-                )
-
-                continue
+            # Threads are used instead of processes because Rez packages
+            # and the `runner` cannot be pickled. Most of the time is spent
+            # waiting on git / shell sub-processes, anyway.
+            #
+            workers = pool.ThreadPool(min(jobs, len(groups)))
 
             try:
-                error = runner(latest)
-            except exceptions.CoreException as error:  # pylint: disable=broad-except
-                un_ran.add((latest, error))
-
-                continue
-            except exc.GitCommandError as error:
-                if not _is_permissions_issue(error):
-                    _LOGGER.exception("Uncaught exception. Not sure what to do!")
-                    un_ran.add((latest, error))
-
-                    continue
-
-                _LOGGER.warning(
-                    'Package "%s" tried to interact with git but got error "%s".',
-                    latest.name,
-                    error,
-                )
-
-                un_ran.add((latest, error))
-
-                continue
-            except NotImplementedError as error:
-                _LOGGER.error('Package "%s" couldn\'t be run.', latest.name)
-                un_ran.add((latest, error))
-
-                continue
-            except Exception as error:
-                _LOGGER.exception(
-                    'An unknown, general exception was found. "%s" cannot be run.',
-                    latest.name,
-                )
-                un_ran.add((latest, error))
-
-                continue
-
-            if error:
-                un_ran.add((latest, error))
-            else:
-                ran.add(latest)
+                # `imap` keeps the results in the same order as `groups`
+                results = list(workers.imap(_run_group, groups))
+            finally:
+                workers.close()
+                workers.join()
+    finally:
+        if cache:
+            with tracing.span("clean_cache"):
+                cache.clear_checkouts()
+                cache.evict()
+
+    for ran_, un_ran_ in results:
+        ran.update(ran_)
+        un_ran.update(un_ran_)
 
     return ran, un_ran, invalids
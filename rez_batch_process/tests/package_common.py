@@ -14,6 +14,7 @@ from python_compatibility.testing import common
 from rez import exceptions as rez_exceptions
 from rez import packages_
 from rez_batch_process.core import exceptions, registry, worker
+from rez_batch_process.core.gitter import cloner
 from rez_batch_process.core.plugins import conditional
 from rez_utilities import creator, finder
 from six.moves import mock
@@ -40,7 +41,15 @@ class Tests(common.Common):
         for name in registry.get_plugin_keys():
             registry.clear_plugin(name)
 
-    def _test(self, expected, paths=None):
+    def _test(  # pylint: disable=too-many-arguments
+        self,
+        expected,
+        paths=None,
+        jobs=1,
+        clone_mode=cloner.FULL,
+        keep_temporary_files=False,
+        temporary_directory="",
+    ):
         """Check that `packages`, when processed, equals `expected`.
 
         Args:
@@ -51,9 +60,19 @@ class Tests(common.Common):
                 will be used to any Rez-environment-related work. Some
                 plugins need these paths for resolving a context, for
                 example. Default is None.
+            jobs (int, optional): The number of repositories to process at once. Default: 1.
+            clone_mode (str, optional): How much of each repository to clone.
+            keep_temporary_files (bool, optional): If True, don't delete clones and worktrees.
+            temporary_directory (str, optional): Where to clone and make worktrees.
 
         """
-        unfixed, invalids, skips = self._test_unhandled(paths=paths)
+        unfixed, invalids, skips = self._test_unhandled(
+            paths=paths,
+            jobs=jobs,
+            clone_mode=clone_mode,
+            keep_temporary_files=keep_temporary_files,
+            temporary_directory=temporary_directory,
+        )
         expected_unfixed, expected_invalids, expected_skips = expected
 
         reduced_invalids = [(invalid.get_path(), str(invalid)) for invalid in invalids]
@@ -68,7 +87,13 @@ class Tests(common.Common):
         self.assertEqual(expected_reduced_skips, reduced_skips)
 
     @staticmethod
-    def _test_unhandled(paths=None):
+    def _test_unhandled(
+        paths=None,
+        jobs=1,
+        clone_mode=cloner.FULL,
+        keep_temporary_files=False,
+        temporary_directory="",
+    ):
         """Get the conditions for a test (but don't actually run unittest.
 
         Args:
@@ -76,6 +101,10 @@ class Tests(common.Common):
                 will be used to any Rez-environment-related work. Some
                 plugins need these paths for resolving a context, for
                 example. Default is None.
+            jobs (int, optional): The number of repositories to process at once. Default: 1.
+            clone_mode (str, optional): How much of each repository to clone.
+            keep_temporary_files (bool, optional): If True, don't delete clones and worktrees.
+            temporary_directory (str, optional): Where to clone and make worktrees.
 
         Returns:
             The output of :func:`rez_batch_process.core.worker.run`.
@@ -92,7 +121,12 @@ class Tests(common.Common):
         command = registry.get_command("shell")
 
         _, unfixed, invalids = worker.run(
-            functools.partial(command.run, arguments=arguments), valid_packages
+            functools.partial(command.run, arguments=arguments),
+            valid_packages,
+            jobs=jobs,
+            clone_mode=clone_mode,
+            keep_temporary_files=keep_temporary_files,
+            temporary_directory=temporary_directory,
         )
 
         invalids.extend(invalid_packages)
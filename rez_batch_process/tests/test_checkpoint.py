@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.checkpoint` knows which Rez packages are done."""
+
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+
+from rez_batch_process.core import checkpoint
+
+
+class Journal(unittest.TestCase):
+    """Record and read the events of a run."""
+
+    def setUp(self):
+        """Create a folder for the journal file."""
+        self._root = tempfile.mkdtemp(suffix="_checkpoint")
+        self.addCleanup(shutil.rmtree, self._root)
+        self._path = os.path.join(self._root, "journals", "run.jsonl")
+
+    def test_completed(self):
+        """Only Rez packages that ran and whose pull request was made are complete."""
+        journal = checkpoint.Journal(self._path)
+
+        for package in ("no_change", "submitted", "not_submitted", "failed"):
+            journal.record(package, checkpoint.STARTED)
+
+        journal.record("submitted", checkpoint.PUSHED, branch="PR_submitted")
+        journal.record("not_submitted", checkpoint.PUSHED, branch="PR_not_submitted")
+        journal.record("no_change", checkpoint.RAN)
+        journal.record("submitted", checkpoint.RAN)
+        journal.record("not_submitted", checkpoint.RAN)
+        journal.record("failed", checkpoint.FAILED)
+        journal.record("submitted", checkpoint.SUBMITTED)
+
+        journal = checkpoint.Journal(self._path)  # A new run
+
+        self.assertEqual({"no_change", "submitted"}, journal.get_completed())
+        self.assertEqual("PR_not_submitted", journal.get_branch("not_submitted"))
+        self.assertEqual("", journal.get_branch("submitted"))
+
+    def test_interrupted_write(self):
+        """Ignore a line which was only partially written."""
+        journal = checkpoint.Journal(self._path)
+        journal.record("foo", checkpoint.STARTED)
+        journal.record("foo", checkpoint.RAN)
+
+        with open(self._path, "a") as handler:
+            handler.write('{"package": "bar", "sta')
+
+        self.assertEqual({"foo"}, checkpoint.Journal(self._path).get_completed())
+
+    def test_clear(self):
+        """Forget everything that an earlier run did."""
+        journal = checkpoint.Journal(self._path)
+        journal.record("foo", checkpoint.STARTED)
+        journal.record("foo", checkpoint.RAN)
+        journal.clear()
+
+        self.assertEqual(set(), journal.get_completed())
+        self.assertEqual(set(), checkpoint.Journal(self._path).get_completed())
+
+    def test_key(self):
+        """Name each run after its command and arguments, but not its token."""
+        first = argparse.Namespace(command="echo foo", token="secret")
+        second = argparse.Namespace(command="echo foo", token="another_secret")
+        third = argparse.Namespace(command="echo bar", token="secret")
+
+        self.assertEqual(
+            checkpoint.get_key("shell", first), checkpoint.get_key("shell", second)
+        )
+        self.assertNotEqual(
+            checkpoint.get_key("shell", first), checkpoint.get_key("shell", third)
+        )
+        self.assertTrue(checkpoint.get_key("shell", first).startswith("shell-"))
+
+    def test_key_selection(self):
+        """Name each run after the Rez packages it runs on, too."""
+        arguments = argparse.Namespace(command="echo foo")
+
+        def _get_key(rez_packages):
+            return checkpoint.get_key(
+                "shell",
+                arguments,
+                selection={"packages_path": ["/foo"], "rez_packages": rez_packages},
+            )
+
+        self.assertEqual(_get_key({"foo", "bar"}), _get_key({"bar", "foo"}))
+        self.assertNotEqual(_get_key({"foo"}), _get_key({"bar"}))
+        self.assertNotEqual(_get_key({"foo"}), checkpoint.get_key("shell", arguments))
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.clone_cache` re-uses repositories."""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+import git
+from rez_batch_process.core.gitter import clone_cache
+
+
+class Normalize(unittest.TestCase):
+    """Make sure every URL protocol creates the same cache key."""
+
+    def test_equivalent(self):
+        """Get the same key for SSH, HTTPS, and trailing-slash URLs."""
+        expected = "github.com/ColinKennedy/rez_developer_packages"
+
+        for url in (
+            "git@github.com:ColinKennedy/rez_developer_packages.git",
+            "https://github.com/ColinKennedy/rez_developer_packages",
+            "https://GitHub.com/ColinKennedy/rez_developer_packages.git/",
+            "ssh://git@github.com/ColinKennedy/rez_developer_packages.git",
+        ):
+            self.assertEqual(expected, clone_cache.normalize_url(url))
+
+    def test_local_path(self):
+        """Keep local repository paths as paths."""
+        self.assertEqual(
+            os.path.join("tmp", "foo", "bar"),
+            clone_cache.normalize_url(os.path.join(os.sep, "tmp", "foo", "bar.git")),
+        )
+
+
+class LockFile(unittest.TestCase):
+    """Take over lock files which were left behind by other processes."""
+
+    def setUp(self):
+        """Make a folder for lock files."""
+        self._root = tempfile.mkdtemp(suffix="_lock_file_test")
+        self.addCleanup(shutil.rmtree, self._root)
+        self._path = os.path.join(self._root, "some.lock")
+
+    def _write(self, pid):
+        """Create a lock file which is owned by `pid`."""
+        with open(self._path, "w") as handler:
+            handler.write(str(pid))
+
+    def _get_pid(self):
+        """str: Get the process ID written in the lock file."""
+        with open(self._path, "r") as handler:
+            return handler.read()
+
+    def test_active(self):
+        """Wait for a lock whose process is still running."""
+        self._write(os.getpid())
+        lock = clone_cache._LockFile(  # pylint: disable=protected-access
+            self._path, timeout=60
+        )
+
+        self.assertFalse(lock.acquire(blocking=False))
+
+    @unittest.skipIf(os.name != "posix", "Only POSIX can check other processes.")
+    def test_dead_process(self):
+        """Take over a lock whose process no longer exists."""
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        self._write(process.pid)
+        lock = clone_cache._LockFile(  # pylint: disable=protected-access
+            self._path, timeout=60
+        )
+
+        self.assertTrue(lock.acquire(blocking=False))
+        self.assertEqual(str(os.getpid()), self._get_pid())
+
+    def test_timeout(self):
+        """Take over a lock which is older than the timeout."""
+        self._write(os.getpid())
+        past = time.time() - 120
+        os.utime(self._path, (past, past))
+        lock = clone_cache._LockFile(  # pylint: disable=protected-access
+            self._path, timeout=60
+        )
+
+        self.assertTrue(lock.acquire(blocking=False))
+
+
+class Cache(unittest.TestCase):
+    """Check out, update, and evict cached repositories."""
+
+    def setUp(self):
+        """Create a fake remote git repository to clone from."""
+        self._root = tempfile.mkdtemp(suffix="_clone_cache_test")
+        self._remote = os.path.join(self._root, "remote")
+        repository = git.Repo.init(self._remote)
+        _commit(repository, "first.txt")
+        self._remote_repository = repository
+
+    def tearDown(self):
+        """Delete every temporary folder."""
+        shutil.rmtree(self._root)
+
+    def _make_checkout(self, cache, name):
+        directory = os.path.join(self._root, name)
+
+        return cache.add_checkout(self._remote, directory)
+
+    def test_fetch(self):
+        """Fetch new commits into an existing cache instead of re-cloning."""
+        cache = clone_cache.CloneCache(os.path.join(self._root, "cache"))
+        first = self._make_checkout(cache, "checkout_a")
+        mirror = cache.get_mirror_directory(self._remote)
+
+        self.assertTrue(os.path.isfile(os.path.join(first.working_dir, "first.txt")))
+
+        _commit(self._remote_repository, "second.txt")
+        second = self._make_checkout(cache, "checkout_b")
+
+        self.assertEqual(mirror, cache.get_mirror_directory(self._remote))
+        self.assertTrue(os.path.isfile(os.path.join(second.working_dir, "second.txt")))
+        self.assertEqual(
+            self._remote_repository.active_branch.name, second.active_branch.name
+        )
+
+    def test_clear(self):
+        """Delete checkouts but don't touch the cache."""
+        cache = clone_cache.CloneCache(os.path.join(self._root, "cache"))
+        repository = self._make_checkout(cache, "checkout")
+        repository.create_head("some_feature_branch").checkout()
+
+        cache.clear_checkouts()
+
+        mirror = git.Repo(cache.get_mirror_directory(self._remote))
+
+        self.assertFalse(os.path.isdir(repository.working_dir))
+        self.assertEqual(
+            [self._remote_repository.active_branch.name],
+            [branch.name for branch in mirror.branches],
+        )
+
+    def test_remote(self):
+        """Pull from and push to the original remote, not the cache."""
+        cache = clone_cache.CloneCache(os.path.join(self._root, "cache"))
+        repository = self._make_checkout(cache, "checkout")
+
+        self.assertEqual([self._remote], list(repository.remotes.origin.urls))
+
+    def test_evict(self):
+        """Delete the least recently used repository once the cache is too big."""
+        cache = clone_cache.CloneCache(
+            os.path.join(self._root, "cache"), maximum_size=1
+        )
+        repository = self._make_checkout(cache, "checkout")
+        mirror = cache.get_mirror_directory(self._remote)
+
+        self.assertEqual([mirror], cache.evict())
+        self.assertFalse(os.path.isdir(mirror))
+        self.assertTrue(repository.head.commit)  # The checkout doesn't need the cache
+
+
+def _commit(repository, name):
+    """Add a new, empty file to `repository` and commit it."""
+    open(os.path.join(repository.working_dir, name), "a").close()
+    repository.index.add([name])
+    repository.index.commit("Added {name}".format(name=name))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.cloner` clones only what's needed."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import git
+from rez_batch_process.core.gitter import clone_cache, cloner
+
+
+class Clone(unittest.TestCase):
+    """Clone repositories in each mode."""
+
+    def setUp(self):
+        """Create a fake remote git repository with 2 commits and 2 Rez packages."""
+        self._root = tempfile.mkdtemp(suffix="_cloner_test")
+        self._remote = os.path.join(self._root, "remote")
+        repository = git.Repo.init(self._remote)
+        _commit(
+            repository,
+            {
+                os.path.join("package_a", "package.py"): 'name = "package_a"',
+                os.path.join("package_a", "python", "a.py"): "",
+                os.path.join("package_b", "package.py"): 'name = "package_b"',
+                os.path.join("package_b", "python", "b.py"): "",
+            },
+        )
+        _commit(repository, {"README.md": "Some text"})
+
+    def tearDown(self):
+        """Delete every temporary folder."""
+        shutil.rmtree(self._root)
+
+    def _clone(self, mode):
+        """:class:`git.Repo`: Clone the fake remote repository."""
+        return cloner.clone(self._remote, os.path.join(self._root, mode), mode=mode)
+
+    def _get_files(self, repository):
+        """set[str]: Get every checked out file, relative to `repository`."""
+        root = repository.working_dir
+        output = set()
+
+        for directory, folders, files in os.walk(root):
+            if ".git" in folders:
+                folders.remove(".git")
+
+            for name in files:
+                output.add(os.path.relpath(os.path.join(directory, name), root))
+
+        return output
+
+    def test_full(self):
+        """Clone every commit and file."""
+        repository = self._clone(cloner.FULL)
+
+        self.assertEqual(2, len(list(repository.iter_commits())))
+        self.assertEqual(5, len(self._get_files(repository)))
+
+    def test_shallow(self):
+        """Clone only the latest commit but every file."""
+        repository = self._clone(cloner.SHALLOW)
+
+        self.assertEqual(1, len(list(repository.iter_commits())))
+        self.assertEqual(5, len(self._get_files(repository)))
+        self.assertEqual([self._remote], list(repository.remotes.origin.urls))
+
+    def test_sparse(self):
+        """Check out only Rez package files until a folder is included."""
+        repository = self._clone(cloner.SPARSE)
+
+        self.assertEqual(1, len(list(repository.iter_commits())))
+        self.assertEqual(
+            {
+                os.path.join("package_a", "package.py"),
+                os.path.join("package_b", "package.py"),
+            },
+            self._get_files(repository),
+        )
+
+        cloner.include_folders(
+            repository, [os.path.join(repository.working_dir, "package_a")]
+        )
+
+        self.assertEqual(
+            {
+                os.path.join("package_a", "package.py"),
+                os.path.join("package_a", "python", "a.py"),
+                os.path.join("package_b", "package.py"),
+            },
+            self._get_files(repository),
+        )
+        self.assertFalse(repository.is_dirty(untracked_files=True))
+
+    def test_include_full(self):
+        """Do nothing when including a folder that's already checked out."""
+        repository = self._clone(cloner.FULL)
+        cloner.include_folders(
+            repository, [os.path.join(repository.working_dir, "package_a")]
+        )
+
+        self.assertEqual(5, len(self._get_files(repository)))
+
+    def test_cache(self):
+        """Check out only Rez package files from a cached repository."""
+        cache = clone_cache.CloneCache(os.path.join(self._root, "cache"))
+        repository = cache.add_checkout(
+            self._remote, os.path.join(self._root, "checkout"), sparse=True
+        )
+
+        self.assertEqual(
+            {
+                os.path.join("package_a", "package.py"),
+                os.path.join("package_b", "package.py"),
+            },
+            self._get_files(repository),
+        )
+
+    def test_invalid(self):
+        """Don't allow unknown modes."""
+        with self.assertRaises(ValueError):
+            self._clone("not_a_mode")
+
+
+def _commit(repository, files):
+    """Write `files` into `repository` and commit them.
+
+    Args:
+        repository (:class:`git.Repo`): The repository to modify.
+        files (dict[str, str]): Each relative file path and its contents.
+
+    """
+    for name, text in files.items():
+        path = os.path.join(repository.working_dir, name)
+        directory = os.path.dirname(path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(path, "w") as handler:
+            handler.write(text)
+
+    repository.index.add(list(files))
+    repository.index.commit("Added {files}".format(files=", ".join(sorted(files))))
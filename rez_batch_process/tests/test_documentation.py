@@ -48,7 +48,10 @@ class Add(common.Common):
             "rez_batch_process.core.gitter.git_registry.get_remote_adapter"
         ) as patch:
             patch.create_pull_request = lambda *args, **kwargs: None
-            ran, un_ran, invalids = worker.run(runner, packages)
+            # Keep each worktree so that its pushed branch can be checked
+            ran, un_ran, invalids = worker.run(
+                runner, packages, keep_temporary_files=True
+            )
 
         self.assertEqual((set(), []), (un_ran, invalids))
 
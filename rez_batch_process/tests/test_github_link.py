@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.github_link` submits pull requests."""
+
+import unittest
+
+from github3 import exceptions as github3_exceptions
+from rez_batch_process.core.gitter import base_adapter, github_link, submission
+from six.moves import mock
+
+
+class CreatePullRequest(unittest.TestCase):
+    """Create pull requests and request their reviewers."""
+
+    def setUp(self):
+        """Replace every GitHub connection with a fake one."""
+        self._repository = mock.Mock()
+        self._repository.owner.login = "some_owner"
+        self._repository.contributors.return_value = []
+
+        user = mock.Mock()
+        user.repository.return_value = self._repository
+
+        for patcher in [
+            mock.patch.object(github_link, "get_user", return_value=user),
+            mock.patch.object(github_link.user_directory, "get_directory"),
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self._adapter = github_link.GithubAdapter(mock.Mock(authors=[]), "some_token")
+        self._details = base_adapter.PullRequestDetails(
+            "https://github.com/some_owner/some_repository.git",
+            "some_branch",
+            "master",
+        )
+
+    def test_existing(self):
+        """Re-use a pull request which an earlier, interrupted attempt already created."""
+        existing = mock.Mock()
+        self._repository.create_pull.side_effect = [
+            github3_exceptions.ConnectionError(ValueError("Aborted.")),
+            github3_exceptions.UnprocessableEntity(_make_response(422)),
+        ]
+        self._repository.pull_requests.return_value = iter([existing])
+
+        self._adapter.create_pull_request(
+            "Some title",
+            "Some body",
+            self._details,
+            retry=lambda function: submission.call(function, pause=mock.Mock()),
+        )
+
+        self.assertEqual(2, self._repository.create_pull.call_count)
+        self._repository.pull_requests.assert_called_once_with(
+            state="open", head="some_owner:some_branch", base="master"
+        )
+        existing.create_review_requests.assert_called_once_with(
+            reviewers=["some_owner"]
+        )
+
+    def test_rejected(self):
+        """Fail if the pull request couldn't be created and doesn't exist."""
+        self._repository.create_pull.side_effect = (
+            github3_exceptions.UnprocessableEntity(_make_response(422))
+        )
+        self._repository.pull_requests.return_value = iter([])
+
+        with self.assertRaises(github3_exceptions.UnprocessableEntity):
+            self._adapter.create_pull_request("Some title", "Some body", self._details)
+
+
+def _make_response(status):
+    """:class:`mock.Mock`: Create a fake :class:`requests.Response`."""
+    response = mock.Mock(status_code=status, headers=dict(), content=b"")
+    response.json.return_value = dict()
+
+    return response
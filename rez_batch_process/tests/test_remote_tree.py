@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.remote_tree` never checks out files."""
+
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+import git
+from rez_batch_process.core.gitter import clone_cache, cloner, remote_tree
+from six.moves import mock
+
+_CONF = textwrap.dedent(
+    """\
+    project = "some_project"
+    release = "1.0.0"
+    version = "1.0"
+    """
+)
+
+
+class HasPackageConf(unittest.TestCase):
+    """Find Sphinx conf.py files from a repository's file names."""
+
+    def setUp(self):
+        """Create a fake remote git repository with a few Rez packages."""
+        remote_tree.clear_cache()
+        self._root = tempfile.mkdtemp(suffix="_remote_tree_test")
+        self._remote = os.path.join(self._root, "remote")
+        repository = git.Repo.init(self._remote)
+
+        _commit(
+            repository,
+            {
+                os.path.join("folder_a", "package.py"): 'name = "package_a"\n',
+                os.path.join("folder_a", "documentation", "source", "conf.py"): _CONF,
+                os.path.join("package_b", "package.py"): 'name = "package_b"\n',
+                os.path.join("package_b", "other", "conf.py"): "# Not a Sphinx file\n",
+                os.path.join("package_c", "package.py"): 'name = "package_c"\n',
+            },
+        )
+
+    def tearDown(self):
+        """Delete every temporary folder."""
+        remote_tree.clear_cache()
+        shutil.rmtree(self._root)
+
+    def test_found(self):
+        """Find a conf.py, even if the Rez package's folder has a different name."""
+        self.assertTrue(remote_tree.has_package_conf(self._remote, "package_a"))
+
+    def test_invalid(self):
+        """Ignore a conf.py which isn't a Sphinx file."""
+        self.assertFalse(remote_tree.has_package_conf(self._remote, "package_b"))
+
+    def test_no_documentation(self):
+        """Don't find documentation for a Rez package which has none."""
+        self.assertFalse(remote_tree.has_package_conf(self._remote, "package_c"))
+
+    def test_missing(self):
+        """Don't find documentation for a Rez package that doesn't exist."""
+        self.assertFalse(remote_tree.has_package_conf(self._remote, "package_z"))
+
+    def test_clone_once(self):
+        """Clone each repository only once, without checking out any file."""
+        with mock.patch(
+            "rez_batch_process.core.gitter.cloner.clone_metadata",
+            wraps=cloner.clone_metadata,
+        ) as clone:
+            remote_tree.has_package_conf(self._remote, "package_a")
+            remote_tree.has_package_conf(self._remote, "package_c")
+
+        self.assertEqual(1, clone.call_count)
+
+        tree = remote_tree.get_tree(self._remote)
+        repository = tree._repository  # pylint: disable=protected-access
+
+        self.assertTrue(repository.bare)
+
+    def test_directory(self):
+        """Clone into the user's temporary directory and re-use it on the next run."""
+        directory = os.path.join(self._root, "clones")
+
+        self.assertTrue(
+            remote_tree.has_package_conf(
+                self._remote, "package_a", keep=True, directory=directory
+            )
+        )
+        self.assertTrue(
+            os.path.isdir(os.path.join(directory, "remote_trees", "remote"))
+        )
+
+        remote_tree.clear_cache()
+
+        with mock.patch("rez_batch_process.core.gitter.cloner.clone_metadata") as clone:
+            self.assertTrue(
+                remote_tree.has_package_conf(
+                    self._remote, "package_a", keep=True, directory=directory
+                )
+            )
+
+        self.assertFalse(clone.called)
+
+    def test_cache(self):
+        """Read from a cached, bare repository instead of cloning."""
+        cache = clone_cache.CloneCache(os.path.join(self._root, "cache"))
+
+        with mock.patch("rez_batch_process.core.gitter.cloner.clone_metadata") as clone:
+            self.assertTrue(
+                remote_tree.has_package_conf(self._remote, "package_a", cache=cache)
+            )
+
+        self.assertFalse(clone.called)
+        self.assertTrue(os.path.isdir(cache.get_mirror_directory(self._remote)))
+
+
+def _commit(repository, files):
+    """Write `files` into `repository` and commit them.
+
+    Args:
+        repository (:class:`git.Repo`): The repository to modify.
+        files (dict[str, str]): Each relative file path and its contents.
+
+    """
+    for name, text in files.items():
+        path = os.path.join(repository.working_dir, name)
+        directory = os.path.dirname(path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(path, "w") as handler:
+            handler.write(text)
+
+    repository.index.add(list(files))
+    repository.index.commit("Added {files}".format(files=", ".join(sorted(files))))
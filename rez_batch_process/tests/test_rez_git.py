@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.rez_git` finds repositories efficiently."""
+
+import os
+import tempfile
+
+from python_compatibility.testing import common
+from rez_batch_process.core import exceptions, rez_git
+
+from . import package_common
+
+
+class GetRepositoryUrl(common.Common):
+    """Make sure :func:`rez_batch_process.core.rez_git.get_repository_url` is cached."""
+
+    def setUp(self):
+        """Forget any repository which a previous test found."""
+        super(GetRepositoryUrl, self).setUp()
+
+        rez_git.clear_cache()
+
+    def test_siblings(self):
+        """Query git only once for Rez packages that share a repository."""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        urls = {rez_git.get_repository_url(package) for package in packages}
+        statistics = rez_git.get_statistics()
+
+        self.assertEqual({remote_root}, urls)
+        self.assertEqual(1, statistics["misses"])
+        self.assertEqual(1, statistics["hits"])
+
+    def test_shared_handle(self):
+        """Re-use the same repository object for Rez packages that share a repository."""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        repository_a, repository_b = [
+            rez_git.get_repository(package) for package in packages
+        ]
+
+        self.assertIs(repository_a, repository_b)
+
+        rez_git.clear_cache()
+
+        self.assertIsNot(repository_a, rez_git.get_repository(packages[0]))
+
+    def test_no_repository(self):
+        """Remember Rez packages which have no repository."""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        package = package_common.make_package(
+            "project_a", root, package_common.make_source_package
+        )
+
+        for _ in range(2):
+            with self.assertRaises(exceptions.NoGitRepository):
+                rez_git.get_repository_url(package)
+
+        statistics = rez_git.get_statistics()
+
+        self.assertEqual(1, statistics["misses"])
+        self.assertEqual(1, statistics["hits"])
+        self.assertEqual(1, statistics["symlink_traces"])
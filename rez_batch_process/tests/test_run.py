@@ -7,18 +7,24 @@
 
 """
 
+import json
 import logging
 import os
+import sys
 import tempfile
 import textwrap
+import unittest
 
 import git
 import wurlitzer
 from rez import packages_
 from rez.config import config
-from rez_batch_process.core import exceptions, worker
+from rez_batch_process import cli
+from rez_batch_process.core import checkpoint, exceptions, tracing, worker
+from rez_batch_process.core.gitter import cloner, worktree
+from rez_batch_process.core.plugins import command
 from rez_utilities import creator, finder, inspection, rez_configuration
-from six.moves import mock
+from six.moves import StringIO, mock
 
 from . import package_common
 
@@ -119,6 +125,47 @@ class Fix(package_common.Tests):
         self._test((set(), [], []), [release_path])
         self.assertEqual(2, run_command.call_count)
 
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_two_single_walk(self, run_command):
+        """Search a repository for Rez packages once, even if it has 2+ packages.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        run_command.return_value = ""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        packages = [
+            package_common.make_package(
+                "project_a", root, package_common.make_source_python_package
+            ),
+            package_common.make_package(
+                "project_b", root, package_common.make_source_python_package
+            ),
+        ]
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            packages, root
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+        release_path = _release_packages(packages)
+        self.delete_item_later(release_path)
+
+        with mock.patch(
+            "rez_batch_process.core.worker._make_package_index",
+            wraps=worker._make_package_index,  # pylint: disable=protected-access
+        ) as indexer:
+            self._test((set(), [], []), [release_path])
+
+        self.assertEqual(2, run_command.call_count)
+        self.assertEqual(1, indexer.call_count)
+
     @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
     def test_mix(self, run_command):
         """Run command on only to the Rez packages that need it.
@@ -242,6 +289,338 @@ class Fix(package_common.Tests):
 
         self.assertEqual(7, run_command.call_count)
 
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_multiple_parallel(self, run_command):
+        """Run command on Rez packages from more than one repository, at once.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package. If
+                this function gets run, we know that this test passes.
+
+        """
+        run_command.return_value = ""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository_a, packages_a, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository_a.working_dir)
+        self.delete_item_later(remote_root)
+
+        repository_b, packages_b, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_c", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository_b.working_dir)
+        self.delete_item_later(remote_root)
+
+        release_path = _release_packages(packages_a + packages_b)
+        self.delete_item_later(release_path)
+
+        with rez_configuration.patch_packages_path([release_path]):
+            self._test((set(), [], []), [release_path], jobs=2)
+
+        self.assertEqual(
+            ["project_a", "project_b", "project_c"],
+            sorted(call[0][0].name for call in run_command.call_args_list),
+        )
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_sparse(self, run_command):
+        """Run a command on Rez packages with only their files checked out.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package. If
+                this function gets run, we know that this test passes.
+
+        """
+        found = dict()
+
+        def _run(package, **_):
+            root = finder.get_package_root(package)
+            found[package.name] = os.path.isdir(os.path.join(root, "python"))
+
+            return ""
+
+        run_command.side_effect = _run
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        release_path = _release_packages(packages)
+        self.delete_item_later(release_path)
+
+        with rez_configuration.patch_packages_path([release_path]):
+            self._test((set(), [], []), [release_path], clone_mode=cloner.SPARSE)
+
+        self.assertEqual({"project_a": True, "project_b": True}, found)
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_worktree(self, run_command):
+        """Modify each Rez package of a repository in its own worktree, at once.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        roots = dict()
+
+        def _run(package, **_):
+            root = finder.get_package_root(package)
+            roots[package.name] = root
+
+            with open(os.path.join(root, "modified.txt"), "w") as handler:
+                handler.write("Some change")
+
+            return ""
+
+        run_command.side_effect = _run
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        release_path = _release_packages(packages)
+        self.delete_item_later(release_path)
+
+        # The clone inside of this folder is deleted once Python exits
+        temporary_directory = tempfile.mkdtemp(suffix="_worktrees")
+
+        with rez_configuration.patch_packages_path([release_path]):
+            self._test(
+                (set(), [], []),
+                [release_path],
+                jobs=2,
+                temporary_directory=temporary_directory,
+            )
+
+        self.assertEqual({"project_a", "project_b"}, set(roots))
+        self.assertNotEqual(
+            os.path.dirname(roots["project_a"]), os.path.dirname(roots["project_b"])
+        )
+
+        # Each worktree is made in the temporary directory and removed once it's done
+        for path in roots.values():
+            self.assertTrue(path.startswith(temporary_directory + os.sep))
+            self.assertFalse(os.path.isdir(path))
+
+        roots.clear()
+
+        with rez_configuration.patch_packages_path([release_path]):
+            self._test(
+                (set(), [], []),
+                [release_path],
+                jobs=2,
+                keep_temporary_files=True,
+            )
+
+        self.assertEqual({"project_a", "project_b"}, set(roots))
+
+        # Each kept worktree keeps its changes, even though they weren't committed
+        for path in roots.values():
+            self.delete_item_later(os.path.dirname(path))
+            self.assertTrue(os.path.isfile(os.path.join(path, "modified.txt")))
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_worktree_error(self, run_command):
+        """Keep running other Rez packages if one package's worktree can't be made.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        ran = set()
+
+        def _run(package, **_):
+            ran.add(package.name)
+
+            return ""
+
+        run_command.side_effect = _run
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        release_path = _release_packages(packages)
+        self.delete_item_later(release_path)
+        add = worktree.add
+
+        def _add(repository, folder, directory=""):
+            if os.path.basename(folder) == "project_a":
+                raise git.GitCommandError(["git", "worktree", "add"], 128)
+
+            return add(repository, folder, directory=directory)
+
+        with rez_configuration.patch_packages_path([release_path]), mock.patch.object(
+            worktree, "add", side_effect=_add
+        ):
+            unfixed, _, _ = self._test_unhandled([release_path], jobs=2)
+
+        self.assertEqual({"project_b"}, ran)
+        self.assertEqual(["project_a"], [package.name for package, _ in unfixed])
+        self.assertIsInstance(next(iter(unfixed))[1], git.GitCommandError)
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_resume(self, run_command):
+        """Skip Rez packages which an interrupted run already completed.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        run_command.return_value = ""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        release_path = _release_packages(packages)
+        self.delete_item_later(release_path)
+
+        journal_directory = tempfile.mkdtemp(suffix="_journal")
+        self.delete_item_later(journal_directory)
+        journal = checkpoint.Journal(os.path.join(journal_directory, "run.jsonl"))
+        journal.record("project_a", checkpoint.STARTED)
+        journal.record("project_a", checkpoint.RAN)
+        journal.record("project_b", checkpoint.STARTED)  # The run was interrupted here
+
+        with checkpoint.activate(journal):
+            with rez_configuration.patch_packages_path([release_path]):
+                self._test((set(), [], []), [release_path])
+
+        self.assertEqual(
+            ["project_b"], [call[0][0].name for call in run_command.call_args_list]
+        )
+        self.assertEqual({"project_a", "project_b"}, journal.get_completed())
+
+    @mock.patch("rez_batch_process.core.plugins.command.RezShellCommand.run")
+    def test_trace(self, run_command):
+        """Record how long each phase took, per Rez package and repository.
+
+        Args:
+            run_command (:class:`mock.MagicMock`):
+                A replacement for the function that would normally run
+                as part of the commands that run on a Rez package.
+
+        """
+        run_command.return_value = ""
+        root = os.path.join(tempfile.mkdtemp(), "test_folder")
+        os.makedirs(root)
+        self.delete_item_later(root)
+
+        repository, packages, remote_root = package_common.make_fake_repository(
+            [
+                package_common.make_package(
+                    "project_a", root, package_common.make_source_python_package
+                ),
+                package_common.make_package(
+                    "project_b", root, package_common.make_source_python_package
+                ),
+            ],
+            root,
+        )
+        self.delete_item_later(repository.working_dir)
+        self.delete_item_later(remote_root)
+
+        release_path = _release_packages(packages)
+        self.delete_item_later(release_path)
+        tracer = tracing.Tracer()
+
+        with tracing.activate(tracer):
+            with rez_configuration.patch_packages_path([release_path]):
+                self._test((set(), [], []), [release_path])
+
+        totals = {total.name: total.count for total in tracer.get_totals()}
+
+        self.assertEqual(1, totals["clone"])
+        self.assertEqual(2, totals["find_package_definitions"])
+        self.assertEqual(2, totals["add_worktree"])
+        self.assertEqual(2, totals["run_package"])
+        self.assertEqual(1, totals["report"])
+
+    def test_invalid_jobs(self):
+        """Don't allow a run to process less than one repository at a time."""
+        with self.assertRaises(ValueError):
+            worker.run(lambda package: "", [], jobs=0)
+
     @mock.patch(
         "rez_batch_process.core.plugins.command.RezShellCommand._create_pull_request"
     )
@@ -872,6 +1251,107 @@ class Bad(package_common.Tests):
         with rez_configuration.patch_packages_path([repository.working_dir]):
             self._test(expected)
 
+    def test_rejected_push(self):
+        """Fail if git reports that the remote didn't accept a pushed branch."""
+        branch = mock.Mock()
+        branch.__str__ = mock.Mock(return_value="some_branch")
+        accepted = mock.Mock(flags=git.PushInfo.NEW_HEAD, summary="[new branch]")
+        rejected = mock.Mock(flags=git.PushInfo.REJECTED, summary="[rejected]\n")
+
+        command._validate_push([accepted], branch)  # pylint: disable=protected-access
+
+        with self.assertRaises(RuntimeError) as context:
+            command._validate_push(  # pylint: disable=protected-access
+                [accepted, rejected], branch
+            )
+
+        self.assertEqual(
+            'Could not push to "some_branch". Got "[rejected]".',
+            str(context.exception),
+        )
+
+
+class Report(unittest.TestCase):
+    """Make sure :func:`.iter_report` stops as soon as a limit is reached."""
+
+    def setUp(self):
+        """Pretend that every Rez package has a repository named after its first letter."""
+        patcher = mock.patch(
+            "rez_batch_process.core.rez_git.get_repository_url",
+            side_effect=lambda package: package.name[0],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self._consumed = []
+
+    def _iter_packages(self, names):
+        for name in names:
+            self._consumed.append(name)
+            package = mock.MagicMock()
+            package.name = name
+
+            yield package
+
+    def _get_names(self, names, **kwargs):
+        return [
+            package.name
+            for package, _, _ in worker.iter_report(
+                self._iter_packages(names), **kwargs
+            )
+        ]
+
+    def test_maximum_rez_packages(self):
+        """Stop querying Rez packages once enough have been found."""
+        names = self._get_names(["a1", "a2", "b1", "b2"], maximum_rez_packages=2)
+
+        self.assertEqual(["a1", "a2"], names)
+        self.assertEqual(["a1", "a2"], self._consumed)
+
+    def test_maximum_repositories(self):
+        """Keep Rez packages from known repositories but stop at a new repository."""
+        names = self._get_names(["a1", "b1", "a2", "c1", "a3"], maximum_repositories=2)
+
+        self.assertEqual(["a1", "b1", "a2"], names)
+        self.assertEqual(["a1", "b1", "a2", "c1"], self._consumed)
+
+    def test_report(self):
+        """Split valid and invalid Rez packages, like before."""
+        packages, invalids = worker.report(
+            self._iter_packages(["a1", "b1"]), maximum_rez_packages=1
+        )
+
+        self.assertEqual(["a1"], [package.name for package in packages])
+        self.assertEqual([], invalids)
+
+    def test_stream_skipped(self):
+        """Print a "skipped" row for each Rez package not in --rez-packages."""
+        packages = list(self._iter_packages(["a1", "b1"]))
+        arguments = mock.MagicMock(
+            format="json-lines",
+            ignore_patterns=[],
+            maximum_repositories=sys.maxsize,
+            maximum_rez_packages=sys.maxsize,
+            packages_path=[],
+            rez_packages=["a1"],
+            search_packages_path=[],
+        )
+
+        stdout = StringIO()
+
+        with mock.patch(
+            "rez_batch_process.core.registry.get_package_finder",
+            return_value=lambda paths: (packages, [], []),
+        ), mock.patch.object(finder, "get_package_root", return_value=""):
+            with mock.patch("sys.stdout", stdout):
+                cli._stream_report(arguments)  # pylint: disable=protected-access
+
+        rows = [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+        self.assertEqual(
+            {("a1", "affected"), ("b1", "skipped")},
+            {(row["name"], row["status"]) for row in rows},
+        )
+
 
 def _release_packages(packages, search_paths=None):
     """Release 1+ Rez packages.
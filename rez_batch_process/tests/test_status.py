@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.status` finds changed folders."""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import git
+from rez_batch_process.core.gitter import status
+
+
+class Snapshot(unittest.TestCase):
+    """Find changes in many folders with one ``git status`` call."""
+
+    def setUp(self):
+        """Make a repository with a few committed folders."""
+        self._root = tempfile.mkdtemp(suffix="_status")
+        self._repository = git.Repo.init(self._root)
+
+        with self._repository.config_writer() as writer:
+            writer.set_value("user", "name", "Some Name")
+            writer.set_value("user", "email", "some@example.com")
+
+        for name in ["project_a", "project_b", "project_c", "project_d"]:
+            self._write(os.path.join(name, "package.py"), "name = '{}'".format(name))
+
+        self._repository.git.add(".")
+        self._repository.index.commit("Initial commit")
+
+    def tearDown(self):
+        """Delete the repository."""
+        self._repository.close()
+        shutil.rmtree(self._root)
+
+    def _get_roots(self, *names):
+        """list[str]: Get the absolute paths of folders in the repository."""
+        return [os.path.join(self._root, name) for name in names]
+
+    def _write(self, path, text):
+        """Write `text` to a file in the repository."""
+        path = os.path.join(self._root, path)
+        directory = os.path.dirname(path)
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        with open(path, "w") as handler:
+            handler.write(text)
+
+    def test_changes(self):
+        """Find modified, untracked, and renamed files."""
+        self._write(os.path.join("project_a", "package.py"), "name = 'changed'")
+        self._write(os.path.join("project_b", "new", "folder", "file.txt"), "")
+        self._repository.git.mv(
+            os.path.join("project_c", "package.py"),
+            os.path.join("project_c", "renamed.py"),
+        )
+
+        snapshot = status.Snapshot(self._repository)
+
+        self.assertEqual(
+            set(self._get_roots("project_a", "project_b", "project_c")),
+            snapshot.get_changed_roots(
+                self._get_roots("project_a", "project_b", "project_c", "project_d")
+            ),
+        )
+        self.assertTrue(snapshot.has_changes(self._root))
+
+    def test_prefix(self):
+        """Don't confuse a folder with another folder that starts with its name."""
+        self._write(os.path.join("project_a2", "file.txt"), "")
+
+        snapshot = status.Snapshot(self._repository)
+
+        self.assertFalse(snapshot.has_changes(os.path.join(self._root, "project_a")))
+        self.assertEqual({"project_a2/file.txt"}, snapshot.get_paths())
+
+    def test_no_changes(self):
+        """Report nothing if the repository is clean."""
+        snapshot = status.Snapshot(self._repository)
+
+        self.assertEqual(set(), snapshot.get_paths())
+        self.assertFalse(snapshot.has_changes(self._root))
+
+    def test_paths(self):
+        """Only run ``git status`` on the given folders."""
+        self._write(os.path.join("project_a", "package.py"), "name = 'changed'")
+        self._write(os.path.join("project_b", "file.txt"), "")
+
+        snapshot = status.Snapshot(self._repository, paths=self._get_roots("project_b"))
+
+        self.assertEqual({"project_b/file.txt"}, snapshot.get_paths())
+        self.assertTrue(snapshot.has_changes(os.path.join(self._root, "project_b")))
+        self.assertFalse(snapshot.has_changes(os.path.join(self._root, "project_a")))
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.submission` retries and queues API calls."""
+
+import threading
+import time
+import unittest
+
+from github3 import exceptions as github3_exceptions
+from rez_batch_process.core.gitter import submission
+from six.moves import mock
+
+
+class Call(unittest.TestCase):
+    """Retry API calls which fail for temporary reasons."""
+
+    def test_connection(self):
+        """Retry connection errors with an exponential backoff."""
+        function = mock.Mock(
+            side_effect=[
+                github3_exceptions.ConnectionError(ValueError("Connection aborted.")),
+                github3_exceptions.ConnectionError(ValueError("Connection aborted.")),
+                "done",
+            ]
+        )
+        pause = mock.Mock()
+
+        self.assertEqual("done", submission.call(function, pause=pause))
+        self.assertEqual([mock.call(2.0), mock.call(4.0)], pause.call_args_list)
+
+    def test_rate_limit(self):
+        """Wait until the rate limit resets."""
+        reset = time.time() + 30
+        function = mock.Mock(
+            side_effect=[
+                github3_exceptions.ForbiddenError(
+                    _make_response(
+                        403,
+                        {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(reset)},
+                    )
+                ),
+                "done",
+            ]
+        )
+        pause = mock.Mock()
+
+        self.assertEqual("done", submission.call(function, pause=pause))
+        self.assertAlmostEqual(31, pause.call_args[0][0], delta=1)
+
+    def test_secondary_rate_limit(self):
+        """Wait as long as a secondary rate limit says to."""
+        function = mock.Mock(
+            side_effect=[
+                github3_exceptions.ForbiddenError(
+                    _make_response(403, {"Retry-After": "7"})
+                ),
+                "done",
+            ]
+        )
+        pause = mock.Mock()
+
+        self.assertEqual("done", submission.call(function, pause=pause))
+        self.assertEqual([mock.call(7.0)], pause.call_args_list)
+
+    def test_not_retried(self):
+        """Raise errors which won't be fixed by trying again."""
+        error = github3_exceptions.UnprocessableEntity(_make_response(422, dict()))
+        function = mock.Mock(side_effect=error)
+
+        with self.assertRaises(github3_exceptions.UnprocessableEntity):
+            submission.call(function, pause=mock.Mock())
+
+        self.assertEqual(1, function.call_count)
+
+    def test_attempts(self):
+        """Stop retrying after the last attempt."""
+        function = mock.Mock(
+            side_effect=github3_exceptions.ConnectionError(ValueError("Aborted."))
+        )
+
+        with self.assertRaises(github3_exceptions.ConnectionError):
+            submission.call(function, attempts=3, pause=mock.Mock())
+
+        self.assertEqual(3, function.call_count)
+
+
+class Queue(unittest.TestCase):
+    """Submit pull requests in the background."""
+
+    def test_background(self):
+        """Return immediately and never call more functions at once than allowed."""
+        release = threading.Event()
+        lock = threading.Lock()
+        counts = {"current": 0, "maximum": 0}
+
+        def _submit(_):
+            with lock:
+                counts["current"] += 1
+                counts["maximum"] = max(counts["maximum"], counts["current"])
+
+            release.wait(10)
+
+            with lock:
+                counts["current"] -= 1
+
+        def _fail(_):
+            raise github3_exceptions.UnprocessableEntity(_make_response(422, dict()))
+
+        queue = submission.SubmissionQueue(jobs=2)
+
+        with submission.activate(queue):
+            for name in ["a", "b", "c", "d"]:
+                submission.submit(name, _submit)
+
+            submission.submit("e", _fail)
+
+        for _ in range(100):
+            with lock:
+                if counts["current"] == 2:
+                    break
+
+            time.sleep(0.05)
+
+        # `submit` returned even though the functions are still running
+        self.assertEqual(2, counts["current"])
+        release.set()
+        summary = queue.join()
+
+        self.assertEqual(["a", "b", "c", "d"], summary.submitted)
+        self.assertEqual(["e"], [name for name, _ in summary.failed])
+        self.assertEqual(2, counts["maximum"])
+
+    def test_no_queue(self):
+        """Call the function immediately if no queue is active."""
+        function = mock.Mock()
+
+        submission.submit("a", function)
+
+        function.assert_called_once_with(submission.call)
+
+    def test_retry_each_call(self):
+        """Only retry the API call which failed, not the whole submission."""
+        create = mock.Mock(
+            side_effect=[
+                github3_exceptions.ConnectionError(ValueError("Aborted.")),
+                "pull request",
+            ]
+        )
+        review = mock.Mock(
+            side_effect=[
+                github3_exceptions.ConnectionError(ValueError("Aborted.")),
+                None,
+            ]
+        )
+
+        def _submit(retry):
+            pull_request = retry(create)
+            retry(lambda: review(pull_request))
+
+        queue = submission.SubmissionQueue(jobs=1)
+        queue._pause = mock.Mock()  # pylint: disable=protected-access
+
+        with submission.activate(queue):
+            submission.submit("a", _submit)
+
+        self.assertEqual(["a"], queue.join().submitted)
+        self.assertEqual(2, create.call_count)
+        self.assertEqual(2, review.call_count)
+
+
+def _make_response(status, headers):
+    """:class:`mock.Mock`: Create a fake :class:`requests.Response`."""
+    response = mock.Mock(status_code=status, headers=headers, content=b"")
+    response.json.return_value = dict()
+
+    return response
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.tracing` records phases correctly."""
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from rez_batch_process.core import tracing
+from six.moves import mock
+
+
+class Tracer(unittest.TestCase):
+    """Record, sum, and write phases."""
+
+    def test_inactive(self):
+        """Don't record anything if no tracer is active."""
+        tracer = tracing.Tracer()
+
+        with tracing.span("clone"):
+            pass
+
+        self.assertEqual([], tracer.get_totals())
+
+    def test_totals(self):
+        """Sum the time of each phase, slowest first."""
+        tracer = tracing.Tracer()
+
+        with mock.patch("time.time", side_effect=[10.0, 11.0, 20.0, 22.5, 30.0, 30.5]):
+            with tracing.activate(tracer):
+                with tracing.span("clone", repository="foo"):
+                    pass
+
+                with tracing.span("push", package="bar"):
+                    pass
+
+                with tracing.span("clone", repository="bar"):
+                    pass
+
+        self.assertEqual(
+            [tracing.Total("push", 1, 2.5), tracing.Total("clone", 2, 1.5)],
+            tracer.get_totals(),
+        )
+
+        table = tracing.get_table(tracer.get_totals()).splitlines()
+
+        self.assertEqual(3, len(table))
+        self.assertEqual(["push", "1", "2.500", "2.500"], table[1].split())
+        self.assertEqual(["clone", "2", "1.500", "0.750"], table[2].split())
+
+    def test_write(self):
+        """Write a Chrome trace-event file, including spans from other threads."""
+        root = tempfile.mkdtemp(suffix="_tracing")
+        self.addCleanup(shutil.rmtree, root)
+        path = os.path.join(root, "trace.json")
+        tracer = tracing.Tracer()
+
+        def _submit():
+            with tracing.span("create_pull_request", package="foo"):
+                pass
+
+        with tracing.activate(tracer):
+            with tracing.span("run_package", package="foo"):
+                thread = threading.Thread(target=_submit, name="submitter")
+                thread.start()
+                thread.join()
+
+        tracer.write(path)
+
+        with open(path, "r") as handler:
+            events = json.load(handler)["traceEvents"]
+
+        spans = {event["name"]: event for event in events if event["ph"] == "X"}
+        names = {event["args"]["name"] for event in events if event["ph"] == "M"}
+
+        self.assertEqual({"create_pull_request", "run_package"}, set(spans))
+        self.assertEqual({"package": "foo"}, spans["run_package"]["args"])
+        self.assertNotEqual(
+            spans["run_package"]["tid"], spans["create_pull_request"]["tid"]
+        )
+        self.assertIn("submitter", names)
+        self.assertLessEqual(
+            spans["run_package"]["ts"], spans["create_pull_request"]["ts"]
+        )
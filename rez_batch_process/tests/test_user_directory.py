@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_batch_process.core.gitter.user_directory` refreshes incrementally."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from rez_batch_process.core.gitter import github_link, user_directory
+from six.moves import BaseHTTPServer
+from six.moves.urllib import parse
+
+
+class _FakeGitHub(object):
+    """A local server which answers the GitHub user requests, like GitHub does."""
+
+    def __init__(self, users):
+        """Start the server.
+
+        Args:
+            users (list[dict[str, object]]):
+                The "id", "login", "name", "email", and "bio" of each user.
+
+        """
+        super(_FakeGitHub, self).__init__()
+
+        self.requests = []
+        self.users = users
+        self._server = BaseHTTPServer.HTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def _make_handler(self):
+        """type: Create a request handler class which serves :attr:`users`."""
+        server = self
+
+        class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                url = parse.urlparse(self.path)
+                path = url.path[len("/api/v3") :]
+                data, next_url = server.get(path, parse.parse_qs(url.query))
+                text = json.dumps(data).encode("utf-8")
+                etag = '"{}"'.format(hashlib.sha1(text).hexdigest())
+
+                if self.headers.get("If-None-Match") == etag:
+                    server.requests.append((path, 304))
+                    self.send_response(304)
+                    self.end_headers()
+
+                    return
+
+                server.requests.append((path, 200))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+
+                if next_url:
+                    self.send_header("Link", '<{}>; rel="next"'.format(next_url))
+
+                self.end_headers()
+                self.wfile.write(text)
+
+            def log_message(self, *_):  # pylint: disable=arguments-differ
+                pass
+
+        return _Handler
+
+    def get(self, path, query):
+        """Find the data and next page URL of some user request.
+
+        Args:
+            path (str): The requested path. e.g. "/users" or "/users/foo".
+            query (dict[str, list[str]]): The parameters of the request.
+
+        Returns:
+            tuple[object, str]: The found data and the next page URL, if any.
+
+        """
+        if path != "/users":
+            login = path.split("/")[-1]
+
+            return next(user for user in self.users if user["login"] == login), ""
+
+        since = int(query.get("since", ["0"])[0])
+        size = int(query.get("per_page", ["30"])[0])
+        found = [
+            {"id": user["id"], "login": user["login"]}
+            for user in self.users
+            if user["id"] > since
+        ]
+        page = found[:size]
+
+        if len(found) <= size:
+            return page, ""
+
+        return (
+            page,
+            "{url}/users?since={since}&per_page={size}".format(
+                url=self.url, since=page[-1]["id"], size=size
+            ),
+        )
+
+    def stop(self):
+        """Shut down the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def url(self):
+        """str: The API URL of this server."""
+        return "http://127.0.0.1:{port}/api/v3".format(
+            port=self._server.server_address[1]
+        )
+
+
+class Directory(unittest.TestCase):
+    """Index and refresh GitHub users."""
+
+    def setUp(self):
+        """Start a fake GitHub with a few users."""
+        user_directory.clear_cache()
+        self._root = tempfile.mkdtemp(suffix="_user_directory")
+        self._path = os.path.join(self._root, "users.json")
+        self._github = _FakeGitHub(
+            [
+                _make_user(1, "jdoe", "John Doe", "john@example.com"),
+                _make_user(2, "msmith", "Mary Smíth", ""),
+                _make_user(3, "jsmith", "John Smith", ""),
+                _make_user(4, "jsmith2", "John Smith", ""),
+            ]
+        )
+
+    def tearDown(self):
+        """Stop the server and delete every temporary file."""
+        self._github.stop()
+        user_directory.clear_cache()
+        shutil.rmtree(self._root)
+
+    def _refresh(self, maximum_age=0):
+        """:class:`.UserDirectory`: Get the latest users from the fake GitHub."""
+        return user_directory.refresh(
+            self._path, "token", base_url=self._github.url, maximum_age=maximum_age
+        )
+
+    def test_find_login(self):
+        """Find a user from an e-mail, login, or their name."""
+        directory = self._refresh()
+
+        self.assertEqual("jdoe", directory.find_login("someone (JOHN@example.com)"))
+        self.assertEqual("jdoe", directory.find_login("@JDoe"))
+        self.assertEqual("msmith", directory.find_login("Smith, Mary"))
+        self.assertEqual("msmith", directory.find_login("ColinKennedy msmith"))
+        self.assertEqual("", directory.find_login("John Smith"))
+        self.assertEqual("", directory.find_login("nobody@example.com"))
+        self.assertEqual(
+            ["jdoe", "msmith"],
+            github_link._convert_to_github_user_names(  # pylint: disable=protected-access
+                ["John Doe", "Mary Smith", "Someone Else"], directory
+            ),
+        )
+
+    def test_incremental(self):
+        """Only download new users and users that changed."""
+        self._refresh()
+        self._github.requests[:] = []
+        self._github.users.append(_make_user(5, "newcomer", "New Comer", ""))
+        self._github.users[0]["email"] = "john.doe@example.com"
+
+        directory = self._refresh()
+
+        self.assertEqual("jdoe", directory.find_login("john.doe@example.com"))
+        self.assertEqual("newcomer", directory.find_login("New Comer"))
+        self.assertEqual(
+            [
+                ("/users", 200),
+                ("/users/jdoe", 200),
+                ("/users/jsmith", 304),
+                ("/users/jsmith2", 304),
+                ("/users/msmith", 304),
+                ("/users/newcomer", 200),
+            ],
+            self._github.requests,
+        )
+
+    def test_pages(self):
+        """Follow the next page of users until every user is found."""
+        self._github.users.extend(
+            _make_user(index, "user_{}".format(index), "", "")
+            for index in range(5, 250)
+        )
+
+        directory = self._refresh()
+
+        self.assertEqual(249, len(directory.get_users()))
+        self.assertEqual(
+            3, len([path for path, _ in self._github.requests if path == "/users"])
+        )
+
+    def test_fresh(self):
+        """Don't request anything if the saved users aren't stale yet."""
+        self._refresh()
+        user_directory.clear_cache()
+        self._github.requests[:] = []
+
+        directory = user_directory.get_directory(
+            self._path, token="token", base_url=self._github.url, maximum_age=60
+        )
+
+        self.assertEqual([], self._github.requests)
+        self.assertEqual("jdoe", directory.get_user("JDOE").login)
+
+    def test_legacy(self):
+        """Read a list of users, written by older versions of ``make-git-users``."""
+        with open(self._path, "w") as handler:
+            json.dump(
+                [{"login": "jdoe", "name": "John Doe", "email": "", "bio": ""}], handler
+            )
+
+        directory = user_directory.get_directory(self._path)
+
+        self.assertEqual("jdoe", directory.find_login("John Doe"))
+        self.assertTrue(directory.is_stale(60))
+
+
+def _make_user(identifier, login, name, email):
+    """dict[str, object]: Create the details of a fake GitHub user."""
+    return {"bio": "", "email": email, "id": identifier, "login": login, "name": name}
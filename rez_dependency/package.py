@@ -8,7 +8,7 @@ authors = ["ColinKennedy"]
 
 private_build_requires = ["rez_build_helper-1.8+<2"]
 
-requires = ["python-2.7+<4", "rez-2.104+<3"]
+requires = ["python-2.7+<4", "rez-2.104+<3", "rez_utilities-3.1+<4"]
 
 build_command = "python -m rez_build_helper --egg python --items bin"
 
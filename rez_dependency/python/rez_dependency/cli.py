@@ -2,7 +2,7 @@
 
 import argparse
 
-from rez import resolved_context
+from rez_utilities import resolver
 
 from ._core import (
     cli_helper,
@@ -17,7 +17,7 @@ from ._core import (
 
 def _get_context(namespace):
     """rez.resolvedContext.ResolvedContext: Find packages from a request + paths."""
-    context = resolved_context.ResolvedContext(
+    context = resolver.get_context(
         namespace.request, package_paths=namespace.packages_path
     )
 
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Compare the per-package cost of finding issue locations, with and without a shared source.
+
+Every ``rez_lint`` checker which reports an issue looks up the row and
+text of some attribute in the package definition file and
+``NeedsComment`` also needs the parso node of ``requires``. This script
+writes a corpus of large package.py files and times that work:
+
+- "uncached" reads, scans, and parses the file again for every lookup,
+  which is how :mod:`rez_lint.core.package_parser` used to work.
+- "shared" uses one :class:`rez_lint.core.package_parser.PackageSource`
+  per file, which is how it works now.
+
+Example:
+    python benchmarks/benchmark_package_source.py --packages 200 --requirements 300
+
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import shutil
+import tempfile
+import timeit
+
+import parso
+from rez_lint.core import package_parser, parso_comment_helper
+
+_ATTRIBUTES = ("version", "requires", "help", "private_build_requires", "variants")
+
+
+def _make_corpus(directory, packages, requirements):
+    """Write many package.py files, each with a long, commented ``requires``.
+
+    Args:
+        directory (str): The folder to write every package.py into.
+        packages (int): The number of package.py files to write.
+        requirements (int): The number of requirements in each file.
+
+    Returns:
+        list[str]: The path to every package.py file.
+
+    """
+    paths = []
+
+    for index in range(packages):
+        lines = [
+            'name = "package_{index}"'.format(index=index),
+            'version = "1.{index}.0"'.format(index=index),
+            'help = [["README", "README.md"]]',
+            'private_build_requires = ["rez_build_helper-1+<2"]',
+            "requires = [",
+        ]
+        lines.extend(
+            '    "dependency_{number}-1+<2",  # Needed by module_{number}'.format(
+                number=number
+            )
+            for number in range(requirements)
+        )
+        lines.extend(["]", 'variants = [["python-2"], ["python-3"]]', ""])
+        path = os.path.join(directory, "package_{index}.py".format(index=index))
+
+        with open(path, "w") as handler:
+            handler.write("\n".join(lines))
+
+        paths.append(path)
+
+    return paths
+
+
+def _lint_shared(path):
+    """Look up every location using one shared source."""
+    for attribute in _ATTRIBUTES:
+        row = package_parser.get_definition_row(path, attribute)
+        package_parser.get_line_at_row(path, row)
+
+    package_parser.get_source(path).get_node("requires")
+    package_parser.clear_source(path)  # Like `rez_lint` does, after each package
+
+
+def _lint_uncached(path):
+    """Read, scan, and parse `path` again for every lookup."""
+    for attribute in _ATTRIBUTES:
+        package_parser.clear_source(path)
+        row = package_parser.get_definition_row(path, attribute)
+        package_parser.clear_source(path)
+        package_parser.get_line_at_row(path, row)
+
+    with open(path, "r") as handler:
+        graph = parso.parse(handler.read())
+
+    parso_comment_helper.find_named_node(graph, "requires")
+    package_parser.clear_source(path)
+
+
+def _parse_arguments():
+    """:class:`argparse.Namespace`: Get the user's corpus size and repeat count."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--packages", type=int, default=200)
+    parser.add_argument("--requirements", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+
+    return parser.parse_args()
+
+
+def main():
+    """Time both strategies and print the best per-package time of each."""
+    arguments = _parse_arguments()
+    directory = tempfile.mkdtemp(suffix="_benchmark_package_source")
+
+    try:
+        paths = _make_corpus(directory, arguments.packages, arguments.requirements)
+
+        for name, function in (("uncached", _lint_uncached), ("shared", _lint_shared)):
+            seconds = min(
+                timeit.repeat(
+                    lambda function=function: [function(path) for path in paths],
+                    number=1,
+                    repeat=arguments.repeat,
+                )
+            )
+            print(
+                "{name:>8}: {milliseconds:.2f} ms per package".format(
+                    name=name, milliseconds=seconds * 1000.0 / len(paths)
+                )
+            )
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 
 name = "rez_lint"
 
-version = "1.5.0"
+version = "1.6.0"
 
 description = 'A "pylint" for Rez packages'
 
@@ -17,9 +17,9 @@ requires = [
     "backports.functools_lru_cache-1.6+<2",
     "parso-0+<1",
     "python-2+<3.8",
-    "rez_python_compatibility-2+<3",
+    "rez_python_compatibility-2.10+<3",
     "rez-2.47+<3",
-    "rez_utilities-2+<3",
+    "rez_utilities-3.1+<4",
     "six-1.13+<2",
 ]
 
@@ -6,6 +6,8 @@
 from __future__ import print_function
 
 import argparse
+import contextlib
+import datetime
 import itertools
 import logging
 import operator
@@ -13,7 +15,7 @@ import os
 import sys
 
 from . import cli
-from .core import exceptions, exit_code, message_description
+from .core import exceptions, exit_code, lint_cache, message_description, profiling
 
 _LOGGER = logging.getLogger("rez_lint")
 __HANDLER = logging.StreamHandler(stream=sys.stdout)
@@ -44,6 +46,89 @@ def _get_log_level(value):
     return logging.ERROR - (value * 10)
 
 
+def _positive_integer(text):
+    """Convert some user-provided text into an integer that is at least 1.
+
+    Args:
+        text (str): Some text to convert. e.g. "4".
+
+    Raises:
+        :class:`argparse.ArgumentTypeError`: If `text` is not a positive integer.
+
+    Returns:
+        int: The converted number.
+
+    """
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            'Value "{text}" is not an integer.'.format(text=text)
+        )
+
+    if value < 1:
+        raise argparse.ArgumentTypeError(
+            'Value "{text}" must be 1 or greater.'.format(text=text)
+        )
+
+    return value
+
+
+def _get_lines(descriptions, arguments):
+    """Format issues so that they can be printed.
+
+    Args:
+        descriptions (list[:class:`.Description`]): The issues to format.
+        arguments (:class:`argparse.Namespace`): The parsed user input.
+
+    Returns:
+        list[str]: The lines to print.
+
+    """
+    lines = []
+    padding_column = max(
+        description.get_padding_column()
+        for description in descriptions
+        if description.is_location_specific()
+    )
+    padding_row = max(
+        description.get_padding_row()
+        for description in descriptions
+        if description.is_location_specific()
+    )
+
+    for header, descriptions in itertools.groupby(
+        descriptions, operator.methodcaller("get_header")
+    ):
+        if not arguments.vimgrep:
+            lines.append("************* " + header)
+
+        for description in descriptions:
+            if arguments.vimgrep:
+                # Note: when vimgrep is enabled, not every item will be printed
+                if description.is_location_specific():
+                    lines.append(description.get_location_data())
+            else:
+                lines.extend(
+                    description.get_message(
+                        verbose=not arguments.concise,
+                        padding=[padding_row, padding_column],
+                    )
+                )
+
+    if arguments.vimgrep:
+        # Make sure that each file + row / column prints in ascending order
+        lines = message_description.sort_with_vimgrep(lines)
+
+    return lines
+
+
+@contextlib.contextmanager
+def _nothing():
+    """Do nothing. Use this in place of a context manager which isn't needed."""
+    yield
+
+
 def _parse_arguments(text):
     """Tokenize the user's input to command-line into something that this package can use.
 
@@ -71,6 +156,27 @@ def _parse_arguments(text):
         "This defaults to the current directory.",
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every Rez package from scratch. Don't re-use or save any results.",
+    )
+
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Delete every saved result before checking any Rez package.",
+    )
+
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        default=1,
+        type=_positive_integer,
+        help="The number of Rez packages to check at the same time, "
+        "using separate processes. Only useful with --recursive.",
+    )
+
     parser.add_argument(
         "-r",
         "--recursive",
@@ -78,6 +184,31 @@ def _parse_arguments(text):
         help="Enable this flag to search for all Rez packages under the given --folder.",
     )
 
+    parser.add_argument(
+        "-w",
+        "--watch",
+        action="store_true",
+        help="Keep running. Check the Rez package(s) again whenever their files change.",
+    )
+
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="With --watch, find changed files by polling, even if inotify is available.",
+    )
+
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time every context and checker plugin and print the slowest ones first.",
+    )
+
+    parser.add_argument(
+        "--profile-output",
+        default="",
+        help="With --profile, also save every plugin's times to this JSON file.",
+    )
+
     parser.add_argument(
         "-c",
         "--concise",
@@ -104,6 +235,26 @@ def _parse_arguments(text):
     return parser.parse_args(text)
 
 
+def _report_profile(profiler, arguments):
+    """Print the slowest plugins and save every plugin's times, if the user asked to.
+
+    The table is printed to stderr so that it never mixes with
+    ``--vimgrep`` results.
+
+    Args:
+        profiler (:class:`.Profiler`): The recorded plugin times.
+        arguments (:class:`argparse.Namespace`): The parsed user input.
+
+    """
+    print(
+        profiling.get_table(profiler.get_totals(), profiler.get_lint_cache()),
+        file=sys.stderr,
+    )
+
+    if arguments.profile_output:
+        profiler.write(arguments.profile_output)
+
+
 def _resolve_arguments(arguments):
     """Find the disabled user rules.
 
@@ -127,6 +278,46 @@ def _resolve_arguments(arguments):
     return folder, rules
 
 
+def _watch(folder, disable, arguments):
+    """Print every issue, again and again, whenever the Rez package(s) change.
+
+    Args:
+        folder (str): The absolute folder where to search for Rez package(s).
+        disable (set[str]): Every issue code that will be ignored.
+        arguments (:class:`argparse.Namespace`): The parsed user input.
+
+    """
+    try:
+        for descriptions in cli.watch(
+            folder,
+            disable=disable,
+            vimgrep=arguments.vimgrep,
+            recursive=arguments.recursive,
+            verbose=not arguments.concise,
+            polling=arguments.poll,
+        ):
+            if not arguments.vimgrep:
+                print(
+                    "------------- Checked at {time}".format(
+                        time=datetime.datetime.now().strftime("%H:%M:%S")
+                    )
+                )
+
+            if descriptions:
+                lines = _get_lines(descriptions, arguments)
+            elif arguments.vimgrep:
+                lines = []
+            else:
+                lines = ["No issues were found. Everything looks good!"]
+
+            for line in lines:
+                print(line)
+
+            sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     """Run the main execution of the current script."""
     arguments = _parse_arguments(sys.argv[1:])
@@ -134,60 +325,55 @@ def main():
 
     _LOGGER.setLevel(_get_log_level(arguments.verbose))
 
+    cache_directory = ""
+
+    if not arguments.no_cache:
+        cache_directory = lint_cache.get_default_directory()
+
+    if arguments.clear_cache:
+        lint_cache.clear(lint_cache.get_default_directory())
+
+    profiler = profiling.Profiler()
+
+    if arguments.watch:
+        try:
+            with profiling.activate(profiler) if arguments.profile else _nothing():
+                _watch(folder, disable, arguments)
+        except exceptions.NoPackageFound as error:
+            print(str(error), file=sys.stderr)
+
+            sys.exit(exit_code.NO_REZ_PACKAGE)
+
+        if arguments.profile:
+            _report_profile(profiler, arguments)
+
+        sys.exit(0)
+
     try:
-        descriptions = cli.lint(
-            folder,
-            disable=disable,
-            recursive=arguments.recursive,
-            verbose=not arguments.concise,
-        )
+        with profiling.activate(profiler) if arguments.profile else _nothing():
+            descriptions = cli.lint(
+                folder,
+                disable=disable,
+                recursive=arguments.recursive,
+                verbose=not arguments.concise,
+                jobs=arguments.jobs,
+                cache_directory=cache_directory,
+            )
     except exceptions.NoPackageFound as error:
         print(str(error), file=sys.stderr)
 
         sys.exit(exit_code.NO_REZ_PACKAGE)
 
+    if arguments.profile:
+        _report_profile(profiler, arguments)
+
     if not descriptions:
         if not arguments.vimgrep:
             print("No issues were found. Everything looks good!")
 
         sys.exit(0)
 
-    lines = []
-    padding_column = max(
-        description.get_padding_column()
-        for description in descriptions
-        if description.is_location_specific()
-    )
-    padding_row = max(
-        description.get_padding_row()
-        for description in descriptions
-        if description.is_location_specific()
-    )
-
-    for header, descriptions in itertools.groupby(
-        descriptions, operator.methodcaller("get_header")
-    ):
-        if not arguments.vimgrep:
-            lines.append("************* " + header)
-
-        for description in descriptions:
-            if arguments.vimgrep:
-                # Note: when vimgrep is enabled, not every item will be printed
-                if description.is_location_specific():
-                    lines.append(description.get_location_data())
-            else:
-                lines.extend(
-                    description.get_message(
-                        verbose=not arguments.concise,
-                        padding=[padding_row, padding_column],
-                    )
-                )
-
-    if arguments.vimgrep:
-        # Make sure that each file + row / column prints in ascending order
-        lines = message_description.sort_with_vimgrep(lines)
-
-    for line in lines:
+    for line in _get_lines(descriptions, arguments):
         print(line)
 
     if not arguments.vimgrep:
@@ -197,4 +383,8 @@ def main():
     sys.exit(1)
 
 
-main()
+# Worker processes (see ``--jobs``) may re-import this module so only
+# run when executed directly.
+#
+if __name__ == "__main__":
+    main()
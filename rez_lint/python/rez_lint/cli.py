@@ -3,18 +3,35 @@
 
 """The main module that prints lint messages to the user."""
 
+import collections
+import functools
 import importlib
 import itertools
 import logging
+import multiprocessing
 import operator
 import os
+import time
+from multiprocessing import pool
 
 from python_compatibility import wrapping
 from rez import exceptions as rez_exceptions
-from rez import packages_
+from rez import package_repository, packages_
+from rez.config import config
 from rez.vendor.schema import schema
-
-from .core import exceptions, message_description, registry
+from rez_utilities import finder, resolver, rez_configuration
+
+from .core import (
+    exceptions,
+    lint_cache,
+    lint_constant,
+    message_description,
+    package_parser,
+    profiling,
+    registry,
+    url_cache,
+    watcher,
+)
 from .plugins import check_context
 from .plugins.checkers import (
     base_checker,
@@ -25,7 +42,134 @@ from .plugins.checkers import (
 )
 from .plugins.contexts import base_context, packaging, parsing
 
+_IGNORED_FOLDERS = frozenset((".git", ".hg", ".svn", "__pycache__", "node_modules"))
 _LOGGER = logging.getLogger(__name__)
+_WORKER_PROCESSED_PACKAGES = []
+
+
+class _WatchedPackage(object):
+    """The contexts and issues of one Rez package, kept in memory by :func:`watch`."""
+
+    def __init__(self, directory, disable=frozenset(), vimgrep=False, verbose=False):
+        """Keep track of the user's settings. Call :meth:`lint` to check the package.
+
+        Args:
+            directory (str): The absolute folder on-disk of a Rez package.
+            disable (set[str], optional): The issue codes to skip.
+            vimgrep (bool, optional): If True, the user wants row / column data.
+            verbose (bool, optional): If True, the user wants every issue detail.
+
+        """
+        super(_WatchedPackage, self).__init__()
+
+        self._directory = directory
+        self._disable = disable
+        self._vimgrep = vimgrep
+        self._verbose = verbose
+
+        self._package = None
+        self._invalid = False
+        self._context = None
+        self._results = dict()  # checker -> set[:class:`.Description`]
+
+    def _run_checkers(self, checkers):
+        """Run some checkers again and replace their previous issues."""
+        for checker in checkers:
+            if checker.get_long_code() in self._disable:
+                continue
+
+            with profiling.measure(checker, "checker", self._package):
+                results = checker.run(self._package, self._context)
+
+            self._results[checker] = set(results)
+
+    def get_descriptions(self):
+        """set[:class:`.Description`]: Every issue which was found, so far."""
+        if self._invalid:
+            return {_get_invalid_description(self._directory)}
+
+        return set(itertools.chain.from_iterable(self._results.values()))
+
+    def get_directory(self):
+        """str: The absolute folder on-disk of the Rez package."""
+        return self._directory
+
+    def lint(self):
+        """Load the Rez package again and run every context and checker on it."""
+        if self._package:
+            package_parser.clear_source(self._package.filepath)
+
+        self._package, self._invalid = _load_package_folder(self._directory)
+        self._context = None
+        self._results = dict()
+
+        if not self._package:
+            return
+
+        contexts, checkers = _get_plugins()
+
+        for checker in checkers:
+            if checker.get_long_code() not in self._disable and hasattr(
+                checker, "prepare"
+            ):
+                with profiling.measure(checker, "prepare"):
+                    checker.prepare([self._package])
+
+        self._context = check_context.Context(
+            self._package, vimgrep=self._vimgrep, verbose=self._verbose
+        )
+        self._context["processed_checker"] = []
+        self._context["processed_contexts"] = []
+
+        _add_contexts(
+            contexts,
+            self._package,
+            self._context,
+            _get_needed_keys(checkers, self._disable),
+        )
+        self._run_checkers(checkers)
+
+    def update(self, changes):
+        """Run only the contexts and checkers which some file changes affect.
+
+        Args:
+            changes (set[str]):
+                The kinds of file changes that happened in the Rez
+                package. e.g. :attr:`.lint_constant.PYTHON_CHANGE`.
+
+        """
+        if lint_constant.DEFINITION_CHANGE in changes:
+            # The requirements may have changed, so earlier resolves can't be trusted
+            resolver.clear_cache()
+            package_repository.package_repository_manager.clear_caches()
+
+        if not self._package or lint_constant.DEFINITION_CHANGE in changes:
+            self.lint()
+
+            return
+
+        contexts, checkers = _get_plugins()
+        contexts = [manager for manager in contexts if _is_affected(manager, changes)]
+        keys = set(
+            itertools.chain.from_iterable(
+                _get_produced_keys(manager) for manager in contexts
+            )
+        )
+        self._context.discard_keys(keys)
+
+        _add_contexts(
+            contexts,
+            self._package,
+            self._context,
+            _get_needed_keys(checkers, self._disable),
+        )
+        self._run_checkers(
+            [
+                checker
+                for checker in checkers
+                if _is_affected(checker, changes) or _reads_any_key(checker, keys)
+            ]
+        )
 
 
 def _search_current_folder(directory):
@@ -62,7 +206,61 @@ def _search_current_folder(directory):
     )
 
 
-def _find_rez_packages(directory, recursive=False):
+def _iter_package_folders(directory):
+    """Find every folder on-or-below `directory` which has a Rez package file.
+
+    The folders are found with a single walk. Version control folders,
+    cache folders, and the build folder of every found Rez package are
+    never searched. Symlinked folders aren't followed, so nothing
+    outside of `directory` is searched.
+
+    Args:
+        directory (str): The absolute path to the folder to search within.
+
+    Yields:
+        str: Each folder which has a package.py / package.yaml / package.txt.
+
+    """
+    build_directory = config.build_directory  # pylint: disable=no-member
+
+    for root, folders, files in os.walk(directory):
+        folders[:] = [name for name in folders if name not in _IGNORED_FOLDERS]
+
+        if not any(name in rez_configuration.REZ_PACKAGE_NAMES for name in files):
+            continue
+
+        if build_directory in folders:
+            # The build folder belongs to this Rez package so it can't
+            # contain any other Rez package that should be checked.
+            #
+            folders.remove(build_directory)
+
+        yield root
+
+
+def _load_package_folder(directory):
+    """Load the Rez package of a folder which has a Rez package file.
+
+    Args:
+        directory (str):
+            The absolute path to a folder which has a package.py /
+            package.yaml / package.txt.
+
+    Returns:
+        tuple[:class:`rez.packages_.DeveloperPackage` or NoneType, bool]:
+            The loaded Rez package, if any, and if `directory`
+            contains a Rez package with an invalid schema.
+
+    """
+    try:
+        return packages_.get_developer_package(directory), False
+    except rez_exceptions.PackageMetadataError:
+        return None, False
+    except schema.SchemaError:
+        return None, True
+
+
+def _find_rez_packages(directory, recursive=False, jobs=1):
     """Get every Rez package starting from the current directory.
 
     Args:
@@ -73,6 +271,10 @@ def _find_rez_packages(directory, recursive=False):
             If False, only get the Rez package in the current folder. If
             True, get all Rez packages found on-or-below `directory`.
             Default is False.
+        jobs (int, optional):
+            The number of Rez packages to load at once, if `recursive`
+            is True. Loading is mostly reading files so this helps most
+            on slow, networked file systems. Default is 1.
 
     Raises:
         :class:`.NoPackageFound`: If No Rez package could be found.
@@ -83,15 +285,6 @@ def _find_rez_packages(directory, recursive=False):
             invalid Rez package, those are returned, too.
 
     """
-
-    def _get_safe_package(path):
-        try:
-            return {packages_.get_developer_package(path)}, set()
-        except rez_exceptions.PackageMetadataError:
-            return set(), set()
-        except schema.SchemaError:
-            return set(), {path}
-
     if not recursive:
         try:
             package = _search_current_folder(directory)
@@ -100,14 +293,27 @@ def _find_rez_packages(directory, recursive=False):
 
         return {package}, set()
 
-    packages, invalids = _get_safe_package(directory)
+    folders = list(_iter_package_folders(directory))
 
-    for root, folders, _ in os.walk(directory):
-        for folder in folders:
-            path = os.path.join(root, folder)
-            inner_packages, invalids_ = _get_safe_package(path)
-            packages.update(inner_packages)
-            invalids.update(invalids_)
+    if jobs > 1 and len(folders) > 1:
+        workers = pool.ThreadPool(min(jobs, len(folders)))
+
+        try:
+            results = workers.map(_load_package_folder, folders)
+        finally:
+            workers.close()
+            workers.join()
+    else:
+        results = [_load_package_folder(folder) for folder in folders]
+
+    packages = set()
+    invalids = set()
+
+    for folder, (package, invalid) in zip(folders, results):
+        if package:
+            packages.add(package)
+        elif invalid:
+            invalids.add(folder)
 
     if not packages and not invalids:
         raise exceptions.NoPackageFound(
@@ -185,8 +391,428 @@ def _register_internal_plugins():
     registry.register_context(parsing.ParsePackageDefinition)
 
 
-def lint(
-    directory, disable=frozenset(), vimgrep=False, recursive=False, verbose=False,
+def _add_contexts(managers, package, context, needed):
+    """Run or schedule context plugins, so that checkers can read their data.
+
+    Args:
+        managers (iter[:class:`.BaseContext`]): The context plugins to add.
+        package (:class:`rez.packages_.DeveloperPackage`): The Rez package to check.
+        context (:class:`.Context`): The object which stores the plugins' data.
+        needed (set[str] or NoneType):
+            The :class:`.Context` keys which some checker will read. If
+            None, any key could be read. Plugins which add keys run
+            only once one of their keys is read. Plugins which add no
+            keys run immediately.
+
+    """
+    for manager in managers:
+        keys = _get_produced_keys(manager)
+
+        if not keys:
+            _run_context(manager, package, context)
+        elif needed is None or needed.intersection(keys):
+            context.add_lazy_keys(
+                keys, functools.partial(_run_context, manager, package, context)
+            )
+        else:
+            _LOGGER.debug('Context "%s" is not needed by any checker.', manager)
+
+
+def _get_changes(path, directory):
+    """Find out what kind of change a changed path is, for some Rez package.
+
+    Args:
+        path (str): The absolute path to a created, modified, or deleted file / folder.
+        directory (str): The absolute folder on-disk of the Rez package of `path`.
+
+    Returns:
+        set[str]: The kinds of changes. e.g. {:attr:`.lint_constant.PYTHON_CHANGE`}.
+
+    """
+    if path == directory:
+        return {lint_constant.DEFINITION_CHANGE}
+
+    if (
+        os.path.dirname(path) == directory
+        and os.path.basename(path) in rez_configuration.REZ_PACKAGE_NAMES
+    ):
+        return {lint_constant.DEFINITION_CHANGE}
+
+    if path.endswith(".py"):
+        return {lint_constant.PYTHON_CHANGE}
+
+    if os.path.isdir(path) or (
+        not os.path.exists(path) and not os.path.splitext(path)[1]
+    ):
+        # A folder was added or removed so it could have contained Python files
+        return {lint_constant.FILE_CHANGE, lint_constant.PYTHON_CHANGE}
+
+    return {lint_constant.FILE_CHANGE}
+
+
+def _get_watched_package(path, packages):
+    """Find the Rez package which contains some path.
+
+    Args:
+        path (str): The absolute path to a file / folder.
+        packages (iter[:class:`_WatchedPackage`]): Every Rez package to search.
+
+    Returns:
+        :class:`_WatchedPackage` or NoneType: The innermost Rez package of `path`, if any.
+
+    """
+    for package in sorted(
+        packages, key=lambda package: len(package.get_directory()), reverse=True
+    ):
+        directory = package.get_directory()
+
+        if path == directory or path.startswith(directory + os.sep):
+            return package
+
+    return None
+
+
+def _get_invalid_description(directory):
+    """:class:`.Description`: Describe a Rez package whose definition is invalid."""
+    location = message_description.Location(
+        path=directory, row=-1, column=-1, text="",
+    )
+    code = base_checker.Code(short_name="D", long_name="invalid-schema")
+
+    return message_description.Description(
+        ["Package has invalid attributes."],
+        location,
+        code=code,
+        full="Try running `rez-build` and Rez will report the exact error.",
+    )
+
+
+def _get_needed_keys(checkers, disable):
+    """Find every :class:`.Context` key that some checkers will read.
+
+    Args:
+        checkers (iter[:class:`.BaseChecker`]): The checker plugins to check.
+        disable (set[str]): The issue codes of checkers which won't run.
+
+    Returns:
+        set[str] or NoneType:
+            The found keys. If any checker doesn't declare its keys,
+            return None because that checker could read any key.
+
+    """
+    keys = set()
+
+    for checker in checkers:
+        if checker.get_long_code() in disable:
+            continue
+
+        if not hasattr(checker, "get_context_keys"):
+            return None
+
+        needed = checker.get_context_keys()
+
+        if needed is None:
+            return None
+
+        keys.update(needed)
+
+    return keys
+
+
+def _get_plugins():
+    """Get every registered plugin, from the first to the last to run.
+
+    Returns:
+        tuple[list[:class:`.BaseContext`], list[:class:`.BaseChecker`]]:
+            The context plugins and checker plugins.
+
+    """
+    contexts = sorted(
+        registry.get_contexts(),
+        key=operator.methodcaller("get_order"),
+        reverse=True,
+    )
+    checkers = sorted(
+        registry.get_checkers(),
+        key=operator.methodcaller("get_order"),
+        reverse=True,
+    )
+
+    return contexts, checkers
+
+
+def _get_produced_keys(manager):
+    """tuple[str]: Find the :class:`.Context` keys that a context plugin adds."""
+    if not hasattr(manager, "get_keys"):
+        return tuple()
+
+    return tuple(manager.get_keys())
+
+
+def _initialize_worker(checkers, contexts):
+    """Give a new worker process the same plugins as the main process.
+
+    Args:
+        checkers (list[:class:`.BaseChecker`]): The checker plugins to register.
+        contexts (list[:class:`.BaseContext`]): The context plugins to register.
+
+    """
+    registry.clear_checkers()
+    registry.clear_contexts()
+
+    for checker in checkers:
+        registry.register_checker(checker)
+
+    for context in contexts:
+        registry.register_context(context)
+
+
+def _lint_directory(  # pylint: disable=too-many-arguments
+    directory,
+    disable=frozenset(),
+    vimgrep=False,
+    verbose=False,
+    cache_directory="",
+    profile=False,
+):
+    """Find issues for the Rez package in some folder, from a worker process.
+
+    Rez packages can't be sent between processes so each worker process
+    loads the Rez package again, from `directory`.
+
+    Args:
+        directory (str): The absolute folder on-disk of a Rez package.
+        disable (set[str], optional): The issue codes to skip.
+        vimgrep (bool, optional): If True, the user wants row / column data.
+        verbose (bool, optional): If True, the user wants every issue detail.
+        cache_directory (str, optional): The folder to re-use / save results.
+        profile (bool, optional): If True, time every plugin which runs.
+
+    Returns:
+        tuple[set[:class:`.Description`], dict or NoneType]:
+            The found issues and, if `profile` is True, the recorded
+            plugin times. See :meth:`.Profiler.to_dict`.
+
+    """
+    package = packages_.get_developer_package(directory)
+    run = functools.partial(
+        _lint_package,
+        package,
+        _WORKER_PROCESSED_PACKAGES,
+        disable=disable,
+        vimgrep=vimgrep,
+        verbose=verbose,
+        cache_directory=cache_directory,
+    )
+    records = None
+
+    if profile:
+        # Each process records its own plugin times and sends them back
+        with profiling.activate(profiling.Profiler()) as profiler:
+            output = run()
+
+        records = profiler.to_dict()
+    else:
+        output = run()
+
+    _WORKER_PROCESSED_PACKAGES.append(package)
+
+    return output, records
+
+
+def _lint_in_parallel(  # pylint: disable=too-many-arguments
+    packages, disable, vimgrep, verbose, jobs, cache_directory
+):
+    """Find issues for many Rez packages, using several processes.
+
+    Args:
+        packages (iter[:class:`rez.packages_.DeveloperPackage`]):
+            The Rez packages to check.
+        disable (set[str]): The issue codes to skip.
+        vimgrep (bool): If True, the user wants row / column data.
+        verbose (bool): If True, the user wants every issue detail.
+        jobs (int): The number of Rez packages to check at once.
+        cache_directory (str): The folder to re-use / save results, if any.
+
+    Returns:
+        set[:class:`.Description`]: The found issues, for every Rez package.
+
+    """
+    directories = sorted(finder.get_package_root(package) for package in packages)
+    workers = multiprocessing.Pool(
+        processes=min(jobs, len(directories)),
+        initializer=_initialize_worker,
+        initargs=(registry.get_checkers(), registry.get_contexts()),
+    )
+    output = set()
+    profiler = profiling.get_active()
+
+    try:
+        for results, records in workers.imap_unordered(
+            functools.partial(
+                _lint_directory,
+                disable=disable,
+                vimgrep=vimgrep,
+                verbose=verbose,
+                cache_directory=cache_directory,
+                profile=profiler is not None,
+            ),
+            directories,
+        ):
+            output.update(results)
+
+            if records:
+                profiler.merge(records)
+    finally:
+        workers.close()
+        workers.join()
+
+    return output
+
+
+def _is_affected(plugin, changes):
+    """Check if a plugin must run again, after some kinds of file changes.
+
+    Args:
+        plugin (:class:`.BaseChecker` or :class:`.BaseContext`): The plugin to check.
+        changes (set[str]): The kinds of file changes. e.g. {"python"}.
+
+    Returns:
+        bool: If the data or results of `plugin` could be out of date.
+
+    """
+    if not hasattr(plugin, "get_watched_changes"):
+        return True
+
+    watched = plugin.get_watched_changes()
+
+    if watched is None:
+        return True
+
+    return bool(watched.intersection(changes))
+
+
+def _is_cacheable(checker):
+    """bool: Check if the results of `checker` can be saved by :mod:`.lint_cache`."""
+    if not hasattr(checker, "is_cacheable"):
+        return True
+
+    return checker.is_cacheable()
+
+
+def _reads_any_key(checker, keys):
+    """bool: Check if `checker` could read any of the :class:`.Context` `keys`."""
+    needed = _get_needed_keys([checker], set())
+
+    return needed is None or bool(needed.intersection(keys))
+
+
+def _run_context(manager, package, context):
+    """Add data to `context` using a context plugin and mark the plugin as done."""
+    with profiling.measure(manager, "context", package):
+        manager.run(package, context)
+
+    context["processed_contexts"].append(manager)
+
+
+def _lint_package(  # pylint: disable=too-many-arguments,too-many-locals
+    package,
+    processed_packages,
+    disable=frozenset(),
+    vimgrep=False,
+    verbose=False,
+    cache_directory="",
+):
+    """Run every context and checker plugin on a Rez package.
+
+    Args:
+        package (:class:`rez.packages_.DeveloperPackage`): The Rez package to check.
+        processed_packages (list[:class:`rez.packages_.DeveloperPackage`]):
+            Other packages that have already been processed.
+        disable (set[str], optional): The issue codes to skip.
+        vimgrep (bool, optional): If True, the user wants row / column data.
+        verbose (bool, optional): If True, the user wants every issue detail.
+        cache_directory (str, optional):
+            If provided, re-use the results of an earlier run from this
+            folder if `package` hasn't changed since then. Otherwise,
+            save this run's results here. Default: "".
+
+    Returns:
+        set[:class:`.Description`]: The found issues.
+
+    """
+    contexts, checkers = _get_plugins()
+    key = ""
+    saved = None
+
+    if cache_directory:
+        settings = sorted(disable) + [
+            "vimgrep={vimgrep}".format(vimgrep=vimgrep),
+            "verbose={verbose}".format(verbose=verbose),
+        ]
+        key = lint_cache.get_key(package, contexts + checkers, settings)
+        saved = lint_cache.load(cache_directory, key)
+
+    profiler = profiling.get_active()
+
+    if profiler and cache_directory:
+        profiler.add_lint_cache(saved is not None)
+
+    if saved is not None:
+        _LOGGER.debug(
+            'Package "%s" is unchanged. Re-using its results.', package.filepath
+        )
+        contexts = []
+        checkers = [checker for checker in checkers if not _is_cacheable(checker)]
+
+    output = set()
+    cacheable = set()
+    context = check_context.Context(
+        package, list(processed_packages), vimgrep=vimgrep, verbose=verbose,
+    )
+    context["processed_checker"] = []
+    context["processed_contexts"] = []
+
+    _add_contexts(contexts, package, context, _get_needed_keys(checkers, disable))
+
+    for checker in checkers:
+        if checker.get_long_code() in disable:
+            context["processed_contexts"].append(
+                {"checker": checker, "status": "skipped"}
+            )
+
+            continue
+
+        with profiling.measure(checker, "checker", package):
+            results = checker.run(package, context)
+
+        context["processed_contexts"].append(
+            {"checker": checker, "status": "ran", "results": results}
+        )
+        output.update(results)
+
+        if _is_cacheable(checker):
+            cacheable.update(results)
+
+    if saved is not None:
+        output.update(saved)
+    elif key:
+        lint_cache.save(cache_directory, key, cacheable)
+
+    # Every checker is done with the package's source, so free its memory
+    package_parser.clear_source(package.filepath)
+
+    return output
+
+
+def lint(  # pylint: disable=too-many-arguments
+    directory,
+    disable=frozenset(),
+    vimgrep=False,
+    recursive=False,
+    verbose=False,
+    jobs=1,
+    cache_directory="",
 ):
     """Print out issues with the Rez package(s) starting at a directory on-disk.
 
@@ -209,67 +835,176 @@ def lint(
             If True, print the lint messages without summarizing any of its data.
             If False, only print 1-to-2 line summaries of each found issue.
             Default is False.
+        jobs (int, optional):
+            The number of Rez packages to check at once, using separate
+            processes. Default is 1.
+        cache_directory (str, optional):
+            A folder on-disk where the issues of each Rez package are
+            saved. If a Rez package hasn't changed since the last run,
+            its saved issues are re-used. If no folder is given, nothing
+            is saved or re-used. Default is "".
+
+    Raises:
+        ValueError: If `jobs` is less than 1.
 
     Returns:
         list[:class:`.Description`]: Get the found issues.
 
     """
+    if jobs < 1:
+        raise ValueError('Jobs "{jobs}" cannot be less than 1.'.format(jobs=jobs))
+
     _register_internal_plugins()
     _register_external_plugins()
+    # Check each URL once per run. But a website may have changed since the last run
+    url_cache.clear_cache()
 
-    packages, invalids = _find_rez_packages(directory, recursive=recursive)
+    packages, invalids = _find_rez_packages(directory, recursive=recursive, jobs=jobs)
 
-    output = set()
-    processed_packages = []
+    for checker in registry.get_checkers():
+        if checker.get_long_code() not in disable and hasattr(checker, "prepare"):
+            with profiling.measure(checker, "prepare"):
+                checker.prepare(packages)
 
-    for package in packages:
-        context = check_context.Context(
-            package, list(processed_packages), vimgrep=vimgrep, verbose=verbose,
+    if jobs > 1 and len(packages) > 1:
+        output = _lint_in_parallel(
+            packages, disable, vimgrep, verbose, jobs, cache_directory
         )
-        context["processed_checker"] = []
-        context["processed_contexts"] = []
+    else:
+        output = set()
+        processed_packages = []
+
+        for package in packages:
+            output.update(
+                _lint_package(
+                    package,
+                    processed_packages,
+                    disable=disable,
+                    vimgrep=vimgrep,
+                    verbose=verbose,
+                    cache_directory=cache_directory,
+                )
+            )
+            processed_packages.append(package)
 
-        for manager in sorted(
-            registry.get_contexts(),
-            key=operator.methodcaller("get_order"),
-            reverse=True,
-        ):
-            manager.run(package, context)
-            context["processed_contexts"].append(manager)
+    for directory_ in invalids:
+        output.add(_get_invalid_description(directory_))
 
-        for checker in sorted(
-            registry.get_checkers(),
-            key=operator.methodcaller("get_order"),
-            reverse=True,
-        ):
-            if checker.get_long_code() in disable:
-                context["processed_contexts"].append(
-                    {"checker": checker, "status": "skipped"}
-                )
+    return sorted(output)
 
-                continue
 
-            results = checker.run(package, context)
-            context["processed_contexts"].append(
-                {"checker": checker, "status": "ran", "results": results}
-            )
-            output.update(results)
+def watch(  # pylint: disable=too-many-arguments,too-many-locals
+    directory,
+    disable=frozenset(),
+    vimgrep=False,
+    recursive=False,
+    verbose=False,
+    polling=False,
+):
+    """Check Rez package(s) and check them again whenever their files change.
 
-        processed_packages.append(package)
+    Unlike :func:`lint`, the contexts of every Rez package are kept in
+    memory. After a change, only the contexts and checkers which the
+    changed files affect are run again. See the ``get_watched_changes``
+    methods of :class:`.BaseChecker` and :class:`.BaseContext`.
 
-    for directory_ in invalids:
-        location = message_description.Location(
-            path=directory_, row=-1, column=-1, text="",
+    Rez packages which are added after this function starts aren't checked.
+
+    Args:
+        directory (str):
+            The absolute path to a folder on-disk where at least one Rez
+            package can be found.
+        disable (set[str], optional):
+            The issue codes that should be skipped by during this run.
+            The default behavior skips nothing.
+        vimgrep (bool, optional):
+            If True, the user wants row / column data. Default is False.
+        recursive (bool, optional):
+            If True, find every Rez package starting from `directory`.
+            If False, only get the Rez package in the current directory.
+            Default is False.
+        verbose (bool, optional):
+            If True, the user wants every issue detail. Default is False.
+        polling (bool, optional):
+            If True, find changed files by polling, even if the
+            operating system can report them. Default is False.
+
+    Raises:
+        :class:`.NoPackageFound`: If No Rez package could be found.
+
+    Yields:
+        list[:class:`.Description`]:
+            The found issues, once after every Rez package is checked
+            and again after each change.
+
+    """
+    _register_internal_plugins()
+    _register_external_plugins()
+    # Each URL is checked once, not again after every saved file
+    url_cache.clear_cache()
+
+    packages, invalids = _find_rez_packages(directory, recursive=recursive)
+    directories = sorted(
+        set(finder.get_package_root(package) for package in packages) | invalids
+    )
+    watched = [
+        _WatchedPackage(directory_, disable=disable, vimgrep=vimgrep, verbose=verbose)
+        for directory_ in directories
+    ]
+
+    for package in watched:
+        package.lint()
+
+    roots = [
+        directory_
+        for directory_ in directories
+        if not any(
+            directory_.startswith(other + os.sep)
+            for other in directories
+            if other != directory_
         )
-        code = base_checker.Code(short_name="D", long_name="invalid-schema")
-
-        output.add(
-            message_description.Description(
-                ["Package has invalid attributes."],
-                location,
-                code=code,
-                full="Try running `rez-build` and Rez will report the exact error.",
+    ]
+    watcher_ = watcher.make_watcher(roots, polling=polling)
+
+    try:
+        yield sorted(
+            itertools.chain.from_iterable(
+                package.get_descriptions() for package in watched
             )
         )
 
-    return sorted(output)
+        while True:
+            changes = collections.defaultdict(set)
+
+            for path in watcher_.wait():
+                package = _get_watched_package(path, watched)
+
+                if package:
+                    changes[package].update(_get_changes(path, package.get_directory()))
+
+            if not changes:
+                continue
+
+            start = time.time()
+
+            for package, kinds in changes.items():
+                _LOGGER.debug(
+                    'Checking "%s" again, for "%s" changes.',
+                    package.get_directory(),
+                    sorted(kinds),
+                )
+                package.update(kinds)
+
+            _LOGGER.info(
+                "Checked %s Rez package(s) in %.1f ms.",
+                len(changes),
+                (time.time() - start) * 1000.0,
+            )
+
+            yield sorted(
+                itertools.chain.from_iterable(
+                    package.get_descriptions() for package in watched
+                )
+            )
+    finally:
+        watcher_.close()
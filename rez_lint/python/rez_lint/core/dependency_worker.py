@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find Python dependencies with long-running :mod:`python_compatibility.dependency_analyzer` processes.
+
+Starting a Python interpreter and importing every dependency again
+dominates the time it takes to find a Rez package's dependencies. So
+instead of running the analyzer once per Rez package, one
+:class:`Worker` is started per resolved environment and is re-used by
+every Rez package whose resolve is the same, not counting the Rez
+package itself. Each request adds the Rez package's own Python folders
+to the worker's import path. Each worker keeps every module that it
+imported, except for the Rez package's own modules, so later requests
+are faster.
+
+A few workers are kept at once. The least recently used worker is
+stopped once there are too many and every worker is stopped when the
+process exits.
+
+"""
+
+import atexit
+import collections
+import json
+import logging
+import os
+import subprocess
+import threading
+
+from python_compatibility import dependency_analyzer
+
+_COMMAND = "python -m python_compatibility.dependency_analyzer --serve"
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+_MAXIMUM_WORKERS = 4
+_WORKERS = collections.OrderedDict()  # environment key -> :class:`Worker`
+
+
+class WorkerError(RuntimeError):
+    """If a :class:`Worker` stopped or couldn't answer a request."""
+
+
+class Worker(object):
+    """A :mod:`python_compatibility.dependency_analyzer` process which answers many requests."""
+
+    def __init__(self, caller):
+        """Start the process.
+
+        Args:
+            caller (callable[str, **kwargs] -> :class:`subprocess.Popen`):
+                The function which starts the process in the right
+                environment. e.g. :meth:`rez.resolved_context.ResolvedContext.execute_command`.
+
+        """
+        super(Worker, self).__init__()
+
+        self._lock = threading.Lock()
+        self._null = open(os.devnull, "w")
+        self._process = caller(
+            _COMMAND,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=self._null,
+        )
+
+    def close(self):
+        """Stop the process."""
+        with self._lock:
+            if self._process.poll() is None:
+                try:
+                    self._process.stdin.close()
+                    self._process.wait()
+                except (IOError, OSError):
+                    self._process.kill()
+
+            self._null.close()
+
+    def get_dependency_paths(self, directories, python_paths=tuple()):
+        """Find every Python file which the Python files in `directories` import.
+
+        Args:
+            directories (iter[str]):
+                The absolute paths to folders with Python files.
+            python_paths (iter[str], optional):
+                The absolute folders to import from first, for only this request.
+
+        Raises:
+            :class:`WorkerError`: If the process stopped or the request failed.
+
+        Returns:
+            set[str]: The found Python file dependencies.
+
+        """
+        request = {
+            "directories": sorted(directories),
+            "python_paths": list(python_paths),
+        }
+        request = json.dumps(request) + "\n"
+
+        with self._lock:
+            try:
+                self._process.stdin.write(request.encode("utf-8"))
+                self._process.stdin.flush()
+            except (IOError, OSError) as error:
+                raise WorkerError(str(error))
+
+            for line in iter(self._process.stdout.readline, b""):
+                line = line.decode("utf-8").strip()
+
+                # Anything else was printed by some imported module
+                if line.startswith(dependency_analyzer.RESPONSE_PREFIX):
+                    break
+            else:
+                raise WorkerError("The dependency analyzer stopped.")
+
+        response = json.loads(line[len(dependency_analyzer.RESPONSE_PREFIX) :])
+
+        if "error" in response:
+            raise WorkerError(response["error"])
+
+        return set(path for path in response["paths"] if os.path.isfile(path))
+
+    def is_running(self):
+        """bool: Check if the process can still answer requests."""
+        return self._process.poll() is None
+
+
+def _get_worker(key, caller):
+    """Get the worker of some environment, starting it if needed.
+
+    Args:
+        key (hashable): A description of the environment. e.g. its resolved packages.
+        caller (callable[str, **kwargs] -> :class:`subprocess.Popen`):
+            The function which starts a process in the environment.
+
+    Returns:
+        :class:`Worker`: The found or started worker.
+
+    """
+    stopped = []
+
+    with _LOCK:
+        worker = _WORKERS.pop(key, None)
+
+        if worker and not worker.is_running():
+            stopped.append(worker)
+            worker = None
+
+        if not worker:
+            _LOGGER.debug('Starting a dependency analyzer for "%s".', key)
+            worker = Worker(caller)
+
+        _WORKERS[key] = worker  # Mark `worker` as the most recently used
+
+        while len(_WORKERS) > _MAXIMUM_WORKERS:
+            _, oldest = _WORKERS.popitem(last=False)
+            stopped.append(oldest)
+
+    for worker_ in stopped:
+        worker_.close()
+
+    return worker
+
+
+@atexit.register
+def close_all():
+    """Stop every worker."""
+    with _LOCK:
+        workers = list(_WORKERS.values())
+        _WORKERS.clear()
+
+    for worker in workers:
+        worker.close()
+
+
+def get_dependency_paths(directories, caller, key, python_paths=tuple()):
+    """Find every Python file which the Python files in `directories` import.
+
+    Args:
+        directories (iter[str]): The absolute paths to folders with Python files.
+        caller (callable[str, **kwargs] -> :class:`subprocess.Popen`):
+            The function which starts a process in the right environment.
+            e.g. :meth:`rez.resolved_context.ResolvedContext.execute_command`.
+        key (hashable):
+            A description of the environment that `caller` uses. Every
+            call with the same key shares the same :class:`Worker`.
+        python_paths (iter[str], optional):
+            The absolute folders to import from first, for only this
+            call. Usually, the Python folders of the Rez package which
+            `directories` come from, since it isn't part of `key`.
+
+    Raises:
+        :class:`WorkerError`:
+            If the worker couldn't answer. e.g. because the environment
+            has an older :mod:`python_compatibility` without ``--serve``.
+
+    Returns:
+        set[str]: The found Python file dependencies.
+
+    """
+    if not directories:
+        return set()
+
+    return _get_worker(key, caller).get_dependency_paths(
+        directories, python_paths=python_paths
+    )
+
+
+def get_environment_key(context, ignore=tuple()):
+    """Describe a resolved Rez environment so that identical resolves share a worker.
+
+    Args:
+        context (:class:`rez.resolved_context.ResolvedContext` or NoneType):
+            A resolved environment. If None, the current environment is used.
+        ignore (iter[str], optional):
+            The names of Rez packages to leave out of the key. Usually,
+            the Rez package which is being linted. Its Python folders
+            are given per-request, instead. See :func:`get_dependency_paths`.
+
+    Returns:
+        tuple[str]: The URI of every resolved Rez package, except for `ignore`.
+
+    """
+    if not context:
+        return tuple()
+
+    ignore = set(ignore)
+
+    return tuple(
+        sorted(
+            variant.uri
+            for variant in context.resolved_packages
+            if variant.name not in ignore
+        )
+    )
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Save the issues of each Rez package to disk, so unchanged packages aren't re-checked.
+
+Each Rez package is stored under a key which is made from everything
+that could change its issues:
+
+- The package definition's contents.
+- The name of every file in the package and the contents of its Python files.
+- The latest version of every requirement that the package could resolve to.
+- The ``rez_lint`` version, the registered plugins and their source
+  files, and user settings.
+
+If none of those change, the saved issues are returned instead of
+running any context or checker plugin again.
+
+Attributes:
+    CACHE_DIRECTORY_VARIABLE (str):
+        The environment variable which, if defined, overrides the
+        default cache folder.
+
+"""
+
+import hashlib
+import inspect
+import logging
+import os
+import shutil
+import tempfile
+
+import six
+from rez import exceptions as rez_exceptions
+from rez import packages_
+from rez.config import config
+from rez_utilities import finder
+from six.moves import cPickle as pickle
+
+from . import registry
+
+CACHE_DIRECTORY_VARIABLE = "REZ_LINT_CACHE_DIRECTORY"
+
+_FORMAT_VERSION = "1"  # Increase this value whenever cached data is no longer valid
+_IGNORED_FOLDERS = frozenset((".git",))
+_LOGGER = logging.getLogger(__name__)
+_PICKLE_PROTOCOL = 2  # The newest protocol which both Python 2 and 3 can read
+
+
+def _get_ignored_folders():
+    """set[str]: The names of folders whose files never change a Rez package's issues."""
+    return _IGNORED_FOLDERS | {config.build_directory}  # pylint: disable=no-member
+
+
+def _get_plugin_source(plugin):
+    """Describe the file which defines some plugin, so that edits to it are noticed.
+
+    Args:
+        plugin (:class:`.BaseChecker` or :class:`.BaseContext`): The plugin to describe.
+
+    Returns:
+        str: The plugin's file path, modification time, and size.
+
+    """
+    if not isinstance(plugin, type):
+        plugin = plugin.__class__
+
+    try:
+        path = inspect.getfile(plugin)
+        status = os.stat(path)
+    except (TypeError, OSError):
+        # e.g. The plugin was defined dynamically or its file was deleted
+        return "<unknown>"
+
+    return "{path}:{status.st_mtime}:{status.st_size}".format(path=path, status=status)
+
+
+def _get_requirement_versions(package):
+    """Find the latest version of each Rez package which `package` could resolve to.
+
+    This doesn't resolve `package` (which is very slow) but it still
+    detects when a new, compatible version of a requirement is released.
+
+    Args:
+        package (:class:`rez.packages_.DeveloperPackage`): The Rez package to check.
+
+    Returns:
+        list[str]: Every requirement and its latest, found version.
+
+    """
+    output = []
+    paths = config.packages_path  # pylint: disable=no-member
+    requirements = (
+        list(package.requires or [])
+        + list(package.build_requires or [])
+        + list(package.private_build_requires or [])
+    )
+
+    for variant in package.variants or []:
+        requirements.extend(variant)
+
+    for requirement in sorted(requirements, key=str):
+        if requirement.conflict:
+            output.append(str(requirement))
+
+            continue
+
+        try:
+            latest = packages_.get_latest_package(
+                requirement.name, range_=requirement.range, paths=paths
+            )
+        except rez_exceptions.RezError:
+            latest = None
+
+        output.append(
+            "{requirement}={version}".format(
+                requirement=requirement,
+                version=latest.version if latest else "<missing>",
+            )
+        )
+
+    return output
+
+
+def _iter_source_lines(root):
+    """Describe every file in a Rez package, using its path and, for Python files, contents.
+
+    Args:
+        root (str): The absolute folder on-disk of some Rez package.
+
+    Yields:
+        str: A relative file path or the hash of a Python file's contents.
+
+    """
+    ignored = _get_ignored_folders()
+
+    for directory, folders, files in os.walk(root):
+        folders[:] = sorted(name for name in folders if name not in ignored)
+
+        for name in sorted(files):
+            path = os.path.join(directory, name)
+            yield os.path.relpath(path, root)
+
+            if not name.endswith(".py"):
+                continue
+
+            try:
+                with open(path, "rb") as handler:
+                    yield hashlib.sha1(handler.read()).hexdigest()
+            except (IOError, OSError):
+                yield "<unreadable>"
+
+
+def clear(directory):
+    """Delete every saved result.
+
+    Args:
+        directory (str): The absolute folder on-disk where results are saved.
+
+    """
+    if os.path.isdir(directory):
+        shutil.rmtree(directory)
+
+
+def get_default_directory():
+    """str: The folder where results are saved, if the user doesn't choose one."""
+    directory = os.getenv(CACHE_DIRECTORY_VARIABLE, "")
+
+    if directory:
+        return directory
+
+    root = os.getenv("XDG_CACHE_HOME", "") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+
+    return os.path.join(root, "rez_lint")
+
+
+def get_key(package, plugins, settings):
+    """Get a key which changes whenever the issues of `package` could change.
+
+    Args:
+        package (:class:`rez.packages_.DeveloperPackage`):
+            The Rez package to make a key for.
+        plugins (iter[:class:`.BaseChecker` or :class:`.BaseContext`]):
+            Every plugin which will check `package`.
+        settings (iter[str]):
+            Any other user input which could change the found issues.
+            e.g. the disabled checker codes.
+
+    Returns:
+        str: The found key.
+
+    """
+    digest = hashlib.sha1()
+
+    def _add(text):
+        if isinstance(text, six.text_type):
+            text = text.encode("utf-8")
+
+        digest.update(text)
+        digest.update(b"\0")
+
+    _add(_FORMAT_VERSION)
+    # Rez defines this variable whenever ``rez_lint`` is part of the resolve
+    _add(os.getenv("REZ_REZ_LINT_VERSION", ""))
+    _add(package.filepath)
+
+    with open(package.filepath, "rb") as handler:
+        _add(handler.read())
+
+    for line in _iter_source_lines(finder.get_package_root(package)):
+        _add(line)
+
+    for line in _get_requirement_versions(package):
+        _add(line)
+
+    for name, source in sorted(
+        (registry.get_plugin_name(plugin), _get_plugin_source(plugin))
+        for plugin in plugins
+    ):
+        _add(name)
+        _add(source)
+
+    for setting in settings:
+        _add(setting)
+
+    return digest.hexdigest()
+
+
+def load(directory, key):
+    """Get the saved issues for some key, if any.
+
+    Args:
+        directory (str): The absolute folder on-disk where results are saved.
+        key (str): The value from :func:`get_key`.
+
+    Returns:
+        list[:class:`.Description`] or NoneType:
+            The saved issues. If nothing was saved, return None.
+
+    """
+    path = os.path.join(directory, key[:2], key + ".pickle")
+
+    if not os.path.isfile(path):
+        return None
+
+    try:
+        with open(path, "rb") as handler:
+            return pickle.load(handler)
+    except Exception:  # pylint: disable=broad-except
+        # A broken or old cache file is treated as if it didn't exist
+        _LOGGER.warning('Cache file "%s" could not be read.', path)
+
+        return None
+
+
+def save(directory, key, descriptions):
+    """Save issues for some key so that :func:`load` can find them later.
+
+    Args:
+        directory (str): The absolute folder on-disk where results are saved.
+        key (str): The value from :func:`get_key`.
+        descriptions (iter[:class:`.Description`]): The issues to save.
+
+    """
+    folder = os.path.join(directory, key[:2])
+
+    try:
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        descriptor, temporary = tempfile.mkstemp(dir=folder, suffix=".pickle")
+
+        with os.fdopen(descriptor, "wb") as handler:
+            pickle.dump(list(descriptions), handler, protocol=_PICKLE_PROTOCOL)
+
+        # Renaming is atomic so other ``rez_lint`` processes never
+        # read a partially-written file.
+        #
+        os.rename(temporary, os.path.join(folder, key + ".pickle"))
+    except (IOError, OSError) as error:
+        _LOGGER.warning(
+            'Results could not be saved to "%s". Error: "%s".', folder, error
+        )
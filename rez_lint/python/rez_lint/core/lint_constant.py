@@ -4,15 +4,32 @@
 """Any constants / configuration data that is neede by this package's business logic.
 
 Attributes:
+    DEFINITION_CHANGE (str):
+        A kind of file change, for ``rez_lint --watch``. The Rez
+        package's definition file changed.
+    FILE_CHANGE (str):
+        A kind of file change, for ``rez_lint --watch``. Any file in
+        the Rez package changed, other than its definition or Python files.
     HAS_PYTHON_PACKAGE (str):
         The key used to store if the found Rez package(s) is defines a
         Python package. The logic that determines this can be very slow
         so, to prevent ``rez_lint`` from running sub-optimally, this key
         is used by a context plugin to run it once and cache the result.
+    PACKAGE_SOURCE (str):
+        The key used to store the :class:`.PackageSource` of the Rez
+        package's definition file. Its text, rows, and parso graph are
+        shared by every checker.
+    PYTHON_CHANGE (str):
+        A kind of file change, for ``rez_lint --watch``. A Python file
+        in the Rez package changed.
 
 """
 
+DEFINITION_CHANGE = "definition"
 DEPENDENT_PACKAGES = "dependent_packages"
+FILE_CHANGE = "file"
 HAS_PYTHON_PACKAGE = "has_python_package"
+PACKAGE_SOURCE = "package_source"
 PARSO_GRAPH = "parso_graph"
+PYTHON_CHANGE = "python"
 RESOLVED_SOURCE_CONTEXT = "resolved_rez_package"
@@ -1,57 +1,192 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-"""A module that's dedicated to parsing Rez package definition files."""
+"""A module that's dedicated to parsing Rez package definition files.
 
+Every checker reports locations in the same package definition file so
+it's read and indexed just once, into a :class:`PackageSource`. Use
+:func:`get_source` to get it.
+
+"""
+
+import os
 import re
+import threading
+
+import parso
+
+from . import parso_comment_helper
+
+_DEFINITION = re.compile(
+    r"^(?:"
+    r"def\s+(?P<function>\w+)\s*\("  # functional
+    r"|(?P<name>\w+)\s*[=:]"  # Python or YAML syntax
+    r")"
+)
+_LINE = re.compile(r"[^\n]*\n|[^\n]+$")
+_LOCK = threading.Lock()
+_SOURCES = dict()  # path -> (modification time, size, :class:`PackageSource`)
+
+
+class PackageSource(object):
+    """The text, line offsets, top-level definitions, and parso graph of one file."""
+
+    def __init__(self, path, text):
+        """Index `text` so that rows, lines, and definitions can be found quickly.
+
+        Args:
+            path (str): The path on-disk to the package definition file.
+            text (str): The contents of `path`.
+
+        """
+        super(PackageSource, self).__init__()
+
+        self._path = path
+        self._text = text
+        self._offsets = [0]
+        self._definitions = dict()
+        self._graph = None
+        self._graph_lock = threading.Lock()
+        self._nodes = dict()
+
+        for line in _LINE.findall(text):
+            row = len(self._offsets)
+            self._offsets.append(self._offsets[-1] + len(line))
+            match = _DEFINITION.match(line)
+
+            if match:
+                # If an attribute is defined more than once, the last one wins
+                if match.group("function"):
+                    self._definitions[match.group("function")] = (
+                        row,
+                        match.start("function"),
+                    )
+                else:
+                    self._definitions[match.group("name")] = (row, 0)
+
+    def get_definition_position(self, attribute):
+        """Find the top-level line which defines some attribute.
+
+        Args:
+            attribute (str): The Rez package attribute. e.g. "version", "requires", etc.
+
+        Returns:
+            tuple[int, int]:
+                The 1-based row and 0-based column of the attribute's
+                name or (0, 0), if it isn't defined.
+
+        """
+        return self._definitions.get(attribute, (0, 0))
+
+    def get_graph(self):
+        """Parse this file with :mod:`parso`, once.
+
+        Returns:
+            :class:`parso.python.tree.Module` or NoneType:
+                The parsed file or nothing, if this isn't a Python file.
+
+        """
+        if not self._path.endswith(".py"):
+            return None
+
+        with self._graph_lock:
+            if self._graph is None:
+                self._graph = parso.parse(self._text)
+
+        return self._graph
+
+    def get_line(self, row):
+        """Get the text of some line, including its newline character.
+
+        Args:
+            row (int): A 1-based index number to get the text of.
+
+        Returns:
+            str: The text found at that line or "", if `row` is out of range.
 
+        """
+        if row < 1 or row >= len(self._offsets):
+            return ""
 
-def _make_attribute_expressions(attribute):
-    return (
-        re.compile(r"^{attribute}\s*=".format(attribute=attribute)),  # Python syntax
-        re.compile(
-            r"^def\s+{attribute}\s*\(".format(attribute=attribute)
-        ),  # functional
-        re.compile(r"^{attribute}\s*:".format(attribute=attribute)),  # YAML syntax
-    )
+        return self._text[self._offsets[row - 1] : self._offsets[row]]
 
+    def get_node(self, name):
+        """Find the :mod:`parso` node of some attribute, using the definition index.
 
-_EXPRESSIONS = {
-    "build_requires": _make_attribute_expressions("build_requires"),
-    "help": _make_attribute_expressions("help"),
-    "private_build_requires": _make_attribute_expressions("private_build_requires"),
-    "requires": _make_attribute_expressions("requires"),
-    "variants": _make_attribute_expressions("build_requires"),
-    "version": _make_attribute_expressions("version"),
-}
+        Args:
+            name (str): The Rez package attribute. e.g. "requires".
 
+        Returns:
+            :class:`parso.python.tree.Name` or NoneType:
+                The found node or nothing, if the attribute isn't found.
 
-def _get_row_number(path, expressions):
-    """Get the first line number that matches an expression in `expressions`.
+        """
+        graph = self.get_graph()
+
+        if not graph:
+            return None
+
+        if name not in self._nodes:
+            row, column = self.get_definition_position(name)
+            node = None
+
+            if row:
+                node = graph.get_leaf_for_position((row, column))
+
+            if getattr(node, "value", None) != name:
+                # e.g. `name` is defined in an unusual way, like `globals()[name] = []`
+                node = parso_comment_helper.find_named_node(graph, name)
+
+            self._nodes[name] = node
+
+        return self._nodes[name]
+
+    def get_path(self):
+        """str: The path on-disk to the package definition file."""
+        return self._path
+
+    def get_text(self):
+        """str: The full contents of the package definition file."""
+        return self._text
+
+
+def clear_source(path):
+    """Forget the :class:`PackageSource` of `path`, if :func:`get_source` made one.
 
     Args:
-        path (str):
-            The path on-disk to an ASCII file that is read and parsed.
-        expressions (list[:class:`_sre.compile`]):
-            Every Regex pattern used to find some text. The first
-            line in `path` that matches any of these patterns will be
-            returned.
+        path (str): The path on-disk to a package definition file.
+
+    """
+    with _LOCK:
+        _SOURCES.pop(os.path.normpath(path), None)
+
+
+def get_source(path):
+    """Read and index a package definition file, re-using it until the file changes.
+
+    Args:
+        path (str): The path on-disk to an ASCII file that is read and parsed.
 
     Returns:
-        int: A 1-based number that indicates the found match.
+        :class:`PackageSource`: The shared, indexed file.
 
     """
-    matches = set()
+    key = os.path.normpath(path)
+    status = os.stat(path)
+
+    with _LOCK:
+        cached = _SOURCES.get(key)
+
+    if cached and cached[:2] == (status.st_mtime, status.st_size):
+        return cached[2]
 
     with open(path, "r") as handler:
-        for index, line in enumerate(handler.readlines()):
-            for expression in expressions:
-                if expression.match(line):
-                    matches.add(index)
+        source = PackageSource(path, handler.read())
 
-                    break
+    with _LOCK:
+        _SOURCES[key] = (status.st_mtime, status.st_size, source)
 
-    return sorted(matches)[-1] + 1
+    return source
 
 
 def get_definition_row(path, attribute):
@@ -64,25 +199,13 @@ def get_definition_row(path, attribute):
             The Rez package attribute to query. e.g. "version",
             "requires", etc.
 
-    Raises:
-        ValueError: If `attribute` is not a supported option.
-
     Returns:
-        int: A 1-based number that indicates the found match.
+        int: A 1-based number that indicates the found match or 0, if there's no match.
 
     """
-    try:
-        expressions = _EXPRESSIONS[attribute]
-    except KeyError:
-        raise ValueError(
-            'Value "{attribute}" is not an option. Options are "{_EXPRESSIONS}".'
-            "".format(attribute=attribute, _EXPRESSIONS=sorted(_EXPRESSIONS))
-        )
+    row, _ = get_source(path).get_definition_position(attribute)
 
-    try:
-        return _get_row_number(path, expressions)
-    except IndexError:
-        return 0
+    return row
 
 
 def get_line_at_row(path, row):
@@ -96,9 +219,4 @@ def get_line_at_row(path, row):
         str: The text found at that line.
 
     """
-    with open(path, "r") as handler:
-        for index, line in enumerate(handler.readlines()):
-            if index + 1 == row:
-                return line
-
-    return ""
+    return get_source(path).get_line(row)
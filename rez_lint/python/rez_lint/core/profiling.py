@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Measure how long each context and checker plugin takes, per Rez package.
+
+``rez_lint`` wraps every plugin call in :func:`measure`. If no
+:class:`Profiler` is active, :func:`measure` does nothing. Otherwise,
+the call's time and the resolves which it re-used or made (see
+:mod:`rez_utilities.resolver`) are recorded.
+
+Context plugins often run while a checker reads their keys, so each
+plugin's time excludes the plugins which ran inside of it.
+
+Example:
+    >>> profiler = Profiler()
+    >>> with activate(profiler):
+    ...     cli.lint(directory)
+    >>> print(get_table(profiler.get_totals()))
+
+"""
+
+import collections
+import contextlib
+import json
+import threading
+import time
+
+from rez_utilities import resolver
+
+from . import registry
+
+_ACTIVE_PROFILERS = []
+_FORMAT_VERSION = 1
+_LOCK = threading.Lock()
+_RUN = "<run>"  # The "package" of calls which are made once, for every Rez package
+_STACK = threading.local()
+Total = collections.namedtuple(
+    "Total", "name kind calls seconds cache_hits cache_misses packages"
+)
+
+
+class Profiler(object):
+    """Record the cost of every plugin call, across every thread."""
+
+    def __init__(self):
+        """Start with no recorded calls."""
+        super(Profiler, self).__init__()
+
+        self._lock = threading.Lock()
+        # (plugin name, kind) -> {package path: [calls, seconds, hits, misses]}
+        self._records = collections.defaultdict(
+            lambda: collections.defaultdict(lambda: [0, 0.0, 0, 0])
+        )
+        self._lint_cache = {"hits": 0, "misses": 0}
+
+    def add(self, name, kind, package, seconds, cache_hits=0, cache_misses=0):
+        """Record a finished plugin call.
+
+        Args:
+            name (str): The importable name of the plugin. e.g. "foo.MyChecker".
+            kind (str): The type of plugin. e.g. "checker" or "context".
+            package (str): The path to the checked Rez package's definition file.
+            seconds (float): How long the call took, excluding nested plugins.
+            cache_hits (int, optional): The number of resolves that were re-used.
+            cache_misses (int, optional): The number of resolves that were made.
+
+        """
+        with self._lock:
+            record = self._records[(name, kind)][package]
+            record[0] += 1
+            record[1] += seconds
+            record[2] += cache_hits
+            record[3] += cache_misses
+
+    def add_lint_cache(self, hit):
+        """Record if the saved results of a Rez package were re-used.
+
+        Args:
+            hit (bool): If True, no plugin had to run for the Rez package.
+
+        """
+        with self._lock:
+            self._lint_cache["hits" if hit else "misses"] += 1
+
+    def get_lint_cache(self):
+        """dict[str, int]: The number of Rez packages whose results were / weren't re-used."""
+        with self._lock:
+            return dict(self._lint_cache)
+
+    def get_totals(self):
+        """Sum up the cost of each plugin, across every Rez package.
+
+        Returns:
+            list[:attr:`Total`]:
+                Every plugin, sorted from slowest to fastest.
+                ``packages`` is each Rez package and its seconds.
+
+        """
+        totals = []
+
+        with self._lock:
+            for (name, kind), packages in self._records.items():
+                records = list(packages.values())
+                totals.append(
+                    Total(
+                        name,
+                        kind,
+                        sum(record[0] for record in records),
+                        sum(record[1] for record in records),
+                        sum(record[2] for record in records),
+                        sum(record[3] for record in records),
+                        {package: record[1] for package, record in packages.items()},
+                    )
+                )
+
+        return sorted(totals, key=lambda total: (-total.seconds, total.name))
+
+    def merge(self, data):
+        """Add the calls which another profiler recorded, e.g. from another process.
+
+        Args:
+            data (dict): The output of :meth:`to_dict` of another profiler.
+
+        """
+        for plugin in data["plugins"]:
+            for package, record in plugin["packages"].items():
+                with self._lock:
+                    current = self._records[(plugin["name"], plugin["kind"])][package]
+
+                    for index, value in enumerate(record):
+                        current[index] += value
+
+        with self._lock:
+            for name, value in data["lint_cache"].items():
+                self._lint_cache[name] += value
+
+    def to_dict(self):
+        """dict: Get every recorded call, as data which can be saved as JSON."""
+        with self._lock:
+            plugins = [
+                {
+                    "kind": kind,
+                    "name": name,
+                    "packages": {
+                        package: list(record) for package, record in packages.items()
+                    },
+                }
+                for (name, kind), packages in sorted(self._records.items())
+            ]
+
+            return {
+                "lint_cache": dict(self._lint_cache),
+                "plugins": plugins,
+                "version": _FORMAT_VERSION,
+            }
+
+    def write(self, path):
+        """Save the totals of every plugin as a JSON file.
+
+        Args:
+            path (str): The absolute or relative file path to write to.
+
+        """
+        data = {
+            "lint_cache": self.get_lint_cache(),
+            "plugins": [total._asdict() for total in self.get_totals()],
+            "version": _FORMAT_VERSION,
+        }
+
+        with open(path, "w") as handler:
+            json.dump(data, handler, indent=4, sort_keys=True)
+
+
+def _get_resolves():
+    """tuple[int, int]: The number of re-used and made resolves, so far."""
+    statistics = resolver.get_statistics()
+
+    return statistics["hits"] + statistics["loads"], statistics["misses"]
+
+
+@contextlib.contextmanager
+def activate(profiler):
+    """Record every :func:`measure` into `profiler`, while in this context.
+
+    Args:
+        profiler (:class:`Profiler`): The object which records every call.
+
+    Yields:
+        :class:`Profiler`: `profiler`.
+
+    """
+    with _LOCK:
+        _ACTIVE_PROFILERS.append(profiler)
+
+    try:
+        yield profiler
+    finally:
+        with _LOCK:
+            _ACTIVE_PROFILERS.remove(profiler)
+
+
+def get_active():
+    """:class:`Profiler` or NoneType: Get the object that calls are recorded into."""
+    with _LOCK:
+        if _ACTIVE_PROFILERS:
+            return _ACTIVE_PROFILERS[-1]
+
+    return None
+
+
+def get_table(totals, lint_cache=None):
+    """Format plugin totals as a ranked table which can be printed.
+
+    Args:
+        totals (iter[:attr:`Total`]): The plugins to describe.
+        lint_cache (dict[str, int], optional):
+            The number of Rez packages whose saved results were /
+            weren't re-used. See :meth:`Profiler.get_lint_cache`.
+
+    Returns:
+        str: The generated table.
+
+    """
+    template = "{:<60} {:<8} {:>6} {:>11} {:>10} {:>12}"
+    lines = [
+        template.format(
+            "Plugin", "Kind", "Calls", "Total (ms)", "Mean (ms)", "Hits/Misses"
+        )
+    ]
+
+    for total in totals:
+        lines.append(
+            template.format(
+                total.name,
+                total.kind,
+                total.calls,
+                "{:.1f}".format(total.seconds * 1000.0),
+                "{:.1f}".format(total.seconds * 1000.0 / total.calls),
+                "{}/{}".format(total.cache_hits, total.cache_misses),
+            )
+        )
+
+    if lint_cache and any(lint_cache.values()):
+        lines.append(
+            "Saved results were re-used for {hits} of {count} Rez package(s).".format(
+                hits=lint_cache["hits"], count=lint_cache["hits"] + lint_cache["misses"]
+            )
+        )
+
+    return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def measure(plugin, kind, package=None):
+    """Record how long a plugin call takes, if a :class:`Profiler` is active.
+
+    Args:
+        plugin (:class:`.BaseChecker` or :class:`.BaseContext`): The plugin to call.
+        kind (str): The type of plugin call. e.g. "checker", "context", or "prepare".
+        package (:class:`rez.packages_.DeveloperPackage`, optional):
+            The checked Rez package. If None, the call is made once for
+            the whole run, e.g. a checker's ``prepare`` method.
+
+    Yields:
+        NoneType: Return the state of this context back to the user.
+
+    """
+    profiler = get_active()
+
+    if not profiler:
+        yield
+
+        return
+
+    if not hasattr(_STACK, "frames"):
+        _STACK.frames = []
+
+    # [nested seconds, nested hits, nested misses]
+    frame = [0.0, 0, 0]
+    _STACK.frames.append(frame)
+    hits, misses = _get_resolves()
+    start = time.time()
+
+    try:
+        yield
+    finally:
+        seconds = time.time() - start
+        _STACK.frames.pop()
+        current_hits, current_misses = _get_resolves()
+        # The counts restart if the resolve cache is cleared, e.g. by ``--watch``
+        hits = max(0, current_hits - hits)
+        misses = max(0, current_misses - misses)
+
+        if _STACK.frames:
+            parent = _STACK.frames[-1]
+            parent[0] += seconds
+            parent[1] += hits
+            parent[2] += misses
+
+        profiler.add(
+            registry.get_plugin_name(plugin),
+            kind,
+            package.filepath if package else _RUN,
+            seconds - frame[0],
+            cache_hits=hits - frame[1],
+            cache_misses=misses - frame[2],
+        )
@@ -47,6 +47,23 @@ def _has_context_interface(plugin):
     return True
 
 
+def get_plugin_name(plugin):
+    """Get the unique, importable name of some checker or context plugin.
+
+    Args:
+        plugin (:class:`.BaseChecker` or :class:`.BaseContext`):
+            The plugin class or an instance of it.
+
+    Returns:
+        str: The found name. e.g. "rez_lint.plugins.checkers.dangers.NoUuid".
+
+    """
+    if not isinstance(plugin, type):
+        plugin = plugin.__class__
+
+    return "{plugin.__module__}.{plugin.__name__}".format(plugin=plugin)
+
+
 def get_checkers():
     """list[:class:`.BaseChecker`]: The plugins used to check for lint issues."""
     return list(_CHECKERS)
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Check if URLs are reachable, concurrently, and remember the results.
+
+Checking a URL is slow and many Rez packages link to the same websites.
+This module checks every URL once per ``rez_lint`` run. If the
+``REZ_LINT_URL_CACHE`` environment variable points to a JSON file,
+reachable URLs are also saved there so that later runs skip them, for
+``REZ_LINT_URL_CACHE_HOURS`` hours (the default is 24).
+
+Attributes:
+    CACHE_PATH_VARIABLE (str):
+        The environment variable used to find the on-disk cache file.
+    CACHE_HOURS_VARIABLE (str):
+        The environment variable used to decide how many hours an
+        on-disk result can be re-used for.
+
+"""
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+from multiprocessing import pool
+
+from python_compatibility import website
+from rez_utilities import url_help
+from six.moves import urllib
+
+CACHE_HOURS_VARIABLE = "REZ_LINT_URL_CACHE_HOURS"
+CACHE_PATH_VARIABLE = "REZ_LINT_URL_CACHE"
+
+_DEFAULT_HOURS = 24.0
+_HOST_LOCKS = dict()
+_INTERNET = []
+_LOCK = threading.Lock()
+_LOGGER = logging.getLogger(__name__)
+_RESULTS = dict()
+
+
+def _get_host_lock(url, connections_per_host):
+    """Get a semaphore which limits how many connections are made to one host.
+
+    Args:
+        url (str): Some website address. e.g. "https://www.google.com".
+        connections_per_host (int): The number of connections allowed at once.
+
+    Returns:
+        :class:`threading.BoundedSemaphore`: The lock for `url`'s host.
+
+    """
+    host = urllib.parse.urlparse(url).netloc.lower()
+
+    with _LOCK:
+        if host not in _HOST_LOCKS:
+            _HOST_LOCKS[host] = threading.BoundedSemaphore(connections_per_host)
+
+        return _HOST_LOCKS[host]
+
+
+def _get_hours():
+    """float: The number of hours that on-disk results are considered valid."""
+    text = os.getenv(CACHE_HOURS_VARIABLE, "")
+
+    if not text:
+        return _DEFAULT_HOURS
+
+    try:
+        return float(text)
+    except ValueError:
+        _LOGGER.warning(
+            'Variable "%s" has non-number value "%s". Using "%s" instead.',
+            CACHE_HOURS_VARIABLE,
+            text,
+            _DEFAULT_HOURS,
+        )
+
+        return _DEFAULT_HOURS
+
+
+def _is_reachable(url, connections_per_host):
+    """bool: Check if `url` exists, without overloading its host."""
+    with _get_host_lock(url, connections_per_host):
+        try:
+            return url_help.is_url_reachable(url)
+        except socket.error:
+            # Connections which time out or are reset while reading are
+            # unreachable, too. `urllib` doesn't always wrap these errors.
+            #
+            return False
+
+
+def _read_disk_cache(path):
+    """Get every URL on-disk which was saved as reachable and is still valid.
+
+    Args:
+        path (str): The absolute path to a JSON file which may not exist yet.
+
+    Returns:
+        dict[str, float]: Each URL and the time when it was last reachable.
+
+    """
+    try:
+        with open(path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return dict()
+
+    if not isinstance(data, dict):
+        return dict()
+
+    oldest = time.time() - _get_hours() * 60 * 60
+
+    return {
+        url: checked
+        for url, checked in data.items()
+        if isinstance(checked, (int, float)) and checked >= oldest
+    }
+
+
+def _write_disk_cache(path, urls):
+    """Add reachable URLs to the on-disk cache.
+
+    The file is replaced in one step so that other ``rez_lint``
+    processes never read a partially-written cache.
+
+    Args:
+        path (str): The absolute path to a JSON file which may not exist yet.
+        urls (iter[str]): The URLs which were just found to be reachable.
+
+    """
+    data = _read_disk_cache(path)
+    now = time.time()
+
+    for url in urls:
+        data[url] = now
+
+    directory = os.path.dirname(path)
+
+    try:
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        descriptor, temporary = tempfile.mkstemp(dir=directory or None, suffix=".json")
+
+        with os.fdopen(descriptor, "w") as handler:
+            json.dump(data, handler, indent=4, sort_keys=True)
+
+        os.rename(temporary, path)
+    except (IOError, OSError) as error:
+        _LOGGER.warning(
+            'URL cache "%s" could not be written. Error: "%s".', path, error
+        )
+
+
+def check_urls(urls, jobs=16, connections_per_host=2):
+    """Find out which URLs are reachable.
+
+    URLs which were checked earlier in this run, or were reachable in an
+    earlier run (see :attr:`CACHE_PATH_VARIABLE`), aren't checked again.
+
+    Args:
+        urls (iter[str]): Every website address to check.
+        jobs (int, optional): The number of URLs to check at once. Default: 16.
+        connections_per_host (int, optional):
+            The number of URLs to check at once for any single website
+            host. This keeps ``rez_lint`` from flooding a documentation
+            server. Default: 2.
+
+    Returns:
+        dict[str, bool]: Each URL in `urls` and whether it is reachable.
+
+    """
+    urls = set(urls)
+
+    with _LOCK:
+        missing = sorted(url for url in urls if url not in _RESULTS)
+
+    path = os.getenv(CACHE_PATH_VARIABLE, "")
+
+    if missing and path:
+        saved = _read_disk_cache(path)
+
+        with _LOCK:
+            for url in missing:
+                if url in saved:
+                    _RESULTS[url] = True
+
+            missing = [url for url in missing if url not in _RESULTS]
+
+    if missing:
+        _LOGGER.debug('Checking "%s" URLs.', len(missing))
+
+        workers = pool.ThreadPool(min(jobs, len(missing)))
+
+        try:
+            results = workers.map(
+                lambda url: _is_reachable(url, connections_per_host), missing
+            )
+        finally:
+            workers.close()
+            workers.join()
+
+        with _LOCK:
+            _RESULTS.update(zip(missing, results))
+
+        if path:
+            _write_disk_cache(
+                path, [url for url, result in zip(missing, results) if result]
+            )
+
+    with _LOCK:
+        return {url: _RESULTS[url] for url in urls}
+
+
+def clear_cache():
+    """Forget every URL that was checked, so that they are checked again."""
+    with _LOCK:
+        _HOST_LOCKS.clear()
+        _RESULTS.clear()
+        del _INTERNET[:]
+
+
+def is_internet_on():
+    """bool: Check if the user is online. This is cached until :func:`clear_cache`."""
+    with _LOCK:
+        if _INTERNET:
+            return _INTERNET[0]
+
+    try:
+        value = website.is_internet_on()
+    except socket.error:
+        # e.g. The connection was reset. Assume that there is no Internet
+        value = False
+
+    with _LOCK:
+        _INTERNET[:] = [value]
+
+    return value
@@ -0,0 +1,418 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Find out which files change under some folders, as soon as they're saved.
+
+On Linux, changes are reported by the kernel, using inotify. Everywhere
+else, the folders are polled. Polling only lists a folder again if its
+own modification time changed, otherwise only its known files are
+checked.
+
+Use :func:`make_watcher` to get whichever is available.
+
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import time
+
+from rez.config import config
+
+_IGNORED_FOLDERS = frozenset((".git", ".hg", ".svn", "__pycache__", "node_modules"))
+_LOGGER = logging.getLogger(__name__)
+
+# Reference: /usr/include/sys/inotify.h
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_MASK = (
+    _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+    | _IN_DELETE_SELF
+)
+
+# Editors often save with several writes / renames. Wait this long for
+# more changes so that one save is reported only once.
+#
+_SETTLE_SECONDS = 0.02
+
+
+class _Inotify(object):
+    """Watch folders using Linux's inotify API."""
+
+    def __init__(self, library, roots):
+        """Watch every folder on-or-below `roots`.
+
+        Args:
+            library (:class:`ctypes.CDLL`): The C library which defines inotify.
+            roots (iter[str]): The absolute paths of every folder to watch.
+
+        Raises:
+            OSError: If inotify couldn't be started.
+
+        """
+        super(_Inotify, self).__init__()
+
+        self._library = library
+        self._descriptor = library.inotify_init1(_IN_CLOEXEC)
+
+        if self._descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify could not be started.")
+
+        self._roots = sorted(roots)
+        self._folders = dict()  # watch descriptor -> folder path
+
+        for root in self._roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root):
+        """Watch `root` and every folder below it.
+
+        Args:
+            root (str): The absolute path to some folder.
+
+        Returns:
+            set[str]: Every file which was found, while adding folders.
+
+        """
+        found = set()
+
+        for folder in _iter_folders(root):
+            path = folder.encode(sys.getfilesystemencoding())
+            descriptor = self._library.inotify_add_watch(self._descriptor, path, _MASK)
+
+            if descriptor < 0:
+                _LOGGER.warning('Folder "%s" could not be watched.', folder)
+
+                continue
+
+            self._folders[descriptor] = folder
+            found.update(_iter_files(folder))
+
+        return found
+
+    def _read(self, changed):
+        """Add every path which the kernel reported to `changed`.
+
+        Args:
+            changed (set[str]): The paths of every changed file or folder.
+
+        """
+        try:
+            data = os.read(self._descriptor, 65536)
+        except OSError as error:
+            if error.errno == errno.EINTR:
+                return
+
+            raise
+
+        offset = 0
+
+        while offset < len(data):
+            descriptor, mask, _, size = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + size].rstrip(b"\0")
+            offset += size
+
+            if mask & _IN_Q_OVERFLOW:
+                # Too many changes happened at once. Assume that everything changed.
+                changed.update(self._roots)
+
+                continue
+
+            folder = self._folders.get(descriptor)
+
+            if mask & _IN_IGNORED:
+                self._folders.pop(descriptor, None)
+
+                continue
+
+            if not folder:
+                continue
+
+            if not name:
+                changed.add(folder)
+
+                continue
+
+            path = os.path.join(folder, name.decode(sys.getfilesystemencoding()))
+
+            if mask & _IN_ISDIR:
+                if os.path.basename(path) in _get_ignored_folders():
+                    continue
+
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changed.update(self._add_tree(path))
+
+            changed.add(path)
+
+    def close(self):
+        """Stop watching every folder."""
+        if self._descriptor >= 0:
+            os.close(self._descriptor)
+            self._descriptor = -1
+
+    def wait(self, timeout=None):
+        """Wait until at least one file changes.
+
+        Args:
+            timeout (float, optional):
+                The maximum number of seconds to wait. If None, wait forever.
+
+        Returns:
+            set[str]:
+                The absolute paths of every created, modified, or
+                deleted file or folder. If nothing changed before
+                `timeout`, an empty set is returned.
+
+        """
+        changed = set()
+        readable, _, _ = select.select([self._descriptor], [], [], timeout)
+
+        while readable:
+            self._read(changed)
+            readable, _, _ = select.select([self._descriptor], [], [], _SETTLE_SECONDS)
+
+        return changed
+
+
+class _Poller(object):
+    """Watch folders by checking their modification times."""
+
+    def __init__(self, roots, interval=0.25):
+        """Remember the current state of every folder on-or-below `roots`.
+
+        Args:
+            roots (iter[str]): The absolute paths of every folder to watch.
+            interval (float, optional): The seconds to wait between each check.
+
+        """
+        super(_Poller, self).__init__()
+
+        self._interval = interval
+        self._folders = dict()  # folder path -> modification time
+        self._files = dict()  # file path -> (modification time, size)
+
+        for root in roots:
+            self._add_tree(root)
+
+    def _add_tree(self, root):
+        """Remember `root`, every folder below it, and all of their files.
+
+        Args:
+            root (str): The absolute path to some folder.
+
+        Returns:
+            set[str]: Every file which was found.
+
+        """
+        found = set()
+
+        for folder in _iter_folders(root):
+            self._folders[folder] = _get_stamp(folder)
+
+            for path in _iter_files(folder):
+                self._files[path] = _get_stamp(path)
+                found.add(path)
+
+        return found
+
+    def _get_changes(self):
+        """set[str]: Find every file or folder which changed since the last check."""
+        changed = set()
+        ignored = _get_ignored_folders()
+
+        for folder, stamp in list(self._folders.items()):
+            current = _get_stamp(folder)
+
+            if current == stamp:
+                continue
+
+            if current is None:
+                del self._folders[folder]
+                changed.add(folder)
+
+                continue
+
+            # Something was added, removed, or renamed in `folder`
+            self._folders[folder] = current
+
+            for name in os.listdir(folder):
+                path = os.path.join(folder, name)
+
+                if path in self._folders or path in self._files:
+                    continue
+
+                if os.path.isdir(path):
+                    if name not in ignored:
+                        changed.update(self._add_tree(path))
+                        changed.add(path)
+                elif os.path.isfile(path):
+                    self._files[path] = _get_stamp(path)
+                    changed.add(path)
+
+        for path, stamp in list(self._files.items()):
+            current = _get_stamp(path)
+
+            if current == stamp:
+                continue
+
+            if current is None:
+                del self._files[path]
+            else:
+                self._files[path] = current
+
+            changed.add(path)
+
+        return changed
+
+    def close(self):
+        """Stop watching every folder. This does nothing, it's here for consistency."""
+
+    def wait(self, timeout=None):
+        """Wait until at least one file changes.
+
+        Args:
+            timeout (float, optional):
+                The maximum number of seconds to wait. If None, wait forever.
+
+        Returns:
+            set[str]:
+                The absolute paths of every created, modified, or
+                deleted file or folder. If nothing changed before
+                `timeout`, an empty set is returned.
+
+        """
+        end = None
+
+        if timeout is not None:
+            end = time.time() + timeout
+
+        while True:
+            changed = self._get_changes()
+
+            if changed:
+                return changed
+
+            if end is not None and time.time() >= end:
+                return set()
+
+            time.sleep(self._interval)
+
+
+def _get_inotify():
+    """:class:`ctypes.CDLL` or NoneType: Get the C library which defines inotify, if any."""
+    if not sys.platform.startswith("linux"):
+        return None
+
+    try:
+        library = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True
+        )
+    except OSError:
+        return None
+
+    if not hasattr(library, "inotify_init1"):
+        return None
+
+    return library
+
+
+def _get_ignored_folders():
+    """set[str]: The names of folders which never contain files to watch."""
+    return _IGNORED_FOLDERS | {config.build_directory}  # pylint: disable=no-member
+
+
+def _get_stamp(path):
+    """tuple[float, int] or NoneType: The modification time and size of `path`, if it exists."""
+    try:
+        status = os.stat(path)
+    except OSError:
+        return None
+
+    return (status.st_mtime, status.st_size)
+
+
+def _iter_files(folder):
+    """Find every file directly inside of some folder.
+
+    Args:
+        folder (str): The absolute path to some folder.
+
+    Yields:
+        str: The absolute path of each file.
+
+    """
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return
+
+    for name in names:
+        path = os.path.join(folder, name)
+
+        if os.path.isfile(path):
+            yield path
+
+
+def _iter_folders(root):
+    """Find `root` and every folder below it which could contain Rez package files.
+
+    Args:
+        root (str): The absolute path to some folder.
+
+    Yields:
+        str: The absolute path of each folder.
+
+    """
+    ignored = _get_ignored_folders()
+
+    for folder, folders, _ in os.walk(root):
+        folders[:] = [name for name in folders if name not in ignored]
+
+        yield folder
+
+
+def make_watcher(roots, polling=False):
+    """Watch every folder on-or-below `roots` for changes.
+
+    Args:
+        roots (iter[str]): The absolute paths of every folder to watch.
+        polling (bool, optional):
+            If True, always poll for changes, even if inotify is available.
+
+    Returns:
+        :class:`_Inotify` or :class:`_Poller`:
+            An object with a ``wait(timeout=None)`` method, which
+            returns every changed path, and a ``close()`` method.
+
+    """
+    library = None
+
+    if not polling:
+        library = _get_inotify()
+
+    if library:
+        try:
+            return _Inotify(library, roots)
+        except OSError:
+            _LOGGER.warning("inotify could not be used. Falling back to polling.")
+
+    return _Poller(roots)
@@ -38,13 +38,49 @@ class Context(collections.MutableMapping):
             "runtime_context": {"processed_packages": processed_packages or []},
             "user_settings": {"verbose": verbose, "vimgrep": vimgrep},
         }
+        self._lazy = dict()
+
+    def add_lazy_keys(self, keys, function):
+        """Compute the values of some keys only once one of them is requested.
+
+        Args:
+            keys (iter[str]): The keys which `function` adds to this instance.
+            function (callable[]):
+                A function that takes no arguments. When called, it must
+                add the values of `keys` to this instance.
+
+        """
+        for key in keys:
+            self._lazy[key] = function
+
+    def discard_keys(self, keys):
+        """Forget the values of some keys, including any values that weren't computed yet.
+
+        Args:
+            keys (iter[str]): The keys to remove from this instance.
+
+        """
+        for key in keys:
+            self._data.pop(key, None)
+            self._lazy.pop(key, None)
 
     def __delitem__(self, key):
         """Delete the value at the given `key`."""
         del self._data[key]  # pragma: no cover
 
     def __getitem__(self, key):
-        """Get the value that is stored in `key`."""
+        """Get the value that is stored in `key`, computing it first if needed."""
+        if key not in self._data and key in self._lazy:
+            function = self._lazy[key]
+
+            # Remove `function` first so that it can't be called twice
+            names = [name for name, value in self._lazy.items() if value is function]
+
+            for name in names:
+                del self._lazy[name]
+
+            function()
+
         return self._data[key]
 
     def __iter__(self):
@@ -8,6 +8,8 @@ import collections
 
 import six
 
+from ...core import lint_constant
+
 Code = collections.namedtuple("Code", "short_name long_name")
 
 
@@ -21,11 +23,66 @@ class BaseChecker(object):
         """str: The string used to refer to this class or disable it."""
         return ""  # pragma: no cover
 
+    @staticmethod
+    def get_context_keys():
+        """Get the :class:`.Context` keys that this plugin reads.
+
+        Context plugins whose keys aren't needed by any enabled checker
+        are never run. If None, this checker may read any key.
+
+        Returns:
+            set[str] or NoneType: The keys that :meth:`run` needs, if known.
+
+        """
+        return None
+
     @staticmethod
     def get_order():
         """int: The execution order of this plugin. Increase this value to make it run sooner."""
         return 0
 
+    @staticmethod
+    def get_watched_changes():
+        """Get the kinds of file changes which could change this plugin's results.
+
+        ``rez_lint --watch`` only runs this plugin again after one of
+        these kinds of changes or if the :class:`.Context` data that
+        it reads is out of date. e.g. :attr:`.lint_constant.FILE_CHANGE`.
+
+        Returns:
+            set[str] or NoneType: The kinds of changes, if known. If None, any change.
+
+        """
+        return None
+
+    @staticmethod
+    def is_cacheable():
+        """Check if this plugin's results can be saved and re-used by later runs.
+
+        Return False if the results depend on something other than the
+        Rez package and its files, such as a website. Non-cacheable
+        checkers are always run, even if the rest of a Rez package's
+        results were re-used. They don't get any context data.
+
+        Returns:
+            bool: If the results of this checker depend only on the Rez package.
+
+        """
+        return True
+
+    @staticmethod
+    def prepare(packages):
+        """Pre-compute data for every Rez package before any package is checked.
+
+        This method is called once per-``rez_lint`` run. Checkers which
+        can share expensive work across Rez packages should override it.
+
+        Args:
+            packages (iter[:class:`rez.packages_.DeveloperPackage`]):
+                Every Rez package which will be checked, later.
+
+        """
+
     @staticmethod
     @abc.abstractmethod
     def run(package, context):
@@ -47,3 +104,23 @@ class BaseChecker(object):
 
         """
         return []  # pragma: no cover
+
+
+class DefinitionChecker(BaseChecker):  # pylint: disable=abstract-method
+    """A checker which reads only the Rez package definition.
+
+    It doesn't read any :class:`.Context` data so ``rez_lint`` skips
+    context plugins that no other checker needs. ``rez_lint --watch``
+    only runs it again after the definition changes.
+
+    """
+
+    @staticmethod
+    def get_context_keys():
+        """set[str]: This checker doesn't read any :class:`.Context` data."""
+        return set()
+
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: Only the Rez package's definition affects this checker."""
+        return {lint_constant.DEFINITION_CHANGE}
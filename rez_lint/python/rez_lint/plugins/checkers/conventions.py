@@ -7,7 +7,7 @@ from ...core import message_description, package_parser
 from . import base_checker
 
 
-class SemanticVersioning(base_checker.BaseChecker):
+class SemanticVersioning(base_checker.DefinitionChecker):
     """Check that the Rez package follows X.Y.Z versioning.
 
     Rez states explicitly in their code that semantic versioning is
@@ -8,16 +8,16 @@ import collections
 import logging
 import os
 
-from python_compatibility import website
-from rez_utilities import finder, url_help
+import six
+from rez_utilities import finder
 
-from ...core import lint_constant, message_description, package_parser
+from ...core import lint_constant, message_description, package_parser, url_cache
 from . import base_checker
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class _DuplicateListAttribute(base_checker.BaseChecker):
+class _DuplicateListAttribute(base_checker.DefinitionChecker):
     """The base class that will be used to make sure list Rez requirements are correct."""
 
     @abc.abstractproperty
@@ -205,7 +205,7 @@ class DuplicateRequires(_DuplicateListAttribute):
         return "duplicate-requires"
 
 
-class ImproperRequirements(base_checker.BaseChecker):
+class ImproperRequirements(base_checker.DefinitionChecker):
     """A checker that makes sure the user doesn't put weird requirements in their Rez packages.
 
     Build requirements should be placed in the
@@ -399,6 +399,16 @@ class ImproperVariants(ImproperRequirements):
 class MissingRequirements(base_checker.BaseChecker):
     """Check that a Rez package's requirements are up to date."""
 
+    @staticmethod
+    def get_context_keys():
+        """set[str]: The Python dependencies of the Rez package."""
+        return {lint_constant.DEPENDENT_PACKAGES, lint_constant.HAS_PYTHON_PACKAGE}
+
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: The definition. Python files are found by its context data."""
+        return {lint_constant.DEFINITION_CHANGE}
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
@@ -463,7 +473,7 @@ class MissingRequirements(base_checker.BaseChecker):
         ]
 
 
-class RequirementLowerBoundsMissing(base_checker.BaseChecker):
+class RequirementLowerBoundsMissing(base_checker.DefinitionChecker):
     """Check that the user is practicing good bounds standards.
 
     e.g.
@@ -538,7 +548,7 @@ class RequirementLowerBoundsMissing(base_checker.BaseChecker):
         ]
 
 
-class RequirementsNotSorted(base_checker.BaseChecker):
+class RequirementsNotSorted(base_checker.DefinitionChecker):
     """Check that requirements are kept alphabetically sorted."""
 
     @staticmethod
@@ -589,7 +599,7 @@ class RequirementsNotSorted(base_checker.BaseChecker):
         ]
 
 
-class NotPythonDefinition(base_checker.BaseChecker):
+class NotPythonDefinition(base_checker.DefinitionChecker):
     """Check if the Rez package is package.yaml, package.txt, or some other package.py standard."""
 
     @staticmethod
@@ -636,7 +646,7 @@ class NotPythonDefinition(base_checker.BaseChecker):
         ]
 
 
-class NoRezTest(base_checker.BaseChecker):
+class NoRezTest(base_checker.DefinitionChecker):
     """Check for tests in the current Rez package."""
 
     @staticmethod
@@ -680,7 +690,7 @@ class NoRezTest(base_checker.BaseChecker):
         ]
 
 
-class NoUuid(base_checker.BaseChecker):
+class NoUuid(base_checker.DefinitionChecker):
     """Check for a defined ``uuid`` attribute for a Rez package."""
 
     @staticmethod
@@ -728,7 +738,7 @@ class NoUuid(base_checker.BaseChecker):
         ]
 
 
-class TooManyDependencies(base_checker.BaseChecker):
+class TooManyDependencies(base_checker.DefinitionChecker):
     """Check if a Rez package is in danger of becoming bloated and hard to work with."""
 
     _maximum_dependencies = 10
@@ -781,7 +791,7 @@ class TooManyDependencies(base_checker.BaseChecker):
         ]
 
 
-class UrlNotReachable(base_checker.BaseChecker):
+class UrlNotReachable(base_checker.DefinitionChecker):
     """Check every rez-test URL destination to make sure it exists.
 
     If for any reason the Internet is down, just skip the test.
@@ -823,11 +833,67 @@ class UrlNotReachable(base_checker.BaseChecker):
 
         return invalids
 
+    @staticmethod
+    def _get_help_urls(package):
+        """Get the URL of every entry in a Rez package's ``help`` attribute.
+
+        Args:
+            package (:class:`rez.packages_.Package`):
+                A Rez package that may have a ``help`` attribute/function defined.
+
+        Returns:
+            list[tuple[int, str, str, str]]:
+                The entry number in the ``help`` attribute, the entry's
+                label, its command, and the URL which the command opens.
+
+        """
+        help_ = package.help or []
+
+        if isinstance(help_, six.string_types):
+            # The user can give a list of list of strings or just a single string
+            # Reference: https://github.com/nerdvegas/rez/wiki/Package-Definition-Guide#help
+            #
+            help_ = [["", help_]]
+
+        # A command may be a raw URL, like "https://google.com", or
+        # a command which opens a URL, like "firefox https://google.com"
+        #
+        return [
+            (index, label, command, command.split(" ")[-1])
+            for index, (label, command) in enumerate(help_)
+        ]
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
         return "url-unreachable"
 
+    @staticmethod
+    def is_cacheable():
+        """bool: Websites can go up or down at any time so never save the results."""
+        return False
+
+    @classmethod
+    def prepare(cls, packages):
+        """Check the ``help`` URLs of every Rez package, all at once.
+
+        Many Rez packages share the same URLs or, at least, the same
+        websites. Checking every URL up-front means that each URL is
+        only checked once and many URLs can be checked concurrently.
+
+        Args:
+            packages (iter[:class:`rez.packages_.Package`]):
+                Every Rez package which will be checked, later.
+
+        """
+        urls = set()
+
+        for package in packages:
+            urls.update(url for _, _, _, url in cls._get_help_urls(package))
+
+        if urls and url_cache.is_internet_on():
+            url_cache.check_urls(urls)
+
     @classmethod
     def run(cls, package, _):
         """Find every URL in a Rez package that points to a bad web address.
@@ -844,14 +910,20 @@ class UrlNotReachable(base_checker.BaseChecker):
         if not package.help:
             return []
 
-        if not website.is_internet_on():
+        if not url_cache.is_internet_on():
             _LOGGER.warning(
                 "User has no internet. Checking for help URLs will be skipped."
             )
 
             return []
 
-        urls = url_help.get_invalid_help_urls(package)
+        entries = cls._get_help_urls(package)
+        reachables = url_cache.check_urls(url for _, _, _, url in entries)
+        urls = {
+            (index, label, command)
+            for index, label, command, url in entries
+            if not reachables[url]
+        }
 
         if not urls:
             return []
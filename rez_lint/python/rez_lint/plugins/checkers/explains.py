@@ -12,12 +12,17 @@ from ...core import lint_constant, message_description
 from . import base_checker
 
 
-class _MissingFile(base_checker.BaseChecker):  # pylint: disable=abstract-method
+class _MissingFile(base_checker.DefinitionChecker):  # pylint: disable=abstract-method
     """Check for the existence of a file near a Rez package."""
 
     _file_name = ""
     _summary = ""
 
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: The definition and the Rez package's other files."""
+        return {lint_constant.DEFINITION_CHANGE, lint_constant.FILE_CHANGE}
+
     @classmethod
     def run(cls, package, _):
         """Find a README.md file using a Rez package.
@@ -62,6 +67,11 @@ class NoChangeLog(_MissingFile):
 class NoDocumentation(base_checker.BaseChecker):
     """Find documentation for the user's Rez package and report if it's missing."""
 
+    @staticmethod
+    def get_context_keys():
+        """set[str]: If the Rez package has Python files."""
+        return {lint_constant.HAS_PYTHON_PACKAGE}
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
@@ -107,7 +117,7 @@ class NoDocumentation(base_checker.BaseChecker):
         ]
 
 
-class NoHelp(base_checker.BaseChecker):
+class NoHelp(base_checker.DefinitionChecker):
     """Find the ``help`` attribute for the user's Rez package and report if it's missing."""
 
     @staticmethod
@@ -31,6 +31,16 @@ class NeedsComment(base_checker.BaseChecker):
 
     """
 
+    @staticmethod
+    def get_context_keys():
+        """set[str]: The parsed package.py and its Python dependencies."""
+        return {lint_constant.DEPENDENT_PACKAGES, lint_constant.PACKAGE_SOURCE}
+
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: The definition. Python files are found by its context data."""
+        return {lint_constant.DEFINITION_CHANGE}
+
     @staticmethod
     def get_long_code():
         """str: The string used to refer to this class or disable it."""
@@ -54,16 +64,9 @@ class NeedsComment(base_checker.BaseChecker):
                 e.g. {"rez": "The best thing to happen since sliced bread!"}.
 
         """
-        node = parso_comment_helper.find_named_node(graph, "requires")
-
-        if not isinstance(node, tree.Name):
-            # This isn't supported yet but theoretically could be done
-            raise EnvironmentError('Node "{node}" is not supported.'.format(node=node))
-
-        full_definition = parso_comment_helper.get_full_name_definition(node)
-        just_the_requirements = parso_comment_helper.trim_list_excess(full_definition)
-
-        return parso_comment_helper.get_comment_pairs(just_the_requirements)
+        return _get_node_comment_pairs(
+            parso_comment_helper.find_named_node(graph, "requires")
+        )
 
     @classmethod
     def run(cls, package, context):
@@ -87,7 +90,7 @@ class NeedsComment(base_checker.BaseChecker):
                 return one description of each found issue.
 
         """
-        graph = context.get(lint_constant.PARSO_GRAPH)
+        source = context.get(lint_constant.PACKAGE_SOURCE)
 
         if lint_constant.DEPENDENT_PACKAGES not in context:
             _LOGGER.warning(
@@ -97,13 +100,13 @@ class NeedsComment(base_checker.BaseChecker):
 
             return []
 
-        if not graph:
+        if not source or not source.get_graph():
             _LOGGER.info("NeedsComment class will not run because no graph was found.")
 
             return []
 
         try:
-            pairs = cls._get_comment_pairs(graph)
+            pairs = _get_node_comment_pairs(source.get_node("requires"))
         except EnvironmentError:
             _LOGGER.info(
                 'The `requires` in "%s" is not an attribute so requirements cannot be checked.',
@@ -193,3 +196,29 @@ def _get_missing_comment_pairs(requirements, pairs, dependencies):
             missing.add(requirement)
 
     return missing
+
+
+def _get_node_comment_pairs(node):
+    """Get every Rez requirement string and its comment.
+
+    Args:
+        node (:class:`parso.python.tree.Name` or NoneType):
+            The ``requires`` attribute of a parsed Rez package.py.
+
+    Raises:
+        EnvironmentError: If `node` isn't a valid "requires" attribute.
+
+    Returns:
+        dict[str, str]:
+            The string or variable name and its commented value.
+            e.g. {"rez": "The best thing to happen since sliced bread!"}.
+
+    """
+    if not isinstance(node, tree.Name):
+        # This isn't supported yet but theoretically could be done
+        raise EnvironmentError('Node "{node}" is not supported.'.format(node=node))
+
+    full_definition = parso_comment_helper.get_full_name_definition(node)
+    just_the_requirements = parso_comment_helper.trim_list_excess(full_definition)
+
+    return parso_comment_helper.get_comment_pairs(just_the_requirements)
@@ -17,6 +17,34 @@ class BaseContext(object):
 
     """
 
+    @staticmethod
+    def get_keys():
+        """Get the keys that this plugin adds to the :class:`.Context`.
+
+        If keys are given, this plugin only runs the first time that
+        a checker requests one of them. If no checker needs them, this
+        plugin never runs. If no keys are given, this plugin always
+        runs, before any checker.
+
+        Returns:
+            tuple[str]: The keys which :meth:`run` adds.
+
+        """
+        return tuple()
+
+    @staticmethod
+    def get_watched_changes():
+        """Get the kinds of file changes which make this plugin's data out of date.
+
+        ``rez_lint --watch`` only runs this plugin again after one of
+        these kinds of changes. e.g. :attr:`.lint_constant.PYTHON_CHANGE`.
+
+        Returns:
+            set[str] or NoneType: The kinds of changes, if known. If None, any change.
+
+        """
+        return None
+
     @staticmethod
     def get_order():
         """int: The priority of this plugin. To give higher priority, increase this value."""
@@ -8,11 +8,11 @@ import os
 import subprocess
 
 from python_compatibility import dependency_analyzer, filer
-from rez import exceptions, resolved_context
+from rez import exceptions
 from rez.config import config
-from rez_utilities import finder, inspection
+from rez_utilities import finder, inspection, resolver
 
-from ...core import lint_constant
+from ...core import dependency_worker, lint_constant
 from . import base_context
 
 _LOGGER = logging.getLogger(__name__)
@@ -21,6 +21,16 @@ _LOGGER = logging.getLogger(__name__)
 class HasPythonPackage(base_context.BaseContext):
     """Find out if a Rez package defines a Python package and cache the result."""
 
+    @staticmethod
+    def get_keys():
+        """tuple[str]: The keys which this plugin adds to the :class:`.Context`."""
+        return (lint_constant.HAS_PYTHON_PACKAGE,)
+
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: The definition and Python files affect this plugin."""
+        return {lint_constant.DEFINITION_CHANGE, lint_constant.PYTHON_CHANGE}
+
     @staticmethod
     def run(package, context):
         """Add context information to `context`, using data inside of `package`.
@@ -36,7 +46,10 @@ class HasPythonPackage(base_context.BaseContext):
         """
         try:
             has_package = inspection.has_python_package(
-                package, allow_build=False, allow_current_context=True,
+                package,
+                allow_build=False,
+                allow_current_context=True,
+                context=_get_existing_context(package),
             )
         except exceptions.PackageFamilyNotFoundError:
             _LOGGER.warning(
@@ -56,6 +69,19 @@ class SourceResolvedContext(base_context.BaseContext):
 
     """
 
+    @staticmethod
+    def get_keys():
+        """tuple[str]: The keys which this plugin adds to the :class:`.Context`."""
+        return (
+            lint_constant.DEPENDENT_PACKAGES,
+            lint_constant.RESOLVED_SOURCE_CONTEXT,
+        )
+
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: The definition and Python files affect this plugin."""
+        return {lint_constant.DEFINITION_CHANGE, lint_constant.PYTHON_CHANGE}
+
     @staticmethod
     def run(package, context):
         """Get the resolved Rez context and add it to ``rez_lint``'s main context.
@@ -82,7 +108,7 @@ class SourceResolvedContext(base_context.BaseContext):
                 _LOGGER.exception('Package "%s" could not be resolved.', package)
 
             dependency_paths = _get_dependency_paths_using_context(
-                python_paths, rez_context
+                python_paths, rez_context, package.name
             )
 
         packages = _get_root_rez_packages(dependency_paths)
@@ -92,12 +118,40 @@ class SourceResolvedContext(base_context.BaseContext):
         context[lint_constant.DEPENDENT_PACKAGES] = packages
 
 
-def _get_dependency_paths_using_context(paths, rez_context):
+def _get_dependency_paths_using_context(paths, rez_context, name):
+    """Find every Python file dependency of `paths`, using some environment.
+
+    A long-running dependency analyzer is re-used for every Rez package
+    with the same resolve, not counting the Rez package itself. See
+    :mod:`rez_lint.core.dependency_worker`.
+
+    Args:
+        paths (iter[str]):
+            The absolute paths to the Python folders of a Rez package.
+        rez_context (:class:`rez.resolved_context.ResolvedContext` or NoneType):
+            The environment used to import the Python files. If None,
+            the current environment is used.
+        name (str): The name of the Rez package which `paths` come from.
+
+    Returns:
+        set[str]: The found Python file dependencies.
+
+    """
     caller = _get_popen_with_shell
 
     if rez_context:
         caller = rez_context.execute_command
 
+    try:
+        return dependency_worker.get_dependency_paths(
+            paths,
+            caller,
+            dependency_worker.get_environment_key(rez_context, ignore=[name]),
+            python_paths=paths,
+        )
+    except dependency_worker.WorkerError:
+        _LOGGER.debug("Worker failed. Running the analyzer once.", exc_info=True)
+
     return _search_for_python_dependencies(caller, paths)
 
 
@@ -108,6 +162,37 @@ def _get_popen_with_shell(*args, **kwargs):
     return subprocess.Popen(*args, **kwargs)
 
 
+def _get_existing_context(package):
+    """Get the resolve that :class:`SourceResolvedContext` uses, if it works.
+
+    :class:`HasPythonPackage` only needs `package`'s Python paths, which
+    this resolve has too. Re-using it avoids resolving `package` twice.
+
+    Args:
+        package (:class:`rez.packages_.Package`): The Rez package to resolve.
+
+    Returns:
+        :class:`rez.resolved_context.ResolvedContext` or NoneType:
+            The resolved context. If `package` is already in the current
+            environment or the resolve failed, return None.
+
+    """
+    if inspection.in_valid_context(package):
+        return None
+
+    try:
+        context = _resolve(package)
+    except exceptions.RezError:
+        _LOGGER.debug('Package "%s" could not be resolved.', package, exc_info=True)
+
+        return None
+
+    if not context.success:
+        return None
+
+    return context
+
+
 def _get_package_python_paths(package):
     rez_context = None
 
@@ -168,6 +253,8 @@ def _get_root_rez_packages(paths):
 def _resolve(package):
     """Make a resolved context of the given Rez package + :mod:`python_compatibility`.
 
+    The context is resolved only once per process. See :mod:`rez_utilities.resolver`.
+
     Warning:
         This function may not behavior normally if `package` contains variants.
 
@@ -184,7 +271,7 @@ def _resolve(package):
     if inspection.is_built_package(package):
         version = package.version
 
-    return resolved_context.ResolvedContext(
+    return resolver.get_context(
         [
             "{package.name}=={version}".format(package=package, version=version),
             "python_compatibility-2",
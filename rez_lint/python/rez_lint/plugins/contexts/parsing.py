@@ -3,23 +3,34 @@
 
 """Heavy processing like parsing Python files take place in this module."""
 
-import parso
-
-from ...core import lint_constant
+from ...core import lint_constant, package_parser
 from . import base_context
 
 
 class ParsePackageDefinition(base_context.BaseContext):
     """Use :mod:`parso` to tokenize and parse a the Rez package.py file.
 
-    This checker assumes that the user is using "package.py". Other standards
-    like "package.yaml" are ignored.
+    The parso module assumes that the user is using "package.py". Other
+    standards like "package.yaml" only get a :class:`.PackageSource`.
 
     """
 
+    @staticmethod
+    def get_keys():
+        """tuple[str]: The keys which this plugin adds to the :class:`.Context`."""
+        return (lint_constant.PACKAGE_SOURCE, lint_constant.PARSO_GRAPH)
+
+    @staticmethod
+    def get_watched_changes():
+        """set[str]: Only the Rez package's definition affects this plugin."""
+        return {lint_constant.DEFINITION_CHANGE}
+
     @staticmethod
     def run(package, context):
-        """Parse `package` into parso nodes and add the entire module into `context`.
+        """Add the read `package` and its parsed parso module into `context`.
+
+        Both are shared with :mod:`.package_parser`, which checkers use
+        to find the rows of their issues. So the file is read only once.
 
         Args:
             package (:class:`rez.packages_.DeveloperPackage`):
@@ -28,12 +39,9 @@ class ParsePackageDefinition(base_context.BaseContext):
                 A data instance that will stored the parsed output.
 
         """
-        path = package.filepath
-
-        if not path.endswith(".py"):
-            return
-
-        with open(path, "r") as handler:
-            code = handler.read()
+        source = package_parser.get_source(package.filepath)
+        context[lint_constant.PACKAGE_SOURCE] = source
+        graph = source.get_graph()
 
-        context[lint_constant.PARSO_GRAPH] = parso.parse(code)
+        if graph:
+            context[lint_constant.PARSO_GRAPH] = graph
@@ -760,7 +760,7 @@ class ImproperVariants(packaging.BasePackaging):
 
         self.assertEqual(1, len(issues))
         self.assertEqual(
-            "D: 0, 0: Improper build package requirements were found (improper-variants)",
+            "D: 7, 0: Improper build package requirements were found (improper-variants)",
             issues[0].get_message(verbose=True)[0],
         )
 
@@ -809,7 +809,7 @@ class ImproperVariants(packaging.BasePackaging):
 
         self.assertEqual(1, len(issues))
         self.assertEqual(
-            "D: 0, 0: Improper unittest package requirements were found (improper-variants)",
+            "D: 7, 0: Improper unittest package requirements were found (improper-variants)",
             issues[0].get_message(verbose=True)[0],
         )
 
@@ -1949,6 +1949,52 @@ class UrlNotReachable(packaging.BasePackaging):
             ),
         )
 
+    @mock.patch("rez_utilities.url_help.is_url_reachable")
+    @mock.patch("python_compatibility.website.is_internet_on")
+    def test_shared_urls(self, is_internet_on, is_url_reachable):
+        """Check a URL only once, even if many Rez packages use it."""
+        is_internet_on.return_value = True
+        is_url_reachable.return_value = False
+
+        directory = packaging.make_fake_source_package(
+            "package_a",
+            textwrap.dedent(
+                """\
+                name = "package_a"
+                version = "1.0.0"
+                help = "https://something_that_doesnt_exist.com"
+                """
+            ),
+        )
+        root = os.path.dirname(directory)
+        self.delete_item_later(root)
+        os.makedirs(os.path.join(root, "package_b"))
+
+        with open(os.path.join(root, "package_b", "package.py"), "w") as handler:
+            handler.write(
+                textwrap.dedent(
+                    """\
+                    name = "package_b"
+                    version = "1.0.0"
+                    help = [["Home", "firefox https://something_that_doesnt_exist.com"]]
+                    """
+                )
+            )
+
+        results = cli.lint(root, recursive=True)
+
+        issues = [
+            description
+            for description in results
+            if description.get_summary()[0] == "Package help has an un-reachable URL"
+        ]
+
+        self.assertEqual(2, len(issues))
+        is_url_reachable.assert_called_once_with(
+            "https://something_that_doesnt_exist.com"
+        )
+        is_internet_on.assert_called_once_with()
+
 
 def _get_rezbuild_text():
     """Create a basic rezbuild.py file's contents."""
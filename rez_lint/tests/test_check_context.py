@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :class:`rez_lint.plugins.check_context.Context` computes data lazily."""
+
+import os
+import shutil
+import textwrap
+import unittest
+
+from rez_lint import cli
+from rez_lint.core import lint_constant
+from rez_lint.plugins import check_context
+from six.moves import mock
+
+from . import packaging
+
+_CONTEXTS = "rez_lint.plugins.contexts."
+
+
+class Lazy(unittest.TestCase):
+    """Compute context data only once it's needed."""
+
+    def test_once(self):
+        """Run a lazy function once, on first access, for all of its keys."""
+        context = check_context.Context(mock.MagicMock())
+
+        def _add():
+            context["foo"] = 1
+            context["bar"] = 2
+
+        function = mock.MagicMock(side_effect=_add)
+        context.add_lazy_keys(["foo", "bar"], function)
+
+        self.assertFalse(function.called)
+        self.assertEqual(1, context["foo"])
+        self.assertEqual(2, context["bar"])
+        self.assertTrue("foo" in context)
+        self.assertEqual(1, function.call_count)
+
+    def test_missing(self):
+        """Treat keys that the lazy function didn't add as missing."""
+        context = check_context.Context(mock.MagicMock())
+        context.add_lazy_keys(["foo"], lambda: None)
+
+        self.assertIsNone(context.get("foo"))
+        self.assertFalse("foo" in context)
+
+
+class Disabled(unittest.TestCase):
+    """Don't run context plugins whose data no enabled checker reads."""
+
+    def setUp(self):
+        """Create a Rez package to lint."""
+        self._directory = packaging.make_fake_source_package(
+            "some_package",
+            textwrap.dedent(
+                """\
+                name = "some_package"
+                version = "1.0.0"
+                requires = ["foo-1"]
+                """
+            ),
+        )
+        self.addCleanup(shutil.rmtree, os.path.dirname(self._directory))
+
+    @mock.patch(_CONTEXTS + "parsing.ParsePackageDefinition.run")
+    @mock.patch(_CONTEXTS + "packaging.SourceResolvedContext.run")
+    @mock.patch(_CONTEXTS + "packaging.HasPythonPackage.run")
+    def test_disabled(self, has_python_package, resolve, parse):
+        """Skip every context if the checkers which need them are disabled."""
+        cli.lint(
+            self._directory,
+            disable={"missing-requirements", "needs-comment", "no-documentation"},
+        )
+
+        self.assertFalse(has_python_package.called)
+        self.assertFalse(resolve.called)
+        self.assertFalse(parse.called)
+
+    @mock.patch(_CONTEXTS + "packaging.SourceResolvedContext.run")
+    @mock.patch(_CONTEXTS + "packaging.HasPythonPackage.run")
+    def test_not_accessed(self, has_python_package, resolve):
+        """Don't resolve a Rez package which has no Python files."""
+
+        def _add(_, context):
+            context[lint_constant.HAS_PYTHON_PACKAGE] = False
+
+        has_python_package.side_effect = _add
+
+        cli.lint(self._directory, disable={"needs-comment"})
+
+        self.assertTrue(has_python_package.called)
+        self.assertFalse(resolve.called)
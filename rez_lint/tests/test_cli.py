@@ -4,10 +4,14 @@
 """Test the plugin registry calls for :mod:`rez_lint.cli`."""
 
 import os
+import shutil
+import tempfile
+import textwrap
 import unittest
 
 from rez_lint import cli
 from rez_utilities import finder
+from six.moves import mock
 
 _CURRENT_DIRECTORY = os.path.dirname(os.path.realpath(__file__))
 
@@ -44,3 +48,126 @@ class Generic(unittest.TestCase):
         self.assertEqual(found_package.filepath, package.filepath)
         self.assertEqual(found_package.version, package.version)
         self.assertEqual(set(), invalids)
+
+
+class Recursive(unittest.TestCase):
+    """Make sure that Rez packages are found quickly and correctly."""
+
+    def setUp(self):
+        """Create a folder with Rez packages and folders which must be skipped."""
+        self._root = tempfile.mkdtemp(suffix="_rez_lint_recursive")
+        self.addCleanup(shutil.rmtree, self._root)
+
+        for folder in (
+            "package_a",
+            os.path.join("package_a", "build"),
+            os.path.join("nested", "package_b"),
+            os.path.join("nested", "package_b", "inner", "package_c"),
+            os.path.join("nested", ".git", "package_d"),
+        ):
+            self._make_package(folder)
+
+        os.makedirs(os.path.join(self._root, "nested", "package_b", "python"))
+
+    def _make_package(self, folder):
+        """Write a package.py into `folder`, named after `folder`."""
+        directory = os.path.join(self._root, folder)
+        os.makedirs(directory)
+
+        with open(os.path.join(directory, "package.py"), "w") as handler:
+            handler.write(
+                'name = "{name}"\nversion = "1.0.0"\n'.format(
+                    name=os.path.basename(folder)
+                )
+            )
+
+    def _find(self, jobs=1):
+        """Get the names of every found Rez package and every invalid folder."""
+        packages, invalids = cli._find_rez_packages(  # pylint: disable=protected-access
+            self._root, recursive=True, jobs=jobs
+        )
+
+        return {package.name for package in packages}, invalids
+
+    def test_skip_folders(self):
+        """Only load folders which have a Rez package file and aren't ignored."""
+        with mock.patch(
+            "rez.packages_.get_developer_package",
+            wraps=cli.packages_.get_developer_package,
+        ) as loader:
+            names, invalids = self._find()
+
+        self.assertEqual({"package_a", "package_b", "package_c"}, names)
+        self.assertEqual(set(), invalids)
+        self.assertEqual(3, loader.call_count)
+
+    def test_invalid(self):
+        """Report a folder whose Rez package has an invalid schema."""
+        directory = os.path.join(self._root, "broken")
+        os.makedirs(directory)
+
+        with open(os.path.join(directory, "package.py"), "w") as handler:
+            handler.write('name = "broken"\nversion = "1.0.0"\nrequires = 8\n')
+
+        names, invalids = self._find()
+
+        self.assertEqual({"package_a", "package_b", "package_c"}, names)
+        self.assertEqual({directory}, invalids)
+
+    def test_parallel(self):
+        """Find the same Rez packages when loading them at once."""
+        self.assertEqual(self._find(), self._find(jobs=4))
+
+    @unittest.skipIf(not hasattr(os, "symlink"), "Symlinks aren't supported.")
+    def test_symlink(self):
+        """Don't search symlinked folders, which may point outside of the folder."""
+        outside = tempfile.mkdtemp(suffix="_rez_lint_outside")
+        self.addCleanup(shutil.rmtree, outside)
+        directory = os.path.join(outside, "package_e")
+        os.makedirs(directory)
+
+        with open(os.path.join(directory, "package.py"), "w") as handler:
+            handler.write('name = "package_e"\nversion = "1.0.0"\n')
+
+        os.symlink(outside, os.path.join(self._root, "link"))
+        names, _ = self._find()
+
+        self.assertEqual({"package_a", "package_b", "package_c"}, names)
+
+
+class Jobs(unittest.TestCase):
+    """Make sure that checking Rez packages in parallel finds the same issues."""
+
+    def setUp(self):
+        """Create a few Rez packages with issues."""
+        self._root = tempfile.mkdtemp(suffix="_rez_lint_jobs")
+        self.addCleanup(shutil.rmtree, self._root)
+
+        for index in range(3):
+            name = "package_{index}".format(index=index)
+            os.makedirs(os.path.join(self._root, name))
+
+            with open(os.path.join(self._root, name, "package.py"), "w") as handler:
+                handler.write(
+                    textwrap.dedent(
+                        """\
+                        name = "{name}"
+                        version = "1.0"
+                        requires = ["foo", "bar"]
+                        """
+                    ).format(name=name)
+                )
+
+    def test_parallel(self):
+        """Find the same issues with 1 process or many."""
+        disable = {"url-unreachable"}
+        serial = cli.lint(self._root, recursive=True, disable=disable)
+        parallel = cli.lint(self._root, recursive=True, disable=disable, jobs=2)
+
+        self.assertNotEqual([], serial)
+        self.assertEqual(set(serial), set(parallel))
+
+    def test_invalid(self):
+        """Don't allow less than one process."""
+        with self.assertRaises(ValueError):
+            cli.lint(self._root, recursive=True, jobs=0)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_lint.core.dependency_worker` re-uses its processes."""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from rez_lint.core import dependency_worker
+from six.moves import mock
+
+
+class GetDependencyPaths(unittest.TestCase):
+    """Find Python dependencies with a shared, long-running process."""
+
+    def setUp(self):
+        """Make a folder with a Python file which imports something."""
+        self._directory = tempfile.mkdtemp(suffix="_dependency_worker")
+        self._started = 0
+
+        with open(os.path.join(self._directory, "some_module.py"), "w") as handler:
+            handler.write("import json\n")
+
+    def tearDown(self):
+        """Stop every worker and delete the temporary Python file."""
+        dependency_worker.close_all()
+        shutil.rmtree(self._directory)
+
+    def _call(self, command, **kwargs):
+        """Start `command` with this interpreter and its import paths."""
+        self._started += 1
+        environment = os.environ.copy()
+        environment["PYTHONPATH"] = os.pathsep.join(sys.path)
+        command = command.replace("python", '"{}"'.format(sys.executable), 1)
+
+        return subprocess.Popen(command, shell=True, env=environment, **kwargs)
+
+    def _get_paths(self, key, directories=None):
+        """set[str]: Find the real paths of every dependency of the temporary folder."""
+        paths = dependency_worker.get_dependency_paths(
+            directories or [self._directory], self._call, key
+        )
+
+        return {os.path.realpath(path) for path in paths}
+
+    def test_empty(self):
+        """Don't start a process if there's nothing to search."""
+        self.assertEqual(set(), dependency_worker.get_dependency_paths([], None, "a"))
+
+    def test_error(self):
+        """Raise an error instead of returning an incomplete result."""
+        with self.assertRaises(dependency_worker.WorkerError):
+            self._get_paths("a", [os.path.join(self._directory, "does_not_exist")])
+
+    def test_evict(self):
+        """Stop the least recently used process once there are too many."""
+        with mock.patch.object(dependency_worker, "_MAXIMUM_WORKERS", 1):
+            self._get_paths("a")
+            self._get_paths("b")
+            self._get_paths("a")
+
+        self.assertEqual(3, self._started)
+
+    def test_python_paths(self):
+        """Share one process between Rez packages which import their own modules."""
+        expected = {os.path.realpath(json.__file__)}
+
+        for name in ["package_a", "package_b"]:
+            directory = os.path.join(self._directory, name)
+            os.makedirs(directory)
+
+            with open(os.path.join(directory, "user.py"), "w") as handler:
+                handler.write("import helper\n")
+
+            helper = os.path.join(directory, "helper.py")
+
+            with open(helper, "w") as handler:
+                handler.write("import json\n")
+
+            paths = dependency_worker.get_dependency_paths(
+                [directory], self._call, "a", python_paths=[directory]
+            )
+
+            # `helper` is found in each package, not just the first
+            self.assertEqual(
+                expected | {os.path.realpath(helper)},
+                {os.path.realpath(path) for path in paths},
+            )
+
+        self.assertEqual(1, self._started)
+
+    def test_reuse(self):
+        """Start only one process per environment."""
+        expected = {os.path.realpath(json.__file__)}
+
+        self.assertEqual(expected, self._get_paths("a"))
+        self.assertEqual(expected, self._get_paths("a"))
+        self.assertEqual(1, self._started)
+
+        self._get_paths("b")
+
+        self.assertEqual(2, self._started)
+
+
+class GetEnvironmentKey(unittest.TestCase):
+    """Describe resolved environments so that workers can be shared."""
+
+    def test_ignore(self):
+        """Leave the linted Rez package out so that other Rez packages match."""
+        contexts = []
+
+        for name in ["package_a", "package_b"]:
+            linted = mock.Mock(
+                uri="/packages/{name}/1.0.0/package.py".format(name=name)
+            )
+            linted.name = name
+            python = mock.Mock(uri="/packages/python/3.7.0/package.py")
+            python.name = "python"
+            contexts.append(mock.Mock(resolved_packages=[linted, python]))
+
+        self.assertNotEqual(
+            dependency_worker.get_environment_key(contexts[0]),
+            dependency_worker.get_environment_key(contexts[1]),
+        )
+        self.assertEqual(
+            dependency_worker.get_environment_key(contexts[0], ignore=["package_a"]),
+            dependency_worker.get_environment_key(contexts[1], ignore=["package_b"]),
+        )
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_lint.core.lint_cache` re-uses the results of unchanged packages."""
+
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from rez.config import config
+from rez_lint import cli
+from rez_lint.core import lint_cache
+from six.moves import mock
+
+from . import packaging
+
+_PARSER = "rez_lint.plugins.contexts.parsing.ParsePackageDefinition.run"
+
+
+class Cache(unittest.TestCase):
+    """Save and re-use results across ``rez_lint`` runs."""
+
+    def setUp(self):
+        """Create a Rez package with issues and an empty cache."""
+        self._directory = packaging.make_fake_source_package(
+            "some_package",
+            textwrap.dedent(
+                """\
+                name = "some_package"
+                version = "1.0"
+                """
+            ),
+        )
+        self.addCleanup(shutil.rmtree, os.path.dirname(self._directory))
+        self._cache = tempfile.mkdtemp(suffix="_rez_lint_cache")
+        self.addCleanup(shutil.rmtree, self._cache)
+
+    def _lint(self):
+        return cli.lint(self._directory, cache_directory=self._cache)
+
+    def test_unchanged(self):
+        """Don't run any context if the Rez package hasn't changed."""
+        with mock.patch(_PARSER) as parse:
+            expected = self._lint()
+            found = self._lint()
+
+        self.assertNotEqual([], expected)
+        self.assertEqual(set(expected), set(found))
+        self.assertEqual(1, parse.call_count)
+
+    def test_definition_changed(self):
+        """Check the Rez package again once its definition changes."""
+        with mock.patch(_PARSER) as parse:
+            self._lint()
+
+            with open(os.path.join(self._directory, "package.py"), "a") as handler:
+                handler.write('\ndescription = "Something"\n')
+
+            self._lint()
+
+        self.assertEqual(2, parse.call_count)
+
+    def test_python_changed(self):
+        """Check the Rez package again once any of its Python files change."""
+        path = os.path.join(self._directory, "python", "module.py")
+        os.makedirs(os.path.dirname(path))
+
+        with mock.patch(_PARSER) as parse:
+            with open(path, "w") as handler:
+                handler.write("import os\n")
+
+            self._lint()
+
+            with open(path, "w") as handler:
+                handler.write("import sys\n")
+
+            self._lint()
+
+        self.assertEqual(2, parse.call_count)
+
+    def test_disable_changed(self):
+        """Check the Rez package again if the user disables a checker."""
+        with mock.patch(_PARSER) as parse:
+            self._lint()
+            found = cli.lint(
+                self._directory,
+                cache_directory=self._cache,
+                disable={"semantic-versioning"},
+            )
+
+        self.assertEqual(2, parse.call_count)
+        self.assertEqual(
+            [],
+            [
+                description
+                for description in found
+                if description.get_code().long_name == "semantic-versioning"
+            ],
+        )
+
+    def test_version_changed(self):
+        """Check the Rez package again after ``rez_lint`` is upgraded."""
+        with mock.patch(_PARSER) as parse:
+            with mock.patch.dict(os.environ, {"REZ_REZ_LINT_VERSION": "1.0.0"}):
+                self._lint()
+
+            with mock.patch.dict(os.environ, {"REZ_REZ_LINT_VERSION": "1.1.0"}):
+                self._lint()
+
+        self.assertEqual(2, parse.call_count)
+
+    def test_plugin_changed(self):
+        """Check the Rez package again after a plugin's source file is edited."""
+        with mock.patch(_PARSER) as parse:
+            self._lint()
+
+            with mock.patch(
+                "rez_lint.core.lint_cache._get_plugin_source", return_value="edited"
+            ):
+                self._lint()
+
+        self.assertEqual(2, parse.call_count)
+
+    def test_build_ignored(self):
+        """Don't check the Rez package again if only its build folder changed."""
+        path = os.path.join(self._directory, config.build_directory, "output.txt")
+        os.makedirs(os.path.dirname(path))
+
+        with mock.patch(_PARSER) as parse:
+            self._lint()
+
+            with open(path, "w") as handler:
+                handler.write("Some build output")
+
+            self._lint()
+
+        self.assertEqual(1, parse.call_count)
+
+    @mock.patch("rez_lint.plugins.checkers.dangers.UrlNotReachable.run")
+    def test_not_cacheable(self, run):
+        """Always run checkers whose results can change without the package changing."""
+        run.return_value = []
+
+        self._lint()
+        self._lint()
+
+        self.assertEqual(2, run.call_count)
+
+    def test_clear(self):
+        """Check the Rez package again once the cache is cleared."""
+        with mock.patch(_PARSER) as parse:
+            self._lint()
+            lint_cache.clear(self._cache)
+            self._lint()
+
+        self.assertEqual(2, parse.call_count)
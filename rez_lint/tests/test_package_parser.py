@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_lint.core.package_parser` reads each package definition once."""
+
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from parso.python import tree
+from rez_lint.core import package_parser
+from six.moves import mock
+
+
+class PackageSource(unittest.TestCase):
+    """Find rows, lines, and parso nodes from one indexed file."""
+
+    def setUp(self):
+        """Write a package.py file which defines attributes in different ways."""
+        self._directory = tempfile.mkdtemp(suffix="_package_parser")
+        self._path = os.path.join(self._directory, "package.py")
+        _write(
+            self._path,
+            textwrap.dedent(
+                """\
+                name = "some_package"
+
+                version = "1.0.0"
+
+                requires = ["foo-1"]
+
+                def requires():
+                    return ["bar-1"]
+
+                help = [["README", "README.md"]]"""
+            ),
+        )
+
+    def tearDown(self):
+        """Delete the temporary package.py file."""
+        package_parser.clear_source(self._path)
+        shutil.rmtree(self._directory)
+
+    def test_definitions(self):
+        """Find the last, top-level definition of each attribute."""
+        source = package_parser.get_source(self._path)
+
+        self.assertEqual((3, 0), source.get_definition_position("version"))
+        self.assertEqual((7, 4), source.get_definition_position("requires"))
+        self.assertEqual((0, 0), source.get_definition_position("variants"))
+        self.assertEqual(3, package_parser.get_definition_row(self._path, "version"))
+
+    def test_lines(self):
+        """Get each line, including its newline character, if any."""
+        self.assertEqual(
+            'version = "1.0.0"\n', package_parser.get_line_at_row(self._path, 3)
+        )
+        self.assertEqual(
+            'help = [["README", "README.md"]]',
+            package_parser.get_line_at_row(self._path, 10),
+        )
+        self.assertEqual("", package_parser.get_line_at_row(self._path, 11))
+
+    def test_node(self):
+        """Find parso nodes without searching the whole graph."""
+        source = package_parser.get_source(self._path)
+
+        with mock.patch(
+            "rez_lint.core.parso_comment_helper.find_named_node"
+        ) as find_named_node:
+            node = source.get_node("version")
+
+        self.assertFalse(find_named_node.called)
+        self.assertIsInstance(node, tree.Name)
+        self.assertEqual((3, 0), node.start_pos)
+        self.assertIsInstance(source.get_node("requires").parent, tree.Function)
+        self.assertIsNone(source.get_node("variants"))
+
+    def test_read_once(self):
+        """Read the file again only after it changes."""
+        source = package_parser.get_source(self._path)
+
+        self.assertIs(source, package_parser.get_source(self._path))
+        self.assertIs(source.get_graph(), source.get_graph())
+
+        _write(self._path, 'name = "another_package"\nversion = "2.0.0"\n')
+        os.utime(self._path, (0, 0))
+        changed = package_parser.get_source(self._path)
+
+        self.assertIsNot(source, changed)
+        self.assertEqual((2, 0), changed.get_definition_position("version"))
+
+    def test_yaml(self):
+        """Index other package definition files but don't parse them."""
+        path = os.path.join(self._directory, "package.yaml")
+        _write(path, "name: some_package\nversion: 1.0.0\n")
+        self.addCleanup(package_parser.clear_source, path)
+        source = package_parser.get_source(path)
+
+        self.assertEqual((2, 0), source.get_definition_position("version"))
+        self.assertIsNone(source.get_graph())
+
+
+def _write(path, text):
+    """Replace the contents of `path` with `text`."""
+    with open(path, "w") as handler:
+        handler.write(text)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_lint.core.profiling` times every plugin, per Rez package."""
+
+import json
+import os
+import shutil
+import tempfile
+import textwrap
+import unittest
+
+from rez_lint import cli
+from rez_lint.core import profiling
+from six.moves import mock
+
+from . import packaging
+
+_CHECKER = "rez_lint.plugins.checkers.conventions.SemanticVersioning"
+
+
+class Profile(unittest.TestCase):
+    """Record the time and cache use of each context and checker."""
+
+    def setUp(self):
+        """Create a Rez package with an issue."""
+        self._directory = packaging.make_fake_source_package(
+            "some_package",
+            textwrap.dedent(
+                """\
+                name = "some_package"
+                version = "1.0"
+                """
+            ),
+        )
+        self.addCleanup(shutil.rmtree, os.path.dirname(self._directory))
+
+    def test_inactive(self):
+        """Record nothing unless a profiler is active."""
+        profiler = profiling.Profiler()
+        cli.lint(self._directory)
+
+        self.assertEqual([], profiler.get_totals())
+
+    def test_lint(self):
+        """Record every plugin which ran, for each Rez package."""
+        with profiling.activate(profiling.Profiler()) as profiler:
+            cli.lint(self._directory)
+
+        totals = {(total.name, total.kind): total for total in profiler.get_totals()}
+        checker = totals[(_CHECKER, "checker")]
+
+        self.assertEqual(1, checker.calls)
+        self.assertEqual(
+            [os.path.join(self._directory, "package.py")], list(checker.packages)
+        )
+        self.assertIn(
+            ("rez_lint.plugins.contexts.parsing.ParsePackageDefinition", "context"),
+            totals,
+        )
+        self.assertIsNone(profiling.get_active())
+
+    def test_prepare(self):
+        """Record each checker's ``prepare`` once per run, not per Rez package."""
+        with profiling.activate(profiling.Profiler()) as profiler:
+            cli.lint(self._directory)
+
+        totals = {(total.name, total.kind): total for total in profiler.get_totals()}
+        prepare = totals[
+            ("rez_lint.plugins.checkers.dangers.UrlNotReachable", "prepare")
+        ]
+
+        self.assertEqual(1, prepare.calls)
+        self.assertEqual(["<run>"], list(prepare.packages))
+
+    def test_nested(self):
+        """Don't count a plugin's time again in the plugin which it ran inside of."""
+        outer = mock.Mock()
+        inner = mock.Mock()
+        package = mock.Mock(filepath="/some/package.py")
+        clock = iter([0.0, 1.0, 3.0, 10.0])
+
+        with profiling.activate(profiling.Profiler()) as profiler:
+            with mock.patch("time.time", side_effect=lambda: next(clock)):
+                with profiling.measure(outer, "checker", package):
+                    with profiling.measure(inner, "context", package):
+                        pass
+
+        seconds = {total.kind: total.seconds for total in profiler.get_totals()}
+
+        self.assertEqual({"checker": 8.0, "context": 2.0}, seconds)
+
+    def test_write(self):
+        """Save every total as JSON and combine the records of other processes."""
+        profiler = profiling.Profiler()
+        profiler.add("foo.Checker", "checker", "/a/package.py", 0.5)
+        profiler.add_lint_cache(False)
+
+        combined = profiling.Profiler()
+        combined.add("foo.Checker", "checker", "/b/package.py", 0.25, cache_hits=2)
+        combined.merge(profiler.to_dict())
+
+        directory = tempfile.mkdtemp(suffix="_profiling")
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "profile.json")
+        combined.write(path)
+
+        with open(path, "r") as handler:
+            data = json.load(handler)
+
+        self.assertEqual({"hits": 0, "misses": 1}, data["lint_cache"])
+        self.assertEqual(1, len(data["plugins"]))
+        total = data["plugins"][0]
+        self.assertEqual(2, total["calls"])
+        self.assertEqual(0.75, total["seconds"])
+        self.assertEqual(2, total["cache_hits"])
+        self.assertIn("foo.Checker", profiling.get_table(combined.get_totals()))
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_lint.core.url_cache` checks URLs quickly and only once."""
+
+import collections
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from rez_lint.core import url_cache
+from six.moves import BaseHTTPServer, mock, socketserver
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """A local, stand-in website which can respond to many requests at once."""
+
+    daemon_threads = True
+
+    def __init__(self, delay=0.0):
+        """Keep track of every request which this server gets.
+
+        Args:
+            delay (float, optional): The seconds to wait before each response.
+
+        """
+        BaseHTTPServer.HTTPServer.__init__(self, ("127.0.0.1", 0), _Handler)
+
+        self.delay = delay
+        self.hits = collections.Counter()
+        self.active = 0
+        self.most_active = 0
+        self.lock = threading.Lock()
+
+    def get_url(self, path):
+        """str: Get the full URL to some `path` on this server."""
+        return "http://127.0.0.1:{port}/{path}".format(
+            port=self.server_address[1], path=path
+        )
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Respond with 200 for any "/ok" page and 404 for anything else."""
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Respond to a URL request."""
+        server = self.server
+
+        with server.lock:
+            server.hits[self.path] += 1
+            server.active += 1
+            server.most_active = max(server.most_active, server.active)
+
+        time.sleep(server.delay)
+
+        with server.lock:
+            server.active -= 1
+
+        self.send_response(200 if self.path.startswith("/ok") else 404)
+        self.end_headers()
+
+    def log_message(self, *_):  # pylint: disable=arguments-differ
+        """Don't print anything while tests run."""
+
+
+class CheckUrls(unittest.TestCase):
+    """Check URLs against a local server."""
+
+    def setUp(self):
+        """Start a local server and forget any URL from a previous test."""
+        url_cache.clear_cache()
+        self._root = tempfile.mkdtemp(suffix="_url_cache_test")
+        self._server = None
+
+    def tearDown(self):
+        """Stop the local server and delete any cache file."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+
+        shutil.rmtree(self._root)
+        url_cache.clear_cache()
+
+    def _start(self, delay=0.0):
+        """:class:`_Server`: Run a local, stand-in website in the background."""
+        self._server = _Server(delay=delay)
+        thread = threading.Thread(target=self._server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        return self._server
+
+    def test_reachable(self):
+        """Find both reachable and un-reachable URLs."""
+        server = self._start()
+        found = server.get_url("ok")
+        missing = server.get_url("missing")
+
+        self.assertEqual(
+            {found: True, missing: False}, url_cache.check_urls([found, missing])
+        )
+
+    def test_deduplicate(self):
+        """Check each URL only once, even if it is requested many times."""
+        server = self._start()
+        url = server.get_url("ok")
+
+        url_cache.check_urls([url, url])
+        url_cache.check_urls([url])
+
+        self.assertEqual(1, server.hits["/ok"])
+
+    def test_host_limit(self):
+        """Never make too many connections to the same host, at once."""
+        server = self._start(delay=0.2)
+        urls = [server.get_url("ok_{index}".format(index=index)) for index in range(6)]
+
+        self.assertTrue(
+            all(url_cache.check_urls(urls, connections_per_host=2).values())
+        )
+        self.assertEqual(2, server.most_active)
+
+    def test_disk_cache(self):
+        """Re-use reachable URLs from an earlier run but re-check bad URLs."""
+        server = self._start()
+        found = server.get_url("ok")
+        missing = server.get_url("missing")
+        path = os.path.join(self._root, "urls.json")
+
+        with mock.patch.dict(os.environ, {url_cache.CACHE_PATH_VARIABLE: path}):
+            url_cache.check_urls([found, missing])
+            url_cache.clear_cache()  # Pretend that this is a new run
+            url_cache.check_urls([found, missing])
+
+        self.assertEqual(1, server.hits["/ok"])
+        self.assertEqual(2, server.hits["/missing"])
+
+        with open(path, "r") as handler:
+            self.assertEqual([found], list(json.load(handler)))
+
+    def test_disk_cache_expired(self):
+        """Re-check a URL once its on-disk result is too old."""
+        server = self._start()
+        url = server.get_url("ok")
+        path = os.path.join(self._root, "urls.json")
+
+        with open(path, "w") as handler:
+            json.dump({url: time.time() - 2 * 60 * 60}, handler)
+
+        environment = {
+            url_cache.CACHE_HOURS_VARIABLE: "1",
+            url_cache.CACHE_PATH_VARIABLE: path,
+        }
+
+        with mock.patch.dict(os.environ, environment):
+            url_cache.check_urls([url])
+
+        self.assertEqual(1, server.hits["/ok"])
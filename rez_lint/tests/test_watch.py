@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :func:`rez_lint.cli.watch` re-checks only what changed."""
+
+import os
+import shutil
+import textwrap
+import unittest
+
+from rez_lint import cli
+from rez_lint.core import lint_constant
+from rez_lint.plugins.contexts import parsing
+from six.moves import mock
+
+from . import packaging
+
+_CONTEXTS = "rez_lint.plugins.contexts."
+
+
+class Watch(unittest.TestCase):
+    """Check a Rez package again, whenever its files change."""
+
+    def setUp(self):
+        """Create a Rez package with an issue."""
+        self._directory = packaging.make_fake_source_package(
+            "some_package",
+            textwrap.dedent(
+                """\
+                name = "some_package"
+                version = "1.0"
+                """
+            ),
+        )
+        self.addCleanup(shutil.rmtree, os.path.dirname(self._directory))
+
+    def _test_definition(self, polling):
+        """Report the issues of a changed package definition."""
+        watcher = cli.watch(self._directory, polling=polling)
+        self.addCleanup(watcher.close)
+
+        self.assertIn("semantic-versioning", _get_codes(next(watcher)))
+
+        with open(os.path.join(self._directory, "package.py"), "w") as handler:
+            handler.write('name = "some_package"\nversion = "1.0.0"\n')
+
+        self.assertNotIn("semantic-versioning", _get_codes(next(watcher)))
+
+    def test_definition_inotify(self):
+        """Find changes using the operating system, if possible."""
+        self._test_definition(polling=False)
+
+    def test_definition_polling(self):
+        """Find changes by polling."""
+        self._test_definition(polling=True)
+
+    @mock.patch("rez_lint.core.url_cache.clear_cache")
+    def test_url_cache(self, clear_cache):
+        """Check each help URL once, not again after every saved file."""
+        watcher = cli.watch(self._directory, polling=True)
+        self.addCleanup(watcher.close)
+        next(watcher)
+
+        with open(os.path.join(self._directory, "package.py"), "a") as handler:
+            handler.write('\ndescription = "Something"\n')
+
+        next(watcher)
+
+        self.assertEqual(1, clear_cache.call_count)
+
+    @mock.patch(_CONTEXTS + "packaging.HasPythonPackage.run")
+    def test_python(self, has_python_package):
+        """Only run the contexts and checkers which depend on Python files."""
+
+        def _add(_, context):
+            context[lint_constant.HAS_PYTHON_PACKAGE] = False
+
+        has_python_package.side_effect = _add
+
+        with mock.patch(
+            _CONTEXTS + "parsing.ParsePackageDefinition.run",
+            side_effect=parsing.ParsePackageDefinition.run,
+        ) as parse:
+            watcher = cli.watch(self._directory)
+            self.addCleanup(watcher.close)
+            expected = next(watcher)
+
+            path = os.path.join(self._directory, "python", "some_module.py")
+            os.makedirs(os.path.dirname(path))
+
+            with open(path, "w") as handler:
+                handler.write("import os\n")
+
+            found = next(watcher)
+
+        self.assertEqual(expected, found)
+        self.assertEqual(1, parse.call_count)
+        self.assertEqual(2, has_python_package.call_count)
+
+
+def _get_codes(descriptions):
+    """set[str]: Get the long name of each issue in `descriptions`."""
+    return {description.get_code().long_name for description in descriptions}
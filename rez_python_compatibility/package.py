@@ -2,7 +2,7 @@
 
 name = "rez_python_compatibility"
 
-version = "2.9.2"
+version = "2.10.0"
 
 description = "Miscellaneous, core Python 2 + 3 functions."
 
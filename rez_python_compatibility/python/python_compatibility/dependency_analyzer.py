@@ -24,6 +24,8 @@ Note:
 from __future__ import print_function
 
 import argparse
+import contextlib
+import json
 import logging
 import os
 import pkgutil
@@ -32,6 +34,7 @@ import sys
 from . import filer, import_parser, imports, packaging
 
 _LOGGER = logging.getLogger(__name__)
+RESPONSE_PREFIX = "dependency_analyzer_response:"
 
 
 class _FakeModule(object):  # pylint: disable=too-few-public-methods
@@ -216,6 +219,36 @@ def _get_source_paths(namespaces):
     return paths
 
 
+@contextlib.contextmanager
+def _prepend_python_paths(paths):
+    """Import from `paths` first, while in this context.
+
+    Every module which was imported from `paths` is forgotten
+    afterwards, so that the next request can import other modules
+    with the same names.
+
+    Args:
+        paths (list[str]): The absolute folders to add to :obj:`sys.path`.
+
+    Yields:
+        NoneType: Return the state of this context back to the user.
+
+    """
+    sys.path[:0] = paths
+
+    try:
+        yield
+    finally:
+        for path in paths:
+            sys.path.remove(path)
+
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, "__file__", None)
+
+            if path and any(filer.in_directory(path, root) for root in paths):
+                del sys.modules[name]
+
+
 def _parse_arguments(text):
     """Get the user's chosen directories, parse them, and return them.
 
@@ -223,7 +256,9 @@ def _parse_arguments(text):
         text (str): The raw user-provided text that was sent to the CLI.
 
     Returns:
-        set[str]: The absolute paths on-disk to directories that will be queried.
+        tuple[bool, set[str]]:
+            If the user wants to :func:`serve` and the absolute paths
+            on-disk to directories that will be queried.
 
     """
     parser = argparse.ArgumentParser(
@@ -232,15 +267,25 @@ def _parse_arguments(text):
 
     parser.add_argument(
         "directories",
-        nargs="+",
+        nargs="*",
         default=set(),
         help="The root folders on-disk to some Python packages. Each path will be checked.",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Answer JSON requests from stdin, until it closes. See serve().",
+    )
+
+    arguments = parser.parse_args(text)
+
+    if not arguments.serve and not arguments.directories:
+        parser.error("At least one directory or --serve is required.")
 
     directories = set()
     current_directory = os.getcwd()
 
-    for path in set(parser.parse_args(text).directories):
+    for path in set(arguments.directories):
         path_ = path
 
         if not os.path.isabs(path_):
@@ -248,7 +293,7 @@ def _parse_arguments(text):
 
         directories.add(path_)
 
-    return directories
+    return arguments.serve, directories
 
 
 def get_dependency_paths(directories):
@@ -307,7 +352,7 @@ def get_imported_namespaces(directories, convert_relative_imports=True):
     for directory in directories:
         for path in packaging.iter_python_files(directory):
             try:
-                namespaces = import_parser.get_namespaces_from_file(
+                found = import_parser.get_namespaces_from_file(
                     path,
                     absolute=convert_relative_imports,
                 )
@@ -316,7 +361,7 @@ def get_imported_namespaces(directories, convert_relative_imports=True):
 
                 continue
 
-            for namespace in namespaces:
+            for namespace in found:
                 namespace_text = namespace.get_namespace()
 
                 if not convert_relative_imports and namespace_text.startswith("."):
@@ -340,12 +385,71 @@ def main(text):
         NotImplementedError: If the user provides paths to don't point to directories.
 
     """
-    directories = _parse_arguments(text)
+    serve_, directories = _parse_arguments(text)
+
+    if serve_:
+        serve()
+
+        return
 
     for path in sorted(get_dependency_paths(directories)):
         # These don't actually need to be sorted. But it makes debugging easier
         print(path)
 
 
+def serve(stdin=None, stdout=None):
+    """Find Python dependencies for each request that is read, until `stdin` closes.
+
+    Every module that is imported to find a dependency stays imported.
+    So a long-running process answers each request faster than running
+    this module once per request.
+
+    Each request is one line of JSON, such as
+    ``{"directories": ["/some/python/folder"], "python_paths": ["/some/python"]}``.
+    The optional "python_paths" are imported from first, only for that
+    request. So Rez packages which need the same environment, except
+    for their own Python files, can share one process. Each response
+    is one line, :attr:`RESPONSE_PREFIX` followed by JSON, such as
+    ``{"paths": ["/some/module.py"]}`` or ``{"error": "Some message"}``.
+
+    Args:
+        stdin (file, optional):
+            The stream to read requests from. Default: :obj:`sys.stdin`.
+        stdout (file, optional):
+            The stream to write responses to. Default: :obj:`sys.stdout`.
+
+    """
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+
+    for line in iter(stdin.readline, ""):
+        line = line.strip()
+
+        if not line:
+            continue
+
+        # Imported modules may print while they're imported. Keep that
+        # text out of the responses.
+        #
+        original = sys.stdout
+        sys.stdout = sys.stderr
+
+        try:
+            request = json.loads(line)
+
+            with _prepend_python_paths(request.get("python_paths") or []):
+                paths = get_dependency_paths(request["directories"])
+
+            response = {"paths": sorted(paths)}
+        except Exception as error:  # pylint: disable=broad-except
+            _LOGGER.exception('Request "%s" failed.', line)
+            response = {"error": str(error)}
+        finally:
+            sys.stdout = original
+
+        stdout.write(RESPONSE_PREFIX + json.dumps(response) + "\n")
+        stdout.flush()
+
+
 if __name__ == "__main__":
     main(sys.argv[1:])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`python_compatibility.dependency_analyzer` answers requests."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from six.moves import StringIO
+
+from python_compatibility import dependency_analyzer
+
+
+class Serve(unittest.TestCase):
+    """Answer many dependency requests with one process."""
+
+    def setUp(self):
+        """Make a folder with a Python file which imports something."""
+        self._directory = tempfile.mkdtemp(suffix="_dependency_analyzer")
+
+        with open(os.path.join(self._directory, "some_module.py"), "w") as handler:
+            handler.write("import json\n")
+
+    def tearDown(self):
+        """Delete the temporary Python file."""
+        shutil.rmtree(self._directory)
+
+    def test_requests(self):
+        """Write one response per request, including errors."""
+        missing = os.path.join(self._directory, "does_not_exist")
+        stdin = StringIO(
+            "\n".join(
+                [
+                    json.dumps({"directories": [self._directory]}),
+                    "",
+                    json.dumps({"directories": [missing]}),
+                ]
+            )
+        )
+        stdout = StringIO()
+
+        dependency_analyzer.serve(stdin=stdin, stdout=stdout)
+
+        lines = stdout.getvalue().splitlines()
+        responses = [
+            json.loads(line[len(dependency_analyzer.RESPONSE_PREFIX) :])
+            for line in lines
+        ]
+
+        self.assertEqual(2, len(responses))
+        self.assertEqual(
+            [os.path.realpath(json.__file__)],
+            [os.path.realpath(path) for path in responses[0]["paths"]],
+        )
+        self.assertIn(missing, responses[1]["error"])
+
+    def test_python_paths(self):
+        """Import a request's own modules first and forget them afterwards."""
+        helper = os.path.join(self._directory, "some_dependency_analyzer_helper.py")
+
+        with open(helper, "w") as handler:
+            handler.write("import json\n")
+
+        with open(os.path.join(self._directory, "user.py"), "w") as handler:
+            handler.write("import some_dependency_analyzer_helper\n")
+
+        stdin = StringIO(
+            json.dumps(
+                {"directories": [self._directory], "python_paths": [self._directory]}
+            )
+        )
+        stdout = StringIO()
+
+        dependency_analyzer.serve(stdin=stdin, stdout=stdout)
+
+        response = json.loads(
+            stdout.getvalue()[len(dependency_analyzer.RESPONSE_PREFIX) :]
+        )
+
+        self.assertIn(
+            os.path.realpath(helper),
+            [os.path.realpath(path) for path in response["paths"]],
+        )
+        self.assertNotIn(self._directory, sys.path)
+        self.assertNotIn("some_dependency_analyzer_helper", sys.modules)
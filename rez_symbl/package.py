@@ -17,7 +17,7 @@ build_command = "python -m rez_build_helper --items python"
 requires = [
     "python-2",
     "rez-2.40+",
-    "rez_utilities-2+<3",
+    "rez_utilities-3.1+<4",
 ]
 
 tests = {
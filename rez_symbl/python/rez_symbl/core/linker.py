@@ -6,8 +6,8 @@
 import logging
 import os
 
-from rez import exceptions, resolved_context
-from rez_utilities import finder, inspection
+from rez import exceptions
+from rez_utilities import finder, inspection, resolver
 
 from . import pather
 
@@ -61,7 +61,7 @@ def bake_from_request(request, directory, force=False):
 
     """
     try:
-        context = resolved_context.ResolvedContext(request)
+        context = resolver.get_context(request)
     except exceptions.PackageFamilyNotFoundError:
         _LOGGER.exception('Request "%s" was not found.', request)
 
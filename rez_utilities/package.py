@@ -2,7 +2,7 @@
 
 name = "rez_utilities"
 
-version = "3.0.0"
+version = "3.1.0"
 
 description = "Helper functions / objects for working with Rez."
 
@@ -26,10 +26,10 @@ import shutil
 import tempfile
 
 from python_compatibility import filer, imports
-from rez import packages_, resolved_context
+from rez import packages_
 from rez.config import config
 
-from . import finder
+from . import finder, resolver
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -172,7 +172,7 @@ def is_built_package(package):
 
 
 def has_python_package(  # pylint: disable=too-many-branches,too-many-locals,too-complex
-    package, paths=None, allow_build=True, allow_current_context=False
+    package, paths=None, allow_build=True, allow_current_context=False, context=None
 ):
     """Check if the given Rez package has at least one Python package inside of it.
 
@@ -205,6 +205,10 @@ def has_python_package(  # pylint: disable=too-many-branches,too-many-locals,too
             If ``True``, use this current environment's ``$PYTHONPATH``. If
             ``False``, create a brand new Rez context and get its resolved
             ``$PYTHONPATH`` instead.
+        context (:class:`rez.resolved_context.ResolvedContext`, optional):
+            An already-resolved environment which contains `package`.
+            If included, its ``$PYTHONPATH`` is used instead of
+            resolving `package` again. Default is None.
 
     Raises:
         ValueError: If `package` is not a Rez package.
@@ -233,10 +237,11 @@ def has_python_package(  # pylint: disable=too-many-branches,too-many-locals,too
     if allow_current_context and in_valid_context(package):
         environment = os.environ.get("PYTHONPATH", "").split(os.pathsep)
     else:
-        context = resolved_context.ResolvedContext(
-            ["{package.name}=={version}".format(package=package, version=version)],
-            package_paths=[get_packages_path_from_package(package)] + paths,
-        )
+        if not context:
+            context = resolver.get_context(
+                ["{package.name}=={version}".format(package=package, version=version)],
+                package_paths=[get_packages_path_from_package(package)] + paths,
+            )
 
         environment = context.get_environ().get("PYTHONPATH", "").split(os.pathsep)
 
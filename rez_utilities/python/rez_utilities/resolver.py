@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Resolve Rez requests once and re-use the result.
+
+Resolving a Rez context is one of the slowest things that tools like
+``rez_lint`` do and the same request is frequently resolved more than
+once per run. :func:`get_context` remembers every resolved context, by
+its request and package paths, for the rest of the process.
+
+If the ``REZ_UTILITIES_RESOLVE_CACHE_DIRECTORY`` environment variable
+is set, resolved contexts are also saved there as .rxt files, so that
+later processes can load them instead of resolving again. A saved
+context is only re-used if none of its package paths changed since it
+was saved. e.g. No Rez package was added, removed, or edited.
+
+Important:
+    Every caller of :func:`get_context` shares the same contexts. Don't
+    modify them.
+
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+
+from rez import package_repository, resolved_context
+from rez.config import config
+
+from . import rez_configuration
+
+_CACHE_LOCK = threading.Lock()
+_CONTEXTS = dict()  # (request, package paths) -> resolved context
+_DIRECTORY_VARIABLE = "REZ_UTILITIES_RESOLVE_CACHE_DIRECTORY"
+_FORMAT_VERSION = 1
+_LOGGER = logging.getLogger(__name__)
+_STATISTICS = {"hits": 0, "loads": 0, "misses": 0}
+
+
+def _get_fingerprint(paths):
+    """Describe the current state of every Rez package in some package paths.
+
+    If a Rez package or version is added, removed, or its package
+    definition file is edited, the description changes.
+
+    Args:
+        paths (iter[str]): Each Rez package path. e.g. "~/packages".
+
+    Returns:
+        list[list]: Every found path and its modification time.
+
+    """
+
+    def _get_time(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    output = []
+
+    for root in paths:
+        output.append([root, _get_time(root)])
+
+        if not os.path.isdir(root):
+            continue
+
+        for family in sorted(os.listdir(root)):
+            family_directory = os.path.join(root, family)
+
+            if not os.path.isdir(family_directory):
+                continue
+
+            output.append([family_directory, _get_time(family_directory)])
+
+            for name in sorted(os.listdir(family_directory)):
+                path = os.path.join(family_directory, name)
+                output.append([path, _get_time(path)])
+
+                if not os.path.isdir(path):
+                    continue
+
+                for definition in sorted(rez_configuration.REZ_PACKAGE_NAMES):
+                    definition = os.path.join(path, definition)
+                    time_ = _get_time(definition)
+
+                    if time_ is not None:
+                        output.append([definition, time_])
+
+    return output
+
+
+def _get_key(request, package_paths):
+    """Get a description of a Rez request which can be used as a dict key.
+
+    Args:
+        request (iter[str]): The Rez packages to resolve. e.g. ["rez_lint-2"].
+        package_paths (iter[str] or NoneType):
+            The paths to search for Rez packages. If None, the
+            configured package paths are used.
+
+    Returns:
+        tuple[tuple[str], tuple[str]]: The request and package paths.
+
+    """
+    if package_paths is None:
+        package_paths = config.packages_path  # pylint: disable=no-member
+
+    return (
+        tuple(str(item) for item in request),
+        tuple(os.path.normpath(path) for path in package_paths),
+    )
+
+
+def _get_paths(directory, key):
+    """tuple[str, str]: Get the saved context and fingerprint files of `key`."""
+    digest = hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
+    base = os.path.join(directory, digest)
+
+    return base + ".rxt", base + ".json"
+
+
+def _load(directory, key):
+    """Read a resolved context which was saved by an earlier process.
+
+    Args:
+        directory (str): The folder where contexts are saved.
+        key (tuple[tuple[str], tuple[str]]): The request and package paths.
+
+    Returns:
+        :class:`rez.resolved_context.ResolvedContext` or NoneType:
+            The saved context, if it exists and is still up to date.
+
+    """
+    context_path, fingerprint_path = _get_paths(directory, key)
+
+    try:
+        with open(fingerprint_path, "r") as handler:
+            data = json.load(handler)
+    except (IOError, OSError, ValueError):
+        return None
+
+    if data.get("version") != _FORMAT_VERSION:
+        return None
+
+    if data.get("fingerprint") != _get_fingerprint(key[1]):
+        _LOGGER.debug('Saved context "%s" is out of date.', context_path)
+        # Rez remembers the packages that it already found, too
+        package_repository.package_repository_manager.clear_caches()
+
+        return None
+
+    try:
+        return resolved_context.ResolvedContext.load(context_path)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.warning('Saved context "%s" could not be loaded.', context_path)
+
+        return None
+
+
+def _save(directory, key, fingerprint, context):
+    """Write a resolved context so that later processes can load it.
+
+    Args:
+        directory (str): The folder where contexts are saved.
+        key (tuple[tuple[str], tuple[str]]): The request and package paths.
+        fingerprint (list[list]): The state of the package paths before resolving.
+        context (:class:`rez.resolved_context.ResolvedContext`): The context to save.
+
+    """
+    if not os.path.isdir(directory):
+        try:
+            os.makedirs(directory)
+        except OSError:
+            # Another process may have made it at the same time
+            if not os.path.isdir(directory):
+                raise
+
+    context_path, fingerprint_path = _get_paths(directory, key)
+
+    # Write to temporary files first so that other processes never read a partial file
+    handle, temporary_context = tempfile.mkstemp(suffix=".rxt", dir=directory)
+    os.close(handle)
+    context.save(temporary_context)
+    os.rename(temporary_context, context_path)
+
+    handle, temporary_fingerprint = tempfile.mkstemp(suffix=".json", dir=directory)
+
+    with os.fdopen(handle, "w") as handler:
+        json.dump({"fingerprint": fingerprint, "version": _FORMAT_VERSION}, handler)
+
+    os.rename(temporary_fingerprint, fingerprint_path)
+
+
+def clear_cache():
+    """Forget every context which :func:`get_context` has resolved in this process.
+
+    Contexts which were saved to disk are not deleted.
+
+    """
+    with _CACHE_LOCK:
+        _CONTEXTS.clear()
+
+        for name in _STATISTICS:
+            _STATISTICS[name] = 0
+
+
+def get_context(request, package_paths=None):
+    """Resolve a Rez request, re-using the result of an earlier, identical resolve.
+
+    Args:
+        request (iter[str]):
+            The Rez packages to resolve. e.g. ["rez_lint-2", "python-3"].
+        package_paths (iter[str], optional):
+            The paths to search for Rez packages. If None, the
+            configured package paths are used.
+
+    Raises:
+        :class:`rez.exceptions.RezError`:
+            If the request contains an unknown Rez package. Errors
+            are never cached.
+
+    Returns:
+        :class:`rez.resolved_context.ResolvedContext`:
+            The resolved context. It may not be successful. Check its
+            ``success`` attribute.
+
+    """
+    key = _get_key(request, package_paths)
+
+    with _CACHE_LOCK:
+        context = _CONTEXTS.get(key)
+
+        if context is not None:
+            _STATISTICS["hits"] += 1
+
+            return context
+
+    directory = os.getenv(_DIRECTORY_VARIABLE, "")
+    context = None
+
+    if directory:
+        context = _load(directory, key)
+
+    if context is not None:
+        statistic = "loads"
+    else:
+        statistic = "misses"
+        fingerprint = _get_fingerprint(key[1]) if directory else None
+        context = resolved_context.ResolvedContext(
+            list(key[0]), package_paths=list(key[1])
+        )
+
+        if directory and context.success:
+            try:
+                _save(directory, key, fingerprint, context)
+            except (IOError, OSError):
+                _LOGGER.warning('Context could not be saved to "%s".', directory)
+
+    with _CACHE_LOCK:
+        _STATISTICS[statistic] += 1
+        # If another thread resolved the same request, keep the first one
+        return _CONTEXTS.setdefault(key, context)
+
+
+def get_statistics():
+    """Get details about how well resolves are being cached.
+
+    Returns:
+        dict[str, int]:
+            "hits" - The number of resolves that re-used a context from this process.
+            "loads" - The number of resolves that were loaded from disk.
+            "misses" - The number of actual resolves.
+
+    """
+    with _CACHE_LOCK:
+        return dict(_STATISTICS)
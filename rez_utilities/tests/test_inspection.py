@@ -19,7 +19,8 @@ from rez import resolved_context
 from rez.config import config
 from rezplugins.build_process import local
 
-from rez_utilities import creator, finder, inspection
+from rez_utilities import creator, finder, inspection, resolver
+from six.moves import mock
 
 try:
     from rez import packages_  # pylint: disable=ungrouped-imports
@@ -353,6 +354,18 @@ class HasPythonPackage(common.Common):
             inspection.in_valid_context.was_run,  # pylint: disable=no-member
         )
 
+    def test_context(self):
+        """Re-use an already-resolved context instead of resolving again."""
+        package = finder.get_nearest_rez_package(_CURRENT_DIRECTORY)
+        root = finder.get_package_root(package)
+        context = mock.Mock()
+        context.get_environ.return_value = {"PYTHONPATH": os.path.join(root, "python")}
+
+        with mock.patch.object(resolver, "get_context") as get_context:
+            self.assertTrue(inspection.has_python_package(package, context=context))
+
+        self.assertFalse(get_context.called)
+
 
 class GetPackagePythonFiles(common.Common):
     """Check that the :func:`rez_utilities.inspection.get_package_python_paths` works."""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Make sure :mod:`rez_utilities.resolver` resolves each request only once."""
+
+import os
+import tempfile
+import textwrap
+
+from python_compatibility.testing import common
+from six.moves import mock
+
+from rez_utilities import resolver
+
+
+class GetContext(common.Common):
+    """Re-use resolved contexts, in memory and from disk."""
+
+    def setUp(self):
+        """Make a folder of Rez packages to resolve."""
+        super(GetContext, self).setUp()
+
+        resolver.clear_cache()
+        self._packages = tempfile.mkdtemp(suffix="_resolver_packages")
+        self.delete_item_later(self._packages)
+        _make_package(self._packages, "some_package", "1.0.0")
+
+    def tearDown(self):
+        """Forget every resolved context."""
+        super(GetContext, self).tearDown()
+
+        resolver.clear_cache()
+
+    def _get_context(self):
+        """:class:`rez.resolved_context.ResolvedContext`: Resolve "some_package"."""
+        return resolver.get_context(["some_package"], package_paths=[self._packages])
+
+    def test_memory(self):
+        """Resolve the same request only once per process."""
+        context = self._get_context()
+
+        self.assertTrue(context.success)
+        self.assertIs(context, self._get_context())
+        self.assertEqual(
+            {"hits": 1, "loads": 0, "misses": 1}, resolver.get_statistics()
+        )
+
+    def test_disk(self):
+        """Load a context that an earlier process saved."""
+        directory = tempfile.mkdtemp(suffix="_resolver_cache")
+        self.delete_item_later(directory)
+
+        with mock.patch.dict(
+            os.environ, {"REZ_UTILITIES_RESOLVE_CACHE_DIRECTORY": directory}
+        ):
+            self._get_context()
+            resolver.clear_cache()
+            context = self._get_context()
+
+        self.assertEqual(
+            {"hits": 0, "loads": 1, "misses": 0}, resolver.get_statistics()
+        )
+        self.assertEqual(
+            ["some_package-1.0.0"],
+            [package.qualified_package_name for package in context.resolved_packages],
+        )
+
+    def test_invalidated(self):
+        """Resolve again if a saved context's Rez packages changed."""
+        directory = tempfile.mkdtemp(suffix="_resolver_cache")
+        self.delete_item_later(directory)
+
+        with mock.patch.dict(
+            os.environ, {"REZ_UTILITIES_RESOLVE_CACHE_DIRECTORY": directory}
+        ):
+            self._get_context()
+            resolver.clear_cache()
+            _make_package(self._packages, "some_package", "1.1.0")
+            context = self._get_context()
+
+        self.assertEqual(
+            {"hits": 0, "loads": 0, "misses": 1}, resolver.get_statistics()
+        )
+        self.assertEqual(
+            ["some_package-1.1.0"],
+            [package.qualified_package_name for package in context.resolved_packages],
+        )
+
+
+def _make_package(root, name, version):
+    """Write a released Rez package, which has no requirements.
+
+    Args:
+        root (str): The Rez package path where the package is written to.
+        name (str): The family name of the Rez package.
+        version (str): The version of the Rez package.
+
+    """
+    directory = os.path.join(root, name, version)
+    os.makedirs(directory)
+
+    with open(os.path.join(directory, "package.py"), "w") as handler:
+        handler.write(
+            textwrap.dedent(
+                """\
+                name = "{name}"
+                version = "{version}"
+                """
+            ).format(name=name, version=version)
+        )